@@ -4,35 +4,149 @@ Claude Code Remote Approval Hook
 
 This hook intercepts tool use requests from Claude Code and sends them
 to the Telegram bot for remote approval.
+
+Set CC_APPROVAL_DAEMON=1 to have calls that need approval answered by a
+long-running copy of this hook (started on demand with --daemon).
 """
 
+import functools
+import hashlib
 import json
+import operator
+import os
+import random
+import re
+import selectors
+import socket
+import stat
+import struct
 import sys
+import tempfile
 import time
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
+import logging.handlers
 from pathlib import Path
 
+try:
+    import orjson
+    
+    def _loads(data):
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # Configure logging
 log_file = Path(__file__).parent / "remote_approval.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, mode='a'),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
-logger = logging.getLogger(__name__)
+
+
+def _get_logger() -> logging.Logger:
+    """
+    Set up the hook logger.
+    
+    Only warnings and errors are logged unless CC_APPROVAL_DEBUG is set. The
+    log file is opened on the first record, so auto-approved calls that log
+    nothing never touch disk; stderr is only used when it is a terminal.
+    """
+    hook_logger = logging.getLogger(__name__)
+    hook_logger.setLevel(logging.INFO if os.environ.get("CC_APPROVAL_DEBUG") else logging.WARNING)
+    
+    formatter = logging.Formatter('%(created).3f - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=1_000_000, backupCount=3, delay=True
+    )
+    file_handler.setFormatter(formatter)
+    hook_logger.addHandler(file_handler)
+    
+    if sys.stderr.isatty():
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(formatter)
+        hook_logger.addHandler(stream_handler)
+    
+    return hook_logger
+
+
+logger = _get_logger()
+
+
+@functools.lru_cache(maxsize=None)
+def _socket_dir() -> Optional[str]:
+    """
+    Return a directory only this user can access, for the Unix sockets.
+    
+    $XDG_RUNTIME_DIR is private already; otherwise a per-user directory with
+    mode 0700 is used in the temp dir. A directory there that another user
+    created or opened up is refused, since another user's server could then
+    answer approval requests. Returns None if no such directory is available.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return runtime_dir
+    if not hasattr(os, "getuid"):
+        return None
+    
+    path = os.path.join(tempfile.gettempdir(), f"cc-approval-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.warning("Cannot create socket directory %s: %s", path, e)
+        return None
+    
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        logger.warning("Not using socket directory %s: not private to this user", path)
+        return None
+    return path
+
+
+def _socket_path(env_var: str, name: str) -> Optional[str]:
+    """Return the socket path set in env_var, or name in the private socket directory."""
+    path = os.environ.get(env_var)
+    if path:
+        return path
+    socket_dir = _socket_dir()
+    return os.path.join(socket_dir, name) if socket_dir else None
+
 
 # Configuration
 IPC_SERVER = "http://localhost:8765"
-TIMEOUT = 55  # seconds (hook timeout is 60s)
-POLL_INTERVAL = 1  # seconds
+HOOK_TIME_LIMIT = 60  # seconds Claude Code allows the hook to run
+TIMEOUT = 55  # seconds to wait for a decision, within HOOK_TIME_LIMIT
+BACKOFF_BASE = 0.25  # seconds, first retry delay ceiling after a failure
+BACKOFF_CAP = 5.0  # seconds, largest retry delay ceiling
+MAX_REQUEST_ATTEMPTS = 3  # tries for submitting the approval request
+LONG_POLL_WAIT = 30  # seconds the server may hold a status request open
+PREVIEW_LENGTH = 512  # characters of each tool_input string sent for display
+IPC_SOCKET = _socket_path("APPROVAL_IPC_SOCKET", "cc-approval.sock")  # None disables it
+
+# Optional warm daemon that answers hook calls so each tool call does not
+# pay for a cold interpreter with fresh sessions (POSIX only)
+DAEMON_SOCKET = _socket_path("CC_APPROVAL_DAEMON_SOCKET", "cc-approval-hook.sock")
+DAEMON_ENABLED = bool(os.environ.get("CC_APPROVAL_DAEMON")) and DAEMON_SOCKET is not None
+DAEMON_IDLE_TIMEOUT = 600  # seconds without calls before the daemon exits
+
+# asyncio is imported by the daemon only
+asyncio = None
+
+# requests is imported on first use: most tool calls are auto-approved or
+# answered over the Unix socket and never need it
+requests = None
+
+# Shared session so the request POST and the status GETs reuse one
+# keep-alive connection to the IPC server
+_SESSION = None
 
 # Tools that require approval
-SENSITIVE_TOOLS = [
+SENSITIVE_TOOLS = frozenset({
     "Bash",           # Shell commands
     "Write",          # File creation
     "Edit",           # File editing
@@ -40,21 +154,64 @@ SENSITIVE_TOOLS = [
     "Task",           # Subagent tasks
     "WebFetch",       # Web access
     "WebSearch",      # Web searches
-]
+})
 
 # Tools that should be auto-approved (safe operations)
-SAFE_TOOLS = [
+SAFE_TOOLS = frozenset({
     "Read",           # Reading files
     "Glob",           # File pattern matching
     "Grep",           # Searching
     "LS",             # Listing directories
     "TodoWrite",      # Todo management
-]
+})
+
+# Bash commands that are auto-approved when they start the command line
+# (matched case-sensitively, as the shell does)
+_SAFE_BASH_COMMANDS = ("ls", "pwd", "echo", "date", "which", "where")
+_SAFE_BASH_PREFIXES = tuple(f"{cmd}{sep}" for cmd in _SAFE_BASH_COMMANDS for sep in (" ", "\t"))
+
+# Shell syntax that runs further commands or redirects output; a safe
+# command using any of it is not auto-approved
+_BASH_CHAINING_RE = re.compile(r"[;&|`\n<>]|\$\(")
+
+# Bash commands that always require approval wherever they appear, including
+# by path (e.g. "/bin/rm")
+_DANGEROUS_BASH_RE = re.compile(r"(?:^|[\s;&|`$(/])\s*(rm|del|format|kill|sudo)(\s|$)", re.I)
+
+# Pre-serialized hook outputs; only the decision reason is encoded per call
+_DECISION_TEMPLATES = {
+    decision: (
+        b'{"hookSpecificOutput":{"hookEventName":"PreToolUse",'
+        b'"permissionDecision":"' + decision.encode() + b'",'
+        b'"permissionDecisionReason":%b}}'
+    )
+    for decision in ("allow", "deny", "ask")
+}
+_CONTINUE_OUTPUT = b'{"continue":true}'
+_CONTINUE_SILENT_OUTPUT = b'{"continue":true,"suppressOutput":true}'
+
+# Fields every PreToolUse input carries, fetched in a single lookup
+_extract_input = operator.itemgetter("session_id", "tool_name", "tool_input")
 
 
 def should_require_approval(tool_name: str, tool_input: Dict[str, Any]) -> bool:
     """Determine if a tool use should require approval."""
     
+    # Only the command (Bash) or target path (Write) affects the decision
+    if tool_name == "Bash":
+        subject = tool_input.get("command", "")
+    elif tool_name == "Write":
+        subject = tool_input.get("file_path", "")
+    else:
+        subject = ""
+    
+    return _decide(tool_name, subject)
+
+
+@functools.lru_cache(maxsize=256)
+def _decide(tool_name: str, subject: str) -> bool:
+    """Approval decision for a tool and its command or file path."""
+    
     # Always approve safe tools
     if tool_name in SAFE_TOOLS:
         return False
@@ -65,151 +222,770 @@ def should_require_approval(tool_name: str, tool_input: Dict[str, Any]) -> bool:
     
     # Additional filtering based on tool input
     if tool_name == "Bash":
-        command = tool_input.get("command", "").lower()
-        # Auto-approve certain safe commands
-        safe_commands = ["ls", "pwd", "echo", "date", "which", "where"]
-        if any(command.startswith(cmd) for cmd in safe_commands):
-            return False
-        # Always require approval for dangerous commands
-        dangerous_commands = ["rm", "del", "format", "kill", "sudo"]
-        if any(cmd in command for cmd in dangerous_commands):
+        # Always require approval for dangerous commands, even when chained
+        # after a safe one
+        if _DANGEROUS_BASH_RE.search(subject):
             return True
+        # Auto-approve certain safe commands, unless other commands are chained on
+        if subject in _SAFE_BASH_COMMANDS or (
+            subject.startswith(_SAFE_BASH_PREFIXES) and not _BASH_CHAINING_RE.search(subject)
+        ):
+            return False
     
     elif tool_name == "Write":
-        file_path = tool_input.get("file_path", "")
         # Auto-approve writing to certain safe locations
-        if "/tmp/" in file_path or "\\temp\\" in file_path.lower():
+        if "/tmp/" in subject or "\\temp\\" in subject.lower():
             return False
     
     return True
 
 
-def request_approval(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Request approval from remote Telegram bot."""
+def _get_session():
+    """Import requests and create the shared HTTP session on first use."""
+    global requests, _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+class IPCError(Exception):
+    """Raised when the IPC server reports an error over the Unix socket."""
+
+
+def _hook_output(decision: str, reason: str) -> bytes:
+    """Build the PreToolUse output JSON for a permission decision."""
+    return _DECISION_TEMPLATES[decision] % _dumps(reason)
+
+
+def _decision_output(status_data: Dict[str, Any]) -> Optional[bytes]:
+    """Return the hook output for a decided request, or None while pending."""
+    current_status = status_data["status"]
     
-    # Extract relevant data
-    session_id = input_data.get("session_id", "unknown")
-    tool_name = input_data.get("tool_name", "")
-    tool_input = input_data.get("tool_input", {})
-    project_dir = input_data.get("cwd", "Unknown Project")
+    if current_status == "approved":
+        logger.info("Request approved via Telegram")
+        return _hook_output("allow", "Approved remotely via Telegram")
     
-    logger.info(f"Processing {tool_name} request for session {session_id[:8]}...")
+    if current_status == "denied":
+        reason = status_data.get("reason") or "Denied via Telegram"
+        logger.info("Request denied: %s", reason)
+        return _hook_output("deny", reason)
     
-    # Check if approval is needed
-    if not should_require_approval(tool_name, tool_input):
-        logger.info(f"Auto-approving {tool_name} (safe operation)")
-        return {"continue": True}
-    
-    try:
-        # Submit approval request to IPC server
-        logger.info(f"Requesting approval for {tool_name}")
-        response = requests.post(
-            f"{IPC_SERVER}/approval/request",
-            json={
-                "session_id": session_id,
-                "tool_name": tool_name,
-                "tool_input": tool_input,
-                "project_dir": project_dir
-            },
-            timeout=5
-        )
+    return None
+
+
+def _ipc_connect(path: Optional[str] = IPC_SOCKET) -> Optional[socket.socket]:
+    """Connect to a Unix socket, or return None if unavailable."""
+    if path is None or not hasattr(socket, "AF_UNIX"):
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _recv_exact(
+    sock: socket.socket,
+    selector: selectors.BaseSelector,
+    size: int,
+    deadline: float
+) -> bytes:
+    """Read exactly ``size`` bytes, waking only when the server sends data."""
+    data = b""
+    while len(data) < size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not selector.select(remaining):
+            raise TimeoutError("Timed out waiting for IPC server")
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("IPC socket closed by server")
+        data += chunk
+    return data
+
+
+def _ipc_call(
+    sock: socket.socket,
+    selector: selectors.BaseSelector,
+    message: Dict[str, Any],
+    timeout: float = 5
+) -> Dict[str, Any]:
+    """Send a length-prefixed JSON message and return the server's reply."""
+    deadline = time.monotonic() + timeout
+    sock.settimeout(timeout)
+    _send_frame(sock, _dumps(message))
+    return _ipc_reply(sock, selector, deadline)
+
+
+def _ipc_reply(
+    sock: socket.socket,
+    selector: selectors.BaseSelector,
+    deadline: float
+) -> Dict[str, Any]:
+    """Read one length-prefixed JSON reply, raising IPCError for error replies."""
+    (length,) = struct.unpack("!I", _recv_exact(sock, selector, 4, deadline))
+    reply = _loads(_recv_exact(sock, selector, length, deadline))
+    if "error" in reply:
+        raise IPCError(reply["error"])
+    return reply
+
+
+def _request_approval_unix(sock: socket.socket, payload: Dict[str, Any]) -> bytes:
+    """Submit a request and wait for its decision over the Unix socket."""
+    with selectors.DefaultSelector() as selector:
+        selector.register(sock, selectors.EVENT_READ)
+        return _await_decision_unix(sock, selector, payload)
+
+
+def _await_decision_unix(
+    sock: socket.socket,
+    selector: selectors.BaseSelector,
+    payload: Dict[str, Any]
+) -> bytes:
+    """
+    Create the request and long-poll its status on a registered socket.
+    
+    Errors escape only while no request can have been created (the request
+    could not be sent, or the server rejected it), so the caller may retry
+    over HTTP. Afterwards, an unconfirmed request answers "ask" and a failed
+    wait continues on the same request over HTTP, so the user is never
+    prompted twice.
+    """
+    # A send failure means nothing reached the server
+    sock.settimeout(5)
+    _send_frame(sock, _dumps({"op": "request", "data": payload}))
+    try:
+        created = _ipc_reply(sock, selector, time.monotonic() + 5)
+        request_id = created["request_id"]
+    except IPCError:
+        raise
+    except (OSError, ValueError, KeyError) as e:
+        logger.error("Approval request sent but not confirmed: %s", e)
+        return _hook_output("ask", "Remote approval server did not confirm the request")
+    logger.info("Created approval request %s... (unix socket)", request_id[:8])
+    
+    # The request may already be decided when it is created
+    output = _decision_output(created)
+    if output:
+        return output
+    
+    deadline = time.monotonic() + TIMEOUT
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = min(LONG_POLL_WAIT, remaining)
+            
+            status_data = _ipc_call(
+                sock,
+                selector,
+                {"op": "status", "request_id": request_id, "wait": wait},
+                timeout=wait + 5
+            )
+            output = _decision_output(status_data)
+            if output:
+                return output
+    except (OSError, ValueError, KeyError, IPCError) as e:
+        logger.warning("Unix socket IPC failed, waiting for %s... over HTTP: %s", request_id[:8], e)
+        _get_session()
+        return _await_decision_http(request_id, deadline)
+    
+    logger.warning("Request %s timed out after %ss", request_id[:8], TIMEOUT)
+    return _hook_output("ask", f"Remote approval timed out after {TIMEOUT}s")
+
+
+def _stream_decision(request_id: str, timeout: float) -> Optional[bytes]:
+    """
+    Wait for a decision on the server-sent events stream.
+    
+    Returns the hook output once a decision arrives, or None if the stream
+    ended without one or the server does not provide the stream endpoint.
+    """
+    with _SESSION.get(
+        f"{IPC_SERVER}/approval/stream/{request_id}",
+        params={"timeout": timeout},
+        stream=True,
+        timeout=(5, timeout + 5)
+    ) as response:
+        if response.status_code == 404:
+            logger.info("Approval server has no decision stream, polling instead")
+            return None
+        response.raise_for_status()
+        
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            output = _decision_output(_loads(line[5:]))
+            if output:
+                return output
+    
+    return None
+
+
+def _request_approval_http(payload: Dict[str, Any]) -> bytes:
+    """Submit a request and wait for its decision over HTTP."""
+    _get_session()
+    
+    try:
+        # Submit approval request to IPC server, retrying connection
+        # failures and server errors; 4xx responses are not retried
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            last_attempt = attempt == MAX_REQUEST_ATTEMPTS - 1
+            try:
+                response = _SESSION.post(
+                    f"{IPC_SERVER}/approval/request",
+                    json=payload,
+                    timeout=5
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                logger.warning("Approval request failed (attempt %s): %s", attempt + 1, e)
+                time.sleep(_backoff_delay(attempt))
+                continue
+            
+            if response.status_code < 500 or last_attempt:
+                break
+            logger.warning("Approval server error %s (attempt %s)", response.status_code, attempt + 1)
+            time.sleep(_backoff_delay(attempt))
         
         if response.status_code != 200:
-            logger.error(f"Failed to create approval request: {response.text}")
+            logger.error("Failed to create approval request: %s", response.text)
             # Fall back to local approval
-            return {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "ask",
-                    "permissionDecisionReason": "Remote approval server unavailable"
-                }
-            }
-        
-        request_id = response.json()["request_id"]
-        logger.info(f"Created approval request {request_id[:8]}...")
-        
-        # Poll for approval with timeout
-        start_time = time.time()
+            return _hook_output("ask", "Remote approval server unavailable")
+        
+        created = _loads(response.content)
+        request_id = created["request_id"]
+        logger.info("Created approval request %s...", request_id[:8])
+        
+        # The request may already be decided when it is created
+        output = _decision_output(created)
+        if output:
+            return output
+        
+        return _await_decision_http(request_id, time.monotonic() + TIMEOUT)
+        
+    except requests.exceptions.ConnectionError:
+        logger.error("Cannot connect to IPC server - is it running?")
+        # Server not available, fall back to normal flow
+        return _hook_output("ask", "Remote approval server not running")
+    
+    except requests.exceptions.Timeout:
+        logger.error("IPC server did not respond in time")
+        return _hook_output("ask", "Remote approval server not responding")
+
+
+def _await_decision_http(request_id: str, deadline: float) -> bytes:
+    """Wait over HTTP until ``deadline`` for the decision on an existing request."""
+    try:
+        # Wait for the decision to be pushed over a server-sent events stream
+        try:
+            remaining = deadline - time.monotonic()
+            output = _stream_decision(request_id, remaining) if remaining > 0 else None
+            if output:
+                return output
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Decision stream failed, polling instead: %s", e)
+        
+        # Long-poll for approval with timeout: the server holds each status
+        # request open until a decision arrives or the wait elapses
         last_status = None
+        attempt = 0
         
-        while time.time() - start_time < TIMEOUT:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = min(LONG_POLL_WAIT, remaining)
+            
             try:
-                status_response = requests.get(
+                status_response = _SESSION.get(
                     f"{IPC_SERVER}/approval/status/{request_id}",
-                    timeout=5
+                    params={"wait": wait},
+                    timeout=wait + 5
                 )
                 
                 if status_response.status_code != 200:
-                    logger.error(f"Failed to get status: {status_response.text}")
-                    time.sleep(POLL_INTERVAL)
+                    logger.error("Failed to get status: %s", status_response.text)
+                    time.sleep(min(_backoff_delay(attempt), remaining))
+                    attempt += 1
                     continue
                 
-                status_data = status_response.json()
-                current_status = status_data.get("status", "pending")
+                attempt = 0
+                status_data = _loads(status_response.content)
+                current_status = status_data["status"]
                 
-                if current_status != last_status:
-                    logger.info(f"Request {request_id[:8]} status: {current_status}")
+                if current_status != last_status and logger.isEnabledFor(logging.INFO):
+                    logger.info("Request %s status: %s", request_id[:8], current_status)
                     last_status = current_status
                 
-                if current_status == "approved":
-                    logger.info(f"Request approved via Telegram")
-                    return {
-                        "hookSpecificOutput": {
-                            "hookEventName": "PreToolUse",
-                            "permissionDecision": "allow",
-                            "permissionDecisionReason": "Approved remotely via Telegram"
-                        }
-                    }
-                    
-                elif current_status == "denied":
-                    reason = status_data.get("reason", "Denied via Telegram")
-                    logger.info(f"Request denied: {reason}")
-                    return {
-                        "hookSpecificOutput": {
-                            "hookEventName": "PreToolUse",
-                            "permissionDecision": "deny",
-                            "permissionDecisionReason": reason
-                        }
-                    }
-                
-                time.sleep(POLL_INTERVAL)
+                output = _decision_output(status_data)
+                if output:
+                    return output
                 
+            except (requests.exceptions.ConnectTimeout, requests.exceptions.ReadTimeout):
+                # A slow connect or an expired long-poll: ask again right away
+                continue
+            except requests.exceptions.ConnectionError as e:
+                # The server is gone; waiting out the budget will not help
+                logger.error("Lost connection to IPC server: %s", e)
+                return _hook_output("ask", "Remote approval server connection lost")
             except requests.exceptions.RequestException as e:
-                logger.error(f"Error polling for status: {e}")
-                time.sleep(POLL_INTERVAL)
+                logger.error("Error polling for status: %s", e)
+                time.sleep(min(_backoff_delay(attempt), remaining))
+                attempt += 1
         
         # Timeout - ask user locally
-        logger.warning(f"Request {request_id[:8]} timed out after {TIMEOUT}s")
-        return {
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "ask",
-                "permissionDecisionReason": f"Remote approval timed out after {TIMEOUT}s"
-            }
-        }
+        logger.warning("Request %s timed out after %ss", request_id[:8], TIMEOUT)
+        return _hook_output("ask", f"Remote approval timed out after {TIMEOUT}s")
         
-    except requests.exceptions.ConnectionError:
-        logger.error("Cannot connect to IPC server - is it running?")
-        # Server not available, fall back to normal flow
-        return {
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "ask",
-                "permissionDecisionReason": "Remote approval server not running"
-            }
-        }
+    except requests.exceptions.RequestException as e:
+        logger.error("Lost connection to IPC server: %s", e)
+        return _hook_output("ask", "Remote approval server connection lost")
+
+
+def _tool_input_preview(
+    tool_input: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Optional[str], Optional[int]]:
+    """
+    Truncate long string fields for display and describe the full tool input.
+    
+    The server only shows the input in Telegram, so large Write/Edit contents
+    are not sent in full. The hash and length of the full input are returned
+    only when a field was truncated, so Telegram can flag the preview.
+    """
+    long_keys = [
+        key for key, value in tool_input.items()
+        if isinstance(value, str) and len(value) > PREVIEW_LENGTH
+    ]
+    if not long_keys:
+        return tool_input, None, None
+    
+    preview = dict(tool_input)
+    for key in long_keys:
+        preview[key] = tool_input[key][:PREVIEW_LENGTH] + "…"
+    
+    full_input = json.dumps(tool_input, sort_keys=True)
+    input_hash = hashlib.blake2b(full_input.encode("utf-8"), digest_size=16).hexdigest()
+    return preview, input_hash, len(full_input)
+
+
+def _approval_payload(input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the approval request for a hook input, or None if it is auto-approved."""
+    
+    # Extract relevant data
+    try:
+        session_id, tool_name, tool_input = _extract_input(input_data)
+    except KeyError:
+        session_id = input_data.get("session_id", "unknown")
+        tool_name = input_data.get("tool_name", "")
+        tool_input = input_data.get("tool_input", {})
+    project_dir = input_data.get("cwd", "Unknown Project")
+    
+    logger.info("Processing %s request for session %s...", tool_name, session_id[:8])
+    
+    # Check if approval is needed
+    if not should_require_approval(tool_name, tool_input):
+        logger.info("Auto-approving %s (safe operation)", tool_name)
+        return None
+    
+    logger.info("Requesting approval for %s", tool_name)
+    preview, input_hash, input_length = _tool_input_preview(tool_input)
+    return {
+        "session_id": session_id,
+        "tool_name": tool_name,
+        "tool_input": preview,
+        "tool_input_hash": input_hash,
+        "tool_input_length": input_length,
+        "project_dir": project_dir
+    }
+
+
+def request_approval(input_data: Dict[str, Any]) -> bytes:
+    """Request approval from remote Telegram bot and return the hook output JSON."""
+    payload = _approval_payload(input_data)
+    if payload is None:
+        return _CONTINUE_OUTPUT
+    
+    try:
+        # Prefer the Unix socket; fall back to HTTP when it is unavailable or
+        # failed before a request was created
+        sock = _ipc_connect()
+        if sock:
+            with sock:
+                try:
+                    return _request_approval_unix(sock, payload)
+                except (OSError, ValueError, KeyError, IPCError) as e:
+                    logger.warning("Unix socket IPC failed, falling back to HTTP: %s", e)
+        
+        return _request_approval_http(payload)
         
     except Exception as e:
-        logger.error(f"Unexpected error in approval hook: {e}", exc_info=True)
+        logger.error("Unexpected error in approval hook: %s", e, exc_info=True)
         # On unexpected error, fall back to normal flow
-        return {"continue": True}
+        return _CONTINUE_OUTPUT
+
+
+async def _ipc_call_async(
+    reader: "asyncio.StreamReader",
+    writer: "asyncio.StreamWriter",
+    message: Dict[str, Any],
+    timeout: float = 5
+) -> Dict[str, Any]:
+    """Async counterpart of _ipc_call for the daemon."""
+    data = _dumps(message)
+    writer.write(struct.pack("!I", len(data)) + data)
+    await writer.drain()
+    return await asyncio.wait_for(_ipc_reply_async(reader), timeout)
+
+
+async def _ipc_reply_async(reader: "asyncio.StreamReader") -> Dict[str, Any]:
+    """Async counterpart of _ipc_reply."""
+    (length,) = struct.unpack("!I", await reader.readexactly(4))
+    reply = _loads(await reader.readexactly(length))
+    if "error" in reply:
+        raise IPCError(reply["error"])
+    return reply
+
+
+async def _request_approval_unix_async(client, payload: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Submit and await a request over the IPC server's Unix socket, or None if unavailable.
+    
+    Like _await_decision_unix, errors escape only before a request can have
+    been created; a failed wait continues on the same request over HTTP.
+    """
+    if IPC_SOCKET is None:
+        return None
+    try:
+        reader, writer = await asyncio.open_unix_connection(IPC_SOCKET)
+    except OSError:
+        return None
+    
+    try:
+        # A send failure means nothing reached the server
+        data = _dumps({"op": "request", "data": payload})
+        writer.write(struct.pack("!I", len(data)) + data)
+        await writer.drain()
+        try:
+            created = await asyncio.wait_for(_ipc_reply_async(reader), 5)
+            request_id = created["request_id"]
+        except IPCError:
+            raise
+        except (OSError, ValueError, KeyError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError) as e:
+            logger.error("Approval request sent but not confirmed: %s", e)
+            return _hook_output("ask", "Remote approval server did not confirm the request")
+        logger.info("Created approval request %s... (unix socket)", request_id[:8])
+        
+        output = _decision_output(created)
+        deadline = time.monotonic() + TIMEOUT
+        try:
+            while output is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Request %s timed out after %ss", request_id[:8], TIMEOUT)
+                    return _hook_output("ask", f"Remote approval timed out after {TIMEOUT}s")
+                wait = min(LONG_POLL_WAIT, remaining)
+                status_data = await _ipc_call_async(
+                    reader,
+                    writer,
+                    {"op": "status", "request_id": request_id, "wait": wait},
+                    timeout=wait + 5
+                )
+                output = _decision_output(status_data)
+        except (OSError, ValueError, KeyError, IPCError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError) as e:
+            logger.warning("Unix socket IPC failed, waiting for %s... over HTTP: %s", request_id[:8], e)
+            return await _await_decision_http_async(client, request_id, deadline)
+        return output
+    finally:
+        writer.close()
+
+
+async def _request_approval_http_async(client, payload: Dict[str, Any]) -> bytes:
+    """Submit and long-poll a request over HTTP with the daemon's shared httpx client."""
+    import httpx
+    
+    try:
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            last_attempt = attempt == MAX_REQUEST_ATTEMPTS - 1
+            try:
+                response = await client.post("/approval/request", json=payload, timeout=5)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                logger.warning("Approval request failed (attempt %s): %s", attempt + 1, e)
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            
+            if response.status_code < 500 or last_attempt:
+                break
+            logger.warning("Approval server error %s (attempt %s)", response.status_code, attempt + 1)
+            await asyncio.sleep(_backoff_delay(attempt))
+        
+        if response.status_code != 200:
+            logger.error("Failed to create approval request: %s", response.text)
+            return _hook_output("ask", "Remote approval server unavailable")
+        
+        created = _loads(response.content)
+        request_id = created["request_id"]
+        logger.info("Created approval request %s...", request_id[:8])
+        
+        output = _decision_output(created)
+        if output:
+            return output
+        
+        return await _await_decision_http_async(client, request_id, time.monotonic() + TIMEOUT)
+        
+    except httpx.ConnectError:
+        logger.error("Cannot connect to IPC server - is it running?")
+        return _hook_output("ask", "Remote approval server not running")
+    
+    except httpx.TimeoutException:
+        logger.error("IPC server did not respond in time")
+        return _hook_output("ask", "Remote approval server not responding")
+
+
+async def _await_decision_http_async(client, request_id: str, deadline: float) -> bytes:
+    """Async counterpart of _await_decision_http using the daemon's httpx client."""
+    import httpx
+    
+    try:
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait = min(LONG_POLL_WAIT, remaining)
+            
+            try:
+                status_response = await client.get(
+                    f"/approval/status/{request_id}",
+                    params={"wait": wait},
+                    timeout=wait + 5
+                )
+            except httpx.TimeoutException:
+                continue
+            except httpx.ConnectError as e:
+                logger.error("Lost connection to IPC server: %s", e)
+                return _hook_output("ask", "Remote approval server connection lost")
+            except httpx.HTTPError as e:
+                logger.error("Error polling for status: %s", e)
+                await asyncio.sleep(min(_backoff_delay(attempt), remaining))
+                attempt += 1
+                continue
+            
+            if status_response.status_code != 200:
+                logger.error("Failed to get status: %s", status_response.text)
+                await asyncio.sleep(min(_backoff_delay(attempt), remaining))
+                attempt += 1
+                continue
+            
+            attempt = 0
+            output = _decision_output(_loads(status_response.content))
+            if output:
+                return output
+        
+        logger.warning("Request %s timed out after %ss", request_id[:8], TIMEOUT)
+        return _hook_output("ask", f"Remote approval timed out after {TIMEOUT}s")
+        
+    except httpx.HTTPError as e:
+        logger.error("Lost connection to IPC server: %s", e)
+        return _hook_output("ask", "Remote approval server connection lost")
+
+
+async def request_approval_async(input_data: Dict[str, Any], client) -> bytes:
+    """
+    Async variant of request_approval used by the daemon.
+    
+    All pending approvals share the daemon's event loop and its httpx client,
+    so waiting on many sessions costs no extra threads.
+    """
+    payload = _approval_payload(input_data)
+    if payload is None:
+        return _CONTINUE_OUTPUT
+    
+    try:
+        try:
+            output = await _request_approval_unix_async(client, payload)
+            if output:
+                return output
+        except (OSError, ValueError, KeyError, IPCError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError) as e:
+            logger.warning("Unix socket IPC failed, falling back to HTTP: %s", e)
+        
+        return await _request_approval_http_async(client, payload)
+        
+    except Exception as e:
+        logger.error("Unexpected error in approval hook: %s", e, exc_info=True)
+        return _CONTINUE_OUTPUT
+
+
+def _send_frame(sock: socket.socket, data: bytes):
+    """Send ``data`` prefixed with its length."""
+    sock.sendall(struct.pack("!I", len(data)) + data)
+
+
+def _recv_frame(sock: socket.socket, timeout: float) -> bytes:
+    """Receive one length-prefixed frame within ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as selector:
+        selector.register(sock, selectors.EVENT_READ)
+        (length,) = struct.unpack("!I", _recv_exact(sock, selector, 4, deadline))
+        return _recv_exact(sock, selector, length, deadline)
+
+
+def serve_daemon():
+    """Serve hook calls on DAEMON_SOCKET until idle for DAEMON_IDLE_TIMEOUT."""
+    if DAEMON_SOCKET is None:
+        logger.error("No private directory for the daemon socket, not starting")
+        return
+    existing = _ipc_connect(DAEMON_SOCKET)
+    if existing:
+        # Another daemon is already serving
+        existing.close()
+        return
+    if os.path.exists(DAEMON_SOCKET):
+        os.unlink(DAEMON_SOCKET)
+    
+    # asyncio is only needed by the daemon, so one-shot hook runs skip its import
+    global asyncio
+    import asyncio
+    
+    try:
+        asyncio.run(_serve_daemon())
+    finally:
+        try:
+            os.unlink(DAEMON_SOCKET)
+        except OSError:
+            pass
+
+
+async def _serve_daemon():
+    """Run the daemon's Unix socket server on one event loop."""
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+        logger.warning("httpx is not installed, daemon will run approvals in threads")
+    
+    client = None
+    if httpx:
+        client = httpx.AsyncClient(
+            base_url=IPC_SERVER,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=httpx.Timeout(TIMEOUT)
+        )
+    last_activity = time.monotonic()
+    
+    async def handle(reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"):
+        nonlocal last_activity
+        last_activity = time.monotonic()
+        try:
+            (length,) = struct.unpack("!I", await asyncio.wait_for(reader.readexactly(4), 5))
+            input_data = _loads(await asyncio.wait_for(reader.readexactly(length), 5))
+            if client:
+                output = await request_approval_async(input_data, client)
+            else:
+                output = await asyncio.to_thread(request_approval, input_data)
+            writer.write(struct.pack("!I", len(output)) + output)
+            await writer.drain()
+        except Exception as e:
+            logger.error("Daemon failed to handle hook call: %s", e)
+        finally:
+            last_activity = time.monotonic()
+            writer.close()
+    
+    # Create the socket owner-only rather than fixing its mode after the bind
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(handle, path=DAEMON_SOCKET)
+    finally:
+        os.umask(old_umask)
+    logger.info("Hook daemon listening on %s", DAEMON_SOCKET)
+    
+    try:
+        async with server:
+            while time.monotonic() - last_activity < DAEMON_IDLE_TIMEOUT:
+                await asyncio.sleep(10)
+    finally:
+        if client:
+            await client.aclose()
+
+
+def _spawn_daemon():
+    """Start the hook daemon in the background."""
+    import subprocess
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def _forward_to_daemon(raw_input: bytes) -> Optional[bytes]:
+    """
+    Let the hook daemon answer this call, starting it if it is not running.
+    
+    Returns the daemon's JSON output, or None if the call could not be handed
+    to it. Once the call is sent the daemon may already have created an
+    approval request, so later failures answer "ask" instead of returning
+    None, which would send a second prompt from this process.
+    """
+    # Leave a second of the hook's time limit to write the answer
+    deadline = time.monotonic() + HOOK_TIME_LIMIT - 1
+    sock = _ipc_connect(DAEMON_SOCKET)
+    if sock is None:
+        _spawn_daemon()
+        for _ in range(40):
+            time.sleep(0.05)
+            sock = _ipc_connect(DAEMON_SOCKET)
+            if sock:
+                break
+        else:
+            logger.warning("Hook daemon did not start, handling call in-process")
+            return None
+    
+    with sock:
+        try:
+            _send_frame(sock, raw_input)
+        except OSError as e:
+            logger.warning("Hook daemon failed, handling call in-process: %s", e)
+            return None
+        
+        try:
+            return _recv_frame(sock, timeout=deadline - time.monotonic())
+        except (OSError, struct.error) as e:
+            logger.error("Hook daemon did not answer: %s", e)
+            return _hook_output("ask", "Remote approval daemon did not answer")
+
+
+def _write_output(output: bytes):
+    """Write the hook output JSON to stdout."""
+    sys.stdout.buffer.write(output + b"\n")
+    sys.stdout.flush()
 
 
 def main():
     """Main entry point for the hook."""
     try:
         # Read input from stdin
-        input_data = json.load(sys.stdin)
+        raw_input = sys.stdin.buffer.read()
+        input_data = _loads(raw_input)
         
         # Only process PreToolUse events
         hook_event = input_data.get("hook_event_name", "")
@@ -217,30 +993,36 @@ def main():
             # Not our event, continue normally
             sys.exit(0)
         
+        # Hand calls that need remote approval to the warm daemon
+        if DAEMON_ENABLED and should_require_approval(
+            input_data.get("tool_name", ""), input_data.get("tool_input", {})
+        ):
+            output = _forward_to_daemon(raw_input)
+            if output is not None:
+                _write_output(output)
+                sys.exit(0)
+        
         # Process approval request
         output = request_approval(input_data)
         
         # Return response to Claude Code
-        print(json.dumps(output))
+        _write_output(output)
         sys.exit(0)
         
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON input: {e}")
-        print(json.dumps({
-            "continue": True,
-            "suppressOutput": True
-        }))
+        logger.error("Invalid JSON input: %s", e)
+        _write_output(_CONTINUE_SILENT_OUTPUT)
         sys.exit(0)
         
     except Exception as e:
-        logger.error(f"Hook failed: {e}", exc_info=True)
+        logger.error("Hook failed: %s", e, exc_info=True)
         # On any error, don't block Claude
-        print(json.dumps({
-            "continue": True,
-            "suppressOutput": True
-        }))
+        _write_output(_CONTINUE_SILENT_OUTPUT)
         sys.exit(0)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:] == ["--daemon"]:
+        serve_daemon()
+    else:
+        main()
\ No newline at end of file
@@ -6,13 +6,18 @@ Enhanced version of the bot that includes remote approval capabilities
 for Claude Code sessions.
 """
 
+import functools
 import logging
 import os
 import asyncio
 import threading
+import requests
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 from telegram import Update, BotCommand
+from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -24,8 +29,8 @@ load_dotenv()
 from src.config import Config
 from src.github_client import GitHubClient  
 from src.version_manager import VersionManager
-from src.release_parser import ReleaseParser
-from src.utils import setup_logging, format_datetime
+from src.release_parser import ReleaseParser, extract_changelog_entries
+from src.utils import setup_logging, format_datetime, load_json_file, save_json_file
 from src.bot_approval import register_approval_handlers
 from src.ipc_server import run_server
 
@@ -48,40 +53,148 @@ scheduler = AsyncIOScheduler()
 monitoring_active = False
 approval_handler = None
 ipc_server_thread = None
+bot_application = None  # Set in post_init, used by background monitoring
+initial_check_task = None  # Keeps the pending first check from being garbage collected
 
-# Store authorized chat IDs
+# Store authorized chat IDs; kept in memory and persisted when it changes
 authorized_chats = set()
+SUBSCRIBERS_FILE = Path(config.data_directory) / "subscribers.json"
+
+# Chats notified concurrently; Telegram allows about 30 messages per second per bot
+NOTIFICATION_CONCURRENCY = 25
+
+# Telegram HTTP connection pool; must cover notification fan-out plus command replies
+TELEGRAM_CONNECTION_POOL_SIZE = 32
+TELEGRAM_POOL_TIMEOUT = 10.0
+
+# Delay before the first check after /start_monitoring
+INITIAL_CHECK_DELAY_SECONDS = 5
+
+# Reply templates; placeholders are filled with str.format
+START_TEXT = (
+    "🚀 **CC Release Monitor Bot with Remote Approval**\n\n"
+    "I monitor the Claude Code repository for updates and provide remote approval for Claude Code sessions.\n\n"
+    
+    "**📦 Release Monitoring:**\n"
+    "• `/check` - Check for new releases\n"
+    "• `/latest` - Show latest release info\n"
+    "• `/commits` - Show recent commits\n"
+    "• `/changelog` - Show changelog updates\n"
+    "• `/start_monitoring` - Start automatic monitoring\n"
+    "• `/stop_monitoring` - Stop automatic monitoring\n\n"
+    
+    "**🔐 Remote Approval System:**\n"
+    "• `/start_approval` - Start approval monitoring\n"
+    "• `/stop_approval` - Stop approval monitoring\n"
+    "• `/approval_status` - Show approval statistics\n\n"
+    
+    "**ℹ️ Other Commands:**\n"
+    "• `/help` - Show this help message\n"
+    "• `/status` - Show bot status\n"
+    "• `/version` - Show version info\n\n"
+    
+    "Your Chat ID: `{chat_id}` - add this to AUTHORIZED_USERS in .env"
+)
+
+HELP_TEXT = (
+    "📚 **Available Commands**\n\n"
+    
+    "**Basic:**\n"
+    "• `/start` - Initialize the bot\n"
+    "• `/help` - Show this help message\n"
+    "• `/status` - Show bot and monitoring status\n\n"
+    
+    "**Monitoring:**\n"
+    "• `/check` - Manually check for updates\n"
+    "• `/latest` - Show latest release details\n"
+    "• `/commits [count]` - Show recent commits (default: 5)\n"
+    "• `/commit <sha>` - Show specific commit details\n"
+    "• `/changelog` - Show recent changelog\n"
+    "• `/changelog_latest` - Show latest changelog entry\n"
+    "• `/version` - Show version tracking info\n\n"
+    
+    "**Automatic Monitoring:**\n"
+    "• `/start_monitoring` - Enable automatic checks\n"
+    "• `/stop_monitoring` - Disable automatic checks\n\n"
+    
+    "**Remote Approval:**\n"
+    "• `/start_approval` - Enable Claude Code approval system\n"
+    "• `/stop_approval` - Disable approval system\n"
+    "• `/approval_status` - Show approval statistics\n\n"
+    
+    "When approval is enabled, you'll receive notifications for Claude Code tool use "
+    "requests and can approve/deny them remotely."
+)
+
+MONITORING_STARTED_TEXT = (
+    "✅ **Monitoring Started**\n\n"
+    "I will check for new releases every {interval} minutes.\n"
+    "You'll receive notifications when new releases are found."
+)
+
+MONITORING_STOPPED_TEXT = (
+    "⏹️ **Monitoring Stopped**\n\n"
+    "Automatic checking has been disabled.\n"
+    "Use `/start_monitoring` to resume."
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _render(template: str, **fields) -> str:
+    """
+    Fill a reply template, memoizing renders with the same field values.
+    
+    Args:
+        template: One of the module-level *_TEXT templates
+        **fields: Hashable values for the template placeholders
+        
+    Returns:
+        Rendered message text
+    """
+    return template.format(**fields)
+
+
+def _load_subscribers() -> set:
+    """Load the persisted authorized chat IDs."""
+    chat_ids = load_json_file(SUBSCRIBERS_FILE, [])
+    if not isinstance(chat_ids, list):
+        logger.warning("Invalid subscribers data, starting fresh")
+        return set()
+    return {int(chat_id) for chat_id in chat_ids}
+
+
+def _write_subscribers(chat_ids) -> bool:
+    """
+    Persist the authorized chat IDs.
+    
+    Args:
+        chat_ids: Snapshot of the authorized chat IDs
+        
+    Returns:
+        True if saved successfully
+    """
+    return save_json_file(sorted(chat_ids), SUBSCRIBERS_FILE)
+
+
+async def add_subscriber(chat_id: int) -> None:
+    """
+    Authorize a chat for notifications and persist the change.
+    
+    Args:
+        chat_id: Telegram chat ID
+    """
+    if chat_id in authorized_chats:
+        return
+    authorized_chats.add(chat_id)
+    await asyncio.to_thread(_write_subscribers, list(authorized_chats))
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /start is issued."""
     chat_id = update.effective_chat.id
-    authorized_chats.add(chat_id)
+    await add_subscriber(chat_id)
     
-    welcome_message = (
-        "🚀 **CC Release Monitor Bot with Remote Approval**\n\n"
-        "I monitor the Claude Code repository for updates and provide remote approval for Claude Code sessions.\n\n"
-        
-        "**📦 Release Monitoring:**\n"
-        "• `/check` - Check for new releases\n"
-        "• `/latest` - Show latest release info\n"
-        "• `/commits` - Show recent commits\n"
-        "• `/changelog` - Show changelog updates\n"
-        "• `/start_monitoring` - Start automatic monitoring\n"
-        "• `/stop_monitoring` - Stop automatic monitoring\n\n"
-        
-        "**🔐 Remote Approval System:**\n"
-        "• `/start_approval` - Start approval monitoring\n"
-        "• `/stop_approval` - Stop approval monitoring\n"
-        "• `/approval_status` - Show approval statistics\n\n"
-        
-        "**ℹ️ Other Commands:**\n"
-        "• `/help` - Show this help message\n"
-        "• `/status` - Show bot status\n"
-        "• `/version` - Show version info\n\n"
-        
-        f"Your Chat ID: `{chat_id}` - add this to AUTHORIZED_USERS in .env"
-    )
+    welcome_message = START_TEXT.format(chat_id=chat_id)
     
     await update.message.reply_text(welcome_message)
     logger.info(f"Bot started for chat {chat_id}")
@@ -89,37 +202,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /help is issued."""
-    help_text = (
-        "📚 **Available Commands**\n\n"
-        
-        "**Basic:**\n"
-        "• `/start` - Initialize the bot\n"
-        "• `/help` - Show this help message\n"
-        "• `/status` - Show bot and monitoring status\n\n"
-        
-        "**Monitoring:**\n"
-        "• `/check` - Manually check for updates\n"
-        "• `/latest` - Show latest release details\n"
-        "• `/commits [count]` - Show recent commits (default: 5)\n"
-        "• `/commit <sha>` - Show specific commit details\n"
-        "• `/changelog` - Show recent changelog\n"
-        "• `/changelog_latest` - Show latest changelog entry\n"
-        "• `/version` - Show version tracking info\n\n"
-        
-        "**Automatic Monitoring:**\n"
-        "• `/start_monitoring` - Enable automatic checks\n"
-        "• `/stop_monitoring` - Disable automatic checks\n\n"
-        
-        "**Remote Approval:**\n"
-        "• `/start_approval` - Enable Claude Code approval system\n"
-        "• `/stop_approval` - Disable approval system\n"
-        "• `/approval_status` - Show approval statistics\n\n"
-        
-        "When approval is enabled, you'll receive notifications for Claude Code tool use "
-        "requests and can approve/deny them remotely."
-    )
-    
-    await update.message.reply_text(help_text, parse_mode='Markdown')
+    await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.MARKDOWN)
 
 
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -129,7 +212,6 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Check IPC server status
     ipc_status = "❌ Offline"
     try:
-        import requests
         response = requests.get("http://localhost:8765/", timeout=2)
         if response.status_code == 200:
             ipc_status = "✅ Online"
@@ -163,7 +245,6 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Add approval statistics if available
     if approval_handler:
         try:
-            import requests
             response = requests.get("http://localhost:8765/approval/stats", timeout=2)
             if response.status_code == 200:
                 approval_stats = response.json()
@@ -176,7 +257,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         except:
             pass
     
-    await update.message.reply_text(status_message, parse_mode='Markdown')
+    await update.message.reply_text(status_message, parse_mode=ParseMode.MARKDOWN)
 
 
 async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -185,28 +266,28 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     
     try:
         # Check for new releases
-        release = await github_client.get_latest_release_async()
+        release = await github_client.get_latest_release_async(force=True)
         
         if release:
             parsed = release_parser.parse_release(release)
             current_version = parsed.get("version", "Unknown")
             
             # Check if it's new
-            is_new = version_manager.update_version(release)
+            is_new = await asyncio.to_thread(version_manager.update_version, release)
             
             if is_new:
                 # Format and send notification
                 message = release_parser.format_release_for_notification(parsed, include_body=True)
                 await update.message.reply_text(
                     f"🎉 **New Release Found!**\n\n{message}",
-                    parse_mode='Markdown',
+                    parse_mode=ParseMode.MARKDOWN,
                     disable_web_page_preview=True
                 )
-                version_manager.mark_notification_sent(current_version)
+                await asyncio.to_thread(version_manager.mark_notification_sent, current_version)
             else:
                 await update.message.reply_text(
                     f"✅ No new releases. Latest version is still {current_version}",
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
         else:
             await update.message.reply_text("❌ Could not fetch release information")
@@ -227,7 +308,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             
             await update.message.reply_text(
                 f"📦 **Latest Release**\n\n{message}",
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
         else:
@@ -238,56 +319,196 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await update.message.reply_text(f"❌ Error: {str(e)}")
 
 
-async def periodic_monitoring() -> None:
-    """Periodic monitoring function that runs in background."""
-    if not monitoring_active:
-        return
+@functools.lru_cache(maxsize=128)
+def _format_history_time(check_time: Optional[str]) -> str:
+    """
+    Format a history entry's check time for display.
     
-    logger.info("Running periodic monitoring check...")
+    History entries never change once written, so results are cached by the
+    ISO string and repeated /version calls skip the parse.
     
+    Args:
+        check_time: ISO 8601 check time from a history entry
+        
+    Returns:
+        Short "MM-DD HH:MM" string, or "unknown" if it can't be parsed
+    """
     try:
-        # Check for new releases
-        release = await github_client.get_latest_release_async()
+        check_dt = datetime.fromisoformat(check_time.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return "unknown"
+    return format_datetime(check_dt, "%m-%d %H:%M")
+
+
+async def version_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show version tracking information."""
+    try:
+        stats = version_manager.get_statistics()
+        history = version_manager.get_version_history(limit=5)
+        
+        last_check = "Never"
+        if stats['last_check_time']:
+            try:
+                last_check_dt = datetime.fromisoformat(stats['last_check_time'].replace('Z', '+00:00'))
+                last_check = format_datetime(last_check_dt)
+            except (ValueError, TypeError):
+                last_check = stats['last_check_time']
+        
+        # Static sections are single strings; only the history lines vary
+        message_parts = [
+            "📦 **Version Tracking**\n",
+            f"**Current Status:**\n"
+            f"📝 Last Known Version: {stats['last_known_version'] or 'None'}\n"
+            f"🕒 Last Check: {last_check}\n"
+            f"🔢 Total Checks: {stats['check_count']}\n"
+            f"🆕 New Versions Detected: {stats['new_versions_detected']}\n",
+        ]
+        
+        if history:
+            message_parts.append("**Recent History:**")
+            for entry in history:
+                label = (entry.get('version') or entry.get('short_sha')
+                         or entry.get('short_hash') or entry.get('type', 'unknown'))
+                icon = "🆕" if entry.get('is_new') else "•"
+                time_str = _format_history_time(entry.get('check_time'))
+                message_parts.append(f"{icon} `{label}` - {time_str}")
+            message_parts.append("")
+        
+        message_parts.append(
+            f"**Storage Info:**\n"
+            f"📊 History Entries: {stats['total_history_entries']}\n"
+            f"💾 Data File: {'✅' if stats['data_file_exists'] else '❌'}\n"
+            f"📚 History File: {'✅' if stats['history_file_exists'] else '❌'}"
+        )
+        
+        await update.message.reply_text('\n'.join(message_parts), parse_mode=ParseMode.MARKDOWN)
         
-        if release:
-            is_new = version_manager.update_version(release)
-            
-            if is_new:
-                parsed = release_parser.parse_release(release)
-                current_version = parsed.get("version", "Unknown")
-                
-                # Send notification to all authorized chats
-                message = release_parser.format_release_for_notification(parsed, include_body=True)
-                
-                for chat_id in authorized_chats:
-                    try:
-                        await Application.get_instance().bot.send_message(
-                            chat_id=chat_id,
-                            text=f"🎉 **New Release Found!**\n\n{message}",
-                            parse_mode='Markdown',
-                            disable_web_page_preview=True
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to send notification to {chat_id}: {e}")
-                
-                version_manager.mark_notification_sent(current_version)
-                
     except Exception as e:
-        logger.error(f"Error in periodic monitoring: {e}")
+        logger.error("Error showing version info: %s", e)
+        await update.message.reply_text(f"❌ Error: {str(e)}")
 
 
-async def start_monitoring_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Start automatic monitoring."""
-    global monitoring_active
+async def notify_chats(messages) -> None:
+    """
+    Send messages to every authorized chat, several chats at a time.
     
-    if monitoring_active:
-        await update.message.reply_text("📡 Monitoring is already active")
+    Each chat receives the messages in order; at most NOTIFICATION_CONCURRENCY
+    chats are being sent to at once. Consecutive duplicate messages are sent once.
+    
+    Args:
+        messages: Markdown message texts to send
+    """
+    messages = [message for i, message in enumerate(messages)
+                if i == 0 or message != messages[i - 1]]
+    semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+    
+    async def send_to_chat(chat_id):
+        async with semaphore:
+            for message in messages:
+                try:
+                    await bot_application.bot.send_message(
+                        chat_id=chat_id,
+                        text=message,
+                        parse_mode=ParseMode.MARKDOWN,
+                        disable_web_page_preview=True
+                    )
+                except Exception as e:
+                    logger.error("Failed to send notification to %s: %s", chat_id, e)
+    
+    await asyncio.gather(*(send_to_chat(chat_id) for chat_id in list(authorized_chats)))
+
+
+# Last payload processed per monitored source. GitHubClient sends conditional
+# requests, and a 304 reply hands back the cached body, so an identical payload
+# means GitHub reported nothing new.
+_last_monitored_payloads = {}
+
+
+def _is_unchanged(source: str, payload) -> bool:
+    """Return True if payload matches the last one processed for source."""
+    previous = _last_monitored_payloads.get(source)
+    return previous is not None and (payload is previous or payload == previous)
+
+
+async def periodic_monitoring() -> None:
+    """Periodic monitoring function that runs in background."""
+    if not monitoring_active:
         return
     
-    monitoring_active = True
-    authorized_chats.add(update.effective_chat.id)
+    logger.info("Running periodic monitoring check...")
+    
+    # Fetch release, commits and changelog concurrently
+    release, commits, changelog = await asyncio.gather(
+        github_client.get_latest_release_async(force=True),
+        github_client.get_commits_async(per_page=3, force=True),
+        # Only the newest entries are notified, so fetch just the top of the file
+        github_client.get_file_head_async('CHANGELOG.md', force=True),
+        return_exceptions=True
+    )
+    
+    # (kind, message) pairs to send to every authorized chat
+    changes_detected = []
+    notified_version = None
+    
+    if isinstance(release, Exception):
+        logger.error("Error checking releases: %s", release)
+    elif release and not _is_unchanged('release', release):
+        try:
+            result = await asyncio.to_thread(
+                release_parser.handle_release_for_monitor, release, version_manager
+            )
+            if result:
+                notified_version, message = result
+                changes_detected.append(('release', f"🎉 **New Release Found!**\n\n{message}"))
+            _last_monitored_payloads['release'] = release
+        except Exception as e:
+            logger.error("Error processing release: %s", e)
     
-    # Schedule periodic checks
+    if isinstance(commits, Exception):
+        logger.error("Error checking commits: %s", commits)
+    elif commits and not _is_unchanged('commits', commits):
+        try:
+            message = await asyncio.to_thread(
+                release_parser.handle_commits_for_monitor, commits, version_manager, 3
+            )
+            if message:
+                changes_detected.append(('commits', f"🆕 **New Commits**\n\n{message}"))
+            _last_monitored_payloads['commits'] = commits
+        except Exception as e:
+            logger.error("Error processing commits: %s", e)
+    
+    if isinstance(changelog, Exception):
+        # Repositories without a changelog are expected, not an error
+        if 'not found' in str(changelog).lower():
+            logger.debug("No CHANGELOG.md to check: %s", changelog)
+        else:
+            logger.error("Error checking changelog: %s", changelog)
+    elif changelog and not version_manager.is_changelog_unchanged(changelog):
+        # The persisted content hash also covers the first check after a
+        # restart, and skips the update, history write and parse entirely
+        try:
+            is_new_changelog = await asyncio.to_thread(version_manager.update_changelog, changelog)
+            if is_new_changelog:
+                # Parsing a large changelog would stall command handlers on the loop
+                entries = await asyncio.to_thread(extract_changelog_entries, changelog, 1)
+                if entries:
+                    changes_detected.append(('changelog', f"📋 **CHANGELOG Updated**\n\n{entries[0]}"))
+        except Exception as e:
+            logger.error("Error processing changelog: %s", e)
+    
+    if not changes_detected or bot_application is None:
+        return
+    
+    # Send notifications to all authorized chats
+    await notify_chats([message for _, message in changes_detected])
+    
+    if notified_version:
+        await asyncio.to_thread(version_manager.mark_notification_sent, notified_version)
+
+
+def _ensure_periodic_job() -> None:
+    """Schedule periodic checks, replacing any existing job, and start the scheduler."""
+    # replace_existing makes a separate get_job() check unnecessary
     scheduler.add_job(
         periodic_monitoring,
         trigger=IntervalTrigger(minutes=config.check_interval_minutes),
@@ -297,15 +518,36 @@ async def start_monitoring_command(update: Update, context: ContextTypes.DEFAULT
     
     if not scheduler.running:
         scheduler.start()
+
+
+async def _delayed_initial_check() -> None:
+    """Run the first monitoring check a few seconds after monitoring starts."""
+    await asyncio.sleep(INITIAL_CHECK_DELAY_SECONDS)
+    await periodic_monitoring()
+
+
+async def start_monitoring_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Start automatic monitoring."""
+    global monitoring_active, initial_check_task
+    
+    if monitoring_active:
+        await update.message.reply_text("📡 Monitoring is already active")
+        return
+    
+    monitoring_active = True
+    await add_subscriber(update.effective_chat.id)
+    
+    _ensure_periodic_job()
+    
+    # Run a first check shortly instead of waiting a full interval
+    initial_check_task = asyncio.create_task(_delayed_initial_check())
     
     await update.message.reply_text(
-        f"✅ **Monitoring Started**\n\n"
-        f"I will check for new releases every {config.check_interval_minutes} minutes.\n"
-        f"You'll receive notifications when new releases are found.",
-        parse_mode='Markdown'
+        _render(MONITORING_STARTED_TEXT, interval=config.check_interval_minutes),
+        parse_mode=ParseMode.MARKDOWN
     )
     
-    logger.info(f"Started monitoring for chat {update.effective_chat.id}")
+    logger.info("Started monitoring for chat %s", update.effective_chat.id)
 
 
 async def stop_monitoring_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -324,14 +566,9 @@ async def stop_monitoring_command(update: Update, context: ContextTypes.DEFAULT_
     except:
         pass
     
-    await update.message.reply_text(
-        "⏹️ **Monitoring Stopped**\n\n"
-        "Automatic checking has been disabled.\n"
-        "Use `/start_monitoring` to resume.",
-        parse_mode='Markdown'
-    )
+    await update.message.reply_text(MONITORING_STOPPED_TEXT, parse_mode=ParseMode.MARKDOWN)
     
-    logger.info(f"Stopped monitoring for chat {update.effective_chat.id}")
+    logger.info("Stopped monitoring for chat %s", update.effective_chat.id)
 
 
 def start_ipc_server():
@@ -342,7 +579,11 @@ def start_ipc_server():
 
 async def post_init(application: Application) -> None:
     """Initialize the bot after startup."""
-    global approval_handler, ipc_server_thread
+    global approval_handler, ipc_server_thread, bot_application
+    
+    bot_application = application
+    authorized_chats.update(await asyncio.to_thread(_load_subscribers))
+    logger.info(f"Loaded {len(authorized_chats)} subscribed chats")
     
     # Start IPC server in background thread
     ipc_server_thread = threading.Thread(target=start_ipc_server, daemon=True)
@@ -362,6 +603,7 @@ async def post_init(application: Application) -> None:
         BotCommand("status", "Show bot status"),
         BotCommand("check", "Check for new releases"),
         BotCommand("latest", "Show latest release"),
+        BotCommand("version", "Show version tracking info"),
         BotCommand("start_monitoring", "Start automatic monitoring"),
         BotCommand("stop_monitoring", "Stop automatic monitoring"),
         BotCommand("start_approval", "Start approval monitoring"),
@@ -375,7 +617,16 @@ async def post_init(application: Application) -> None:
 def main() -> None:
     """Start the bot."""
     # Create application
-    application = Application.builder().token(BOT_TOKEN).post_init(post_init).build()
+    # Handle updates concurrently so a slow GitHub call doesn't queue other commands
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .concurrent_updates(True)
+        .connection_pool_size(TELEGRAM_CONNECTION_POOL_SIZE)
+        .pool_timeout(TELEGRAM_POOL_TIMEOUT)
+        .post_init(post_init)
+        .build()
+    )
     
     # Register command handlers
     application.add_handler(CommandHandler("start", start))
@@ -383,6 +634,7 @@ def main() -> None:
     application.add_handler(CommandHandler("status", status))
     application.add_handler(CommandHandler("check", check_command))
     application.add_handler(CommandHandler("latest", latest_command))
+    application.add_handler(CommandHandler("version", version_command))
     application.add_handler(CommandHandler("start_monitoring", start_monitoring_command))
     application.add_handler(CommandHandler("stop_monitoring", stop_monitoring_command))
     
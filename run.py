@@ -11,6 +11,11 @@ import sys
 import logging
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup (not available on Windows); fall back to asyncio
+    uvloop = None
+
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -38,8 +43,8 @@ class GracefulShutdown:
         self.shutdown_requested = True
         
         if self.bot:
-            # Create a new event loop task for shutdown
-            asyncio.create_task(self.bot.stop())
+            # run_forever() tears the bot down once it wakes up
+            self.bot.request_stop()
     
     def setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -130,6 +135,10 @@ def run_bot() -> None:
         if sys.platform == 'win32':
             # Windows-specific event loop policy
             asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        elif uvloop is not None:
+            # libuv-based loop with cheaper callback scheduling than stock asyncio
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
         
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
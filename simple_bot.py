@@ -6,11 +6,13 @@ Supports monitoring multiple GitHub repositories including Claude Code and OpenA
 
 import logging
 import os
+import sys
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
 from telegram.ext import (
     Application, 
     CommandHandler, 
@@ -24,7 +26,7 @@ from telegram.ext import (
 from src.config import Config, ConfigError
 from src.github_client import GitHubClient, GitHubAPIError, RateLimitError
 from src.version_manager import VersionManager, VersionError
-from src.release_parser import ReleaseParser
+from src.release_parser import ReleaseParser, extract_changelog_entries
 from src.utils import setup_logging, format_datetime
 from src.repository_manager import repository_manager, Repository
 
@@ -58,67 +60,85 @@ if AUTHORIZED_USER_IDS:
 else:
     COMMAND_ACCESS_FILTER = PRIVATE_CHAT_FILTER
 
+# Message text that only depends on configuration, built once at startup
+START_TEXT = (
+    '🤖 *Multi-Repository Release Monitor Bot*\n\n'
+    'I can monitor multiple GitHub repositories for new releases and updates.\n\n'
+    '*Available Repositories:*\n'
+    '• **Claude Code** - Anthropic\'s official CLI\n'
+    '• **OpenAI Codex** - OpenAI\'s Codex system\n\n'
+    'Please select a repository to monitor:'
+)
 
+HELP_COMMANDS_TEXT = (
+    '*Commands:*\n'
+    '• `/start` - Select repository to monitor\n'
+    '• `/switch` - Switch to a different repository\n'
+    '• `/help` - This help message\n'
+    '• `/status` - Bot status and GitHub connection info\n'
+    '• `/check` - Check for new releases and commits\n'
+    '• `/latest` - Show latest release or changelog entry\n'
+    '• `/commits` - Show recent commits from the repository\n'
+    '• `/commit <sha>` - Show detailed information about a specific commit\n'
+    '• `/changelog` - Show recent CHANGELOG.md updates\n'
+    '• `/changelog\\_latest` - Show only the latest changelog entry\n\n'
+    '*Features:*\n'
+    '🔄 Multi-repository support\n'
+    '📝 Commit monitoring for repositories\n'
+    '📋 CHANGELOG.md change detection\n'
+    '⚡ Manual release and commit checking\n'
+    '📊 Version and commit history tracking\n'
+    '🔗 GitHub API integration\n'
+    '🕒 Rate limit handling\n\n'
+    '*Current Configuration:*\n'
+)
 
-def _is_version_header(line: str) -> bool:
-    """Return True if the provided line looks like a changelog version header."""
-    if not line or not line.startswith("#"):
-        return False
-
-    hashes = len(line) - len(line.lstrip("#"))
-    if hashes == 0 or hashes > 3:
-        return False
-
-    title = line[hashes:].strip()
-    if not title:
-        return False
-
-    lowered = title.lower()
-    return (
-        "version" in lowered
-        or lowered.startswith("v")
-        or any(char.isdigit() for char in lowered)
-    )
-
-
-def extract_changelog_entries(
-    content: str,
-    max_entries: int = 1,
-    entry_char_limit: int = 1200,
-) -> List[str]:
-    """Extract up to max_entries changelog sections from raw content."""
-    entries: List[str] = []
-    current: List[str] = []
-    current_length = 0
-    in_entry = False
-
-    for raw_line in content.splitlines():
-        stripped = raw_line.strip()
+HELP_FOOTER_TEXT = (
+    f'• GitHub API: {"Authenticated" if config.github_api_token else "Anonymous"}\n\n'
+    '📝 The bot stores version data separately for each repository.'
+)
 
-        if _is_version_header(stripped):
-            if current:
-                entries.append("\n".join(current).strip())
-                if len(entries) >= max_entries:
-                    return entries
+STATUS_SYSTEM_TEXT = (
+    '*System Status:*\n'
+    '✅ Bot: Running\n'
+    '✅ Telegram: Connected\n'
+)
 
-            current = [stripped]
-            current_length = len(stripped)
-            in_entry = True
-            continue
+STATUS_AUTH_TEXT = f'🔑 API Auth: {"Yes" if config.github_api_token else "No (rate limited)"}\n\n'
 
-        if not in_entry:
-            continue
+STATUS_CONFIG_TEXT = (
+    '*Configuration:*\n'
+    f'🔄 Max Retries: {config.max_retries}\n'
+)
 
-        line_to_add = stripped if stripped else ""
-        prospective_length = current_length + len(line_to_add) + 1
-        if entry_char_limit is None or prospective_length <= entry_char_limit:
-            current.append(line_to_add)
-            current_length = prospective_length
 
-    if current and len(entries) < max_entries:
-        entries.append("\n".join(current).strip())
+# Longest changelog entry shown by /changelog, and by /changelog_latest
+CHANGELOG_ENTRY_CHAR_LIMIT = 800
+CHANGELOG_LATEST_CHAR_LIMIT = 1200
+
+_DATE_FMT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Printed once handlers are registered
+HANDLERS_BANNER_TEXT = (
+    "\nBot handlers registered successfully:\n"
+    "  /start - Select repository to monitor\n"
+    "  /switch - Switch to different repository\n"
+    "  /help - Show help information\n"
+    "  /status - Show bot status and GitHub connection\n"
+    "  /check - Check for new releases and commits\n"
+    "  /latest - Show latest release or changelog entry\n"
+    "  /commits - Show recent commits from repository\n"
+    "  /commit <sha> - Show detailed info about a specific commit\n"
+    "  /changelog - Show recent CHANGELOG.md updates\n"
+    "  /changelog_latest - Show only the latest changelog entry\n"
+    "\n"
+    "Starting bot polling...\n"
+    "Press Ctrl+C to stop the bot\n"
+)
 
-    return entries
+# Telegram HTTP connection pool shared by concurrently handled updates
+TELEGRAM_CONNECTION_POOL_SIZE = 32
+TELEGRAM_POOL_TIMEOUT = 10.0
 
 
 def format_changelog_timestamp(commit_data: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -132,11 +152,11 @@ def format_changelog_timestamp(commit_data: Optional[Dict[str, Any]]) -> Optiona
         return None
 
     try:
-        commit_dt = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-    except ValueError:
+        commit_dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
         return date_str
 
-    return format_datetime(commit_dt.replace(tzinfo=timezone.utc))
+    return format_datetime(commit_dt.astimezone(timezone.utc), _DATE_FMT)
 
 
 def build_changelog_message(
@@ -165,7 +185,7 @@ def build_changelog_message(
             "",
             entry,
             "",
-            f"[View {changelog_path} on GitHub](https://github.com/{repo.full_name}/blob/main/{changelog_path})",
+            f"[View {changelog_path} on GitHub]({repo.changelog_url})",
         ]
     )
 
@@ -251,13 +271,8 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     
     # Show repository selection
     await update.message.reply_text(
-        '🤖 *Multi-Repository Release Monitor Bot*\n\n'
-        'I can monitor multiple GitHub repositories for new releases and updates.\n\n'
-        '*Available Repositories:*\n'
-        '• **Claude Code** - Anthropic\'s official CLI\n'
-        '• **OpenAI Codex** - OpenAI\'s Codex system\n\n'
-        'Please select a repository to monitor:',
-        parse_mode='Markdown',
+        START_TEXT,
+        parse_mode=ParseMode.MARKDOWN,
         reply_markup=get_repository_keyboard()
     )
 
@@ -273,32 +288,15 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         repo_text = get_current_repo_text(user_id)
 
     await update.message.reply_text(
-        '📚 *Multi-Repository Monitor Bot Help*\n\n'
-        f'{repo_text}\n\n'
-        '*Commands:*\n'
-        '• `/start` - Select repository to monitor\n'
-        '• `/switch` - Switch to a different repository\n'
-        '• `/help` - This help message\n'
-        '• `/status` - Bot status and GitHub connection info\n'
-        '• `/check` - Check for new releases and commits\n'
-        '• `/latest` - Show latest release or changelog entry\n'
-        '• `/commits` - Show recent commits from the repository\n'
-        '• `/commit <sha>` - Show detailed information about a specific commit\n'
-        '• `/changelog` - Show recent CHANGELOG.md updates\n'
-        '• `/changelog\\_latest` - Show only the latest changelog entry\n\n'
-        '*Features:*\n'
-        '🔄 Multi-repository support\n'
-        '📝 Commit monitoring for repositories\n'
-        '📋 CHANGELOG.md change detection\n'
-        '⚡ Manual release and commit checking\n'
-        '📊 Version and commit history tracking\n'
-        '🔗 GitHub API integration\n'
-        '🕒 Rate limit handling\n\n'
-        '*Current Configuration:*\n'
-        f'• Repository: `{repo.full_name}`\n'
-        f'• GitHub API: {"Authenticated" if config.github_api_token else "Anonymous"}\n\n'
-        '📝 The bot stores version data separately for each repository.',
-        parse_mode='Markdown'
+        ''.join((
+            '📚 *Multi-Repository Monitor Bot Help*\n\n',
+            repo_text,
+            '\n\n',
+            HELP_COMMANDS_TEXT,
+            f'• Repository: `{repo.full_name}`\n',
+            HELP_FOOTER_TEXT,
+        )),
+        parse_mode=ParseMode.MARKDOWN
     )
 
 async def switch_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -306,7 +304,7 @@ async def switch_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     await update.message.reply_text(
         '🔄 *Switch Repository*\n\n'
         'Select a repository to monitor:',
-        parse_mode='Markdown',
+        parse_mode=ParseMode.MARKDOWN,
         reply_markup=get_repository_keyboard()
     )
 
@@ -340,7 +338,7 @@ async def handle_repository_selection(update: Update, context: ContextTypes.DEFA
                 f'/commits - Show recent commits\n'
                 f'/switch - Switch to different repository\n\n'
                 f'You can now use any command to interact with this repository.',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
         else:
             await query.answer("Error selecting repository", show_alert=True)
@@ -351,29 +349,30 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     repo = repository_manager.get_user_repository(user_id)
     repo_key = repository_manager.get_user_repo_key(user_id)
     github_client = get_github_client(repo_key)
+    version_manager = get_version_manager(repo_key)
 
     try:
-        # Test GitHub connection for this repository
-        success, message = github_client.test_connection()
+        # Test GitHub connection off the event loop while gathering local stats
+        (success, message), all_stats = await asyncio.gather(
+            asyncio.to_thread(github_client.test_connection),
+            asyncio.to_thread(version_manager.get_all_statistics)
+        )
         github_status = "✅ Connected" if success else f"❌ Error: {message}"
 
-        # Get rate limit info
+        # Rate limit info reflects the headers of the connection test response
         rate_limit = github_client.get_rate_limit_status()
         
-        # Get version manager stats for this repository
-        version_stats = version_manager.get_statistics()
-        commit_stats = version_manager.get_commit_statistics()
-        changelog_stats = version_manager.get_changelog_statistics()
+        version_stats = all_stats["version"]
+        commit_stats = all_stats["commit"]
         
-        status_message = (
-            f'📊 *Repository Monitor Status*\n\n'
-            f'{get_current_repo_text(user_id)}\n\n'
-            '*System Status:*\n'
-            '✅ Bot: Running\n'
-            '✅ Telegram: Connected\n'
+        status_message = ''.join((
+            '📊 *Repository Monitor Status*\n\n',
+            get_current_repo_text(user_id),
+            '\n\n',
+            STATUS_SYSTEM_TEXT,
             f'🔗 GitHub API: {github_status}\n'
-            f'📦 Repository: `{repo.full_name}`\n'
-            f'🔑 API Auth: {"Yes" if config.github_api_token else "No (rate limited)"}\n\n'
+            f'📦 Repository: `{repo.full_name}`\n',
+            STATUS_AUTH_TEXT,
             '*Rate Limiting:*\n'
             f'⚡ Remaining: {rate_limit["remaining"] or "Unknown"}\n'
             f'🔄 Reset Time: {rate_limit["reset_time"] or "Unknown"}\n\n'
@@ -386,14 +385,13 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             f'📝 Last Commit: {commit_stats["last_known_commit_sha"][:8] if commit_stats["last_known_commit_sha"] else "None"}\n'
             f'📊 Commit Checks: {commit_stats["commit_check_count"]}\n'
             f'📈 New Commits: {commit_stats["new_commits_detected"]}\n'
-            f'💾 History Entries: {version_stats["total_history_entries"]}\n\n'
-            '*Configuration:*\n'
-            f'🔄 Max Retries: {config.max_retries}\n'
+            f'💾 History Entries: {version_stats["total_history_entries"]}\n\n',
+            STATUS_CONFIG_TEXT,
             f'📍 Data Directory: `{version_manager.data_file.parent}`\n\n'
-            '🚀 *Multi-Repository GitHub Integration*'
-        )
+            '🚀 *Multi-Repository GitHub Integration*',
+        ))
         
-        await update.message.reply_text(status_message, parse_mode='Markdown')
+        await update.message.reply_text(status_message, parse_mode=ParseMode.MARKDOWN)
         
     except Exception as e:
         logger.error(f"Error in status command: {e}")
@@ -401,7 +399,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             '❌ *Error getting status*\n\n'
             f'An error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -424,11 +422,48 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             f'🔍 *Checking for new releases...*\n\n'
             f'Repository: `{repo.full_name}`{repo_note}\n'
             f'Please wait while I query the GitHub API.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
         
-        # Get latest release from GitHub for this repository
-        release_data = await github_client.get_latest_release_async()
+        # Out of request budget: answer from the last stored check instead
+        if not github_client.has_request_budget():
+            cached_release = version_manager.get_latest_release_data()
+            cached_commit = version_manager.get_latest_commit_data()
+            if cached_release:
+                summary = 'Latest release: ' + release_parser.format_release_summary(
+                    release_parser.parse_release(cached_release)
+                )
+            elif cached_commit:
+                summary = 'Latest commit: ' + release_parser.format_commit_summary(
+                    release_parser.parse_commit(cached_commit)
+                )
+            else:
+                summary = 'No cached data available yet.'
+            
+            await status_message.edit_text(
+                '⏳ *Using cached data due to rate limit*\n\n'
+                f'Repository: `{repo.full_name}`\n'
+                f'{summary}\n\n'
+                'GitHub requests are cooling down. Please try again in a minute.',
+                parse_mode=ParseMode.MARKDOWN,
+                disable_web_page_preview=True
+            )
+            return
+        
+        # Get latest release from GitHub for this repository. Unless this
+        # repository is known to publish releases, fetch recent commits in
+        # parallel so the no-release fallback doesn't need another round-trip.
+        commits_data = None
+        if version_manager.get_last_known_version():
+            release_data = await github_client.get_latest_release_async(force=True)
+        else:
+            release_data, commits_data = await asyncio.gather(
+                github_client.get_latest_release_async(force=True),
+                github_client.get_commits_async(per_page=10, force=True),
+                return_exceptions=True
+            )
+            if isinstance(release_data, Exception):
+                raise release_data
         
         if not release_data:
             # No releases found, check for commits instead
@@ -436,28 +471,31 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 '❌ *No releases found*\n\n'
                 f'No releases found for `{repo.full_name}`.\n'
                 'Checking for recent commits instead...',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
             
             # Get recent commits
             try:
-                commits_data = await github_client.get_commits_async(per_page=10)
+                if commits_data is None:
+                    commits_data = await github_client.get_commits_async(per_page=10, force=True)
+                elif isinstance(commits_data, Exception):
+                    raise commits_data
                 
                 if not commits_data:
                     await status_message.edit_text(
                         '❌ *No data found*\n\n'
                         f'No releases or commits found for repository `{repo.full_name}`.\n'
                         'Please verify the repository exists and is public.',
-                        parse_mode='Markdown'
+                        parse_mode=ParseMode.MARKDOWN
                     )
                     return
                 
                 # Parse and check for new commits
                 latest_commit = commits_data[0]
-                parsed_commits = [release_parser.parse_commit(commit) for commit in commits_data[:5]]
+                parsed_commits = release_parser.parse_commits(commits_data, limit=5)
                 
                 # Check if latest commit is new
-                is_new_commit = version_manager.update_commit(latest_commit)
+                is_new_commit = await asyncio.to_thread(version_manager.update_commit, latest_commit)
                 
                 if is_new_commit:
                     # New commit found!
@@ -466,7 +504,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                         f'🆕 *New Commits Found!*\n\n'
                         f'Repository: `{repo.full_name}`\n\n'
                         f'{commits_message}',
-                        parse_mode='Markdown',
+                        parse_mode=ParseMode.MARKDOWN,
                         disable_web_page_preview=True
                     )
                 else:
@@ -479,7 +517,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                         f'Latest commit: {latest_commit_summary}\n'
                         f'This is the same as the last check.\n\n'
                         f'{commits_preview}',
-                        parse_mode='Markdown',
+                        parse_mode=ParseMode.MARKDOWN,
                         disable_web_page_preview=True
                     )
                 
@@ -489,7 +527,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                     '❌ *Error checking commits*\n\n'
                     f'Failed to fetch commits: {str(e)}\n\n'
                     'Please try again later.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             return
         
@@ -497,7 +535,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         parsed_release = release_parser.parse_release(release_data)
         
         # Check if it's a new version
-        is_new = version_manager.update_version(release_data)
+        is_new = await asyncio.to_thread(version_manager.update_version, release_data)
         
         if is_new:
             # New version found!
@@ -506,7 +544,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 f'🎉 *New Release Found!*\n\n'
                 f'Repository: `{repo.full_name}`\n\n'
                 f'{notification}',
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
         else:
@@ -518,7 +556,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 f'Latest release: {summary}\n'
                 f'This is the same version as last check.\n\n'
                 f'🔗 [View Release]({parsed_release["url"]})',
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
         
@@ -527,14 +565,14 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             '⏱️ *Rate Limit Exceeded*\n\n'
             f'GitHub API rate limit exceeded: {e}\n\n'
             'Please try again later or add a GitHub API token for higher limits.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except GitHubAPIError as e:
         await update.message.reply_text(
             '❌ *GitHub API Error*\n\n'
             f'Failed to fetch release data: {e}\n\n'
             'Please check the repository and try again.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except Exception as e:
         logger.error(f"Error in check command: {e}")
@@ -542,7 +580,7 @@ async def check_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             '❌ *Error checking releases*\n\n'
             f'An unexpected error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -570,7 +608,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     )
                     await update.message.reply_text(
                         message,
-                        parse_mode='Markdown',
+                        parse_mode=ParseMode.MARKDOWN,
                         disable_web_page_preview=True,
                     )
                     return
@@ -578,7 +616,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             status_msg = await update.message.reply_text(
                 f'*Fetching latest changelog entry...*\n\n'
                 f'Repository: `{repo.full_name}`',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
 
             changelog_content = await github_client.get_file_content_async(changelog_file)
@@ -588,11 +626,11 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     '*CHANGELOG not found*\n\n'
                     f'No {changelog_file} file found in repository `{repo.full_name}`.\n\n'
                     'The repository may not maintain a changelog file.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
 
-            version_manager.update_changelog(changelog_content)
+            await asyncio.to_thread(version_manager.update_changelog, changelog_content)
             entries = extract_changelog_entries(changelog_content, max_entries=1)
 
             if not entries:
@@ -600,7 +638,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     '*No changelog entries found*\n\n'
                     f'{changelog_file} exists but no version entries were detected.\n\n'
                     'The changelog format may not be recognized.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
 
@@ -616,7 +654,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
             await status_msg.edit_text(
                 message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
             return
@@ -640,7 +678,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             status_msg = await update.message.reply_text(
                 f'*Fetching latest release...*\n\n'
                 f'Repository: `{repo.full_name}`',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
             
             release_data = await github_client.get_latest_release_async()
@@ -649,7 +687,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 await status_msg.edit_text(
                     '*No releases found*\n\n'
                     f'No releases found for repository `{repo.full_name}`.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
@@ -662,14 +700,14 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             
             await status_msg.edit_text(
                 f'Repository: `{repo.full_name}`\n\n' + message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
             return
         
         await update.message.reply_text(
             message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.MARKDOWN,
             disable_web_page_preview=True
         )
         
@@ -679,7 +717,7 @@ async def latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             '❌ *Error fetching latest release*\n\n'
             f'An error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def commits_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -696,7 +734,7 @@ async def commits_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             f'🔍 *Fetching recent commits...*\n\n'
             f'Repository: `{repo.full_name}`\n'
             f'Please wait while I query the GitHub API.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
         
         # Get recent commits from GitHub
@@ -707,36 +745,35 @@ async def commits_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 '❌ *No commits found*\n\n'
                 f'No commits were found for repository `{repo.full_name}`.\n'
                 'This might indicate a private repository or invalid repository name.',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
             return
         
         # Parse commits
-        parsed_commits = [release_parser.parse_commit(commit) for commit in commits_data]
+        parsed_commits = release_parser.parse_commits(commits_data, limit=8)
         
         # Update latest commit tracking
         if parsed_commits:
             latest_commit = commits_data[0]
-            is_new_commit = version_manager.update_commit(latest_commit)
+            is_new_commit = await asyncio.to_thread(version_manager.update_commit, latest_commit)
         
         # Format commits for display
-        commits_message = release_parser.format_commits_for_notification(parsed_commits, limit=8)
+        commits_message = release_parser.format_commits_for_notification(
+            parsed_commits, limit=8, total=len(commits_data)
+        )
         
         # Build full message
-        header = f'📝 *Recent Commits - {repo.full_name}*\n\n'
-        
-        if is_new_commit:
-            header += '🆕 *Latest commit is new since last check!*\n\n'
-        
-        full_message = header + commits_message
-        
-        # Add repository link
-        repo_url = f"https://github.com/{repo.full_name}/commits"
-        full_message += f'\n\n🔗 [View all commits on GitHub]({repo_url})'
+        new_commit_note = '🆕 *Latest commit is new since last check!*\n\n' if is_new_commit else ''
+        full_message = ''.join((
+            f'📝 *Recent Commits - {repo.full_name}*\n\n',
+            new_commit_note,
+            commits_message,
+            f'\n\n🔗 [View all commits on GitHub]({repo.commits_url})',
+        ))
         
         await status_message.edit_text(
             full_message,
-            parse_mode='Markdown',
+            parse_mode=ParseMode.MARKDOWN,
             disable_web_page_preview=True
         )
         
@@ -745,14 +782,14 @@ async def commits_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             '⏱️ *Rate Limit Exceeded*\n\n'
             f'GitHub API rate limit exceeded: {e}\n\n'
             'Please try again later or add a GitHub API token for higher limits.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except GitHubAPIError as e:
         await update.message.reply_text(
             '❌ *GitHub API Error*\n\n'
             f'Failed to fetch commit data: {e}\n\n'
             'Please check the repository and try again.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except Exception as e:
         logger.error(f"Error in commits command: {e}")
@@ -760,7 +797,7 @@ async def commits_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             '❌ *Error fetching commits*\n\n'
             f'An unexpected error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -779,7 +816,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 'Please provide a commit SHA hash.\n\n'
                 '*Usage:* `/commit <sha>`\n\n'
                 '*Example:* `/commit a1b2c3d4`',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
             return
         
@@ -791,7 +828,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 '❌ *Invalid commit SHA*\n\n'
                 'Commit SHA should be at least 7 characters long.\n\n'
                 '*Example:* `/commit a1b2c3d4`',
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
             return
             
@@ -800,7 +837,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             f'🔍 *Fetching commit details...*\n\n'
             f'Repository: `{repo.full_name}`\n'
             f'Looking up commit: `{commit_sha}`',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
         
         # Get commit details from GitHub
@@ -812,7 +849,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     f'❌ *Commit not found*\n\n'
                     f'Could not find commit `{commit_sha}` in repository `{repo.full_name}`.\n\n'
                     'Please verify the SHA is correct.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
@@ -827,16 +864,18 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             
             # Format commit message (full message, not just first line)
             full_message = commit_data.get('commit', {}).get('message', '')
-            message_lines = full_message.split('\n')
-            title = message_lines[0] if message_lines else 'No title'
-            body = '\n'.join(message_lines[1:]).strip() if len(message_lines) > 1 else ''
+            title, _, body = full_message.partition('\n')
+            body = body.strip()
             
             # Build response message
+            author = parsed_commit['author']
+            author_name = author['name'] or author['github_login'] or 'Unknown'
+            commit_date = format_datetime(author['date']) if author['date'] else 'Unknown'
             response_parts = [
                 f'📝 *Commit Details: {commit_sha[:8]}*\n',
                 f'Repository: `{repo.full_name}`\n',
-                f'**Author:** {parsed_commit["author_name"]}',
-                f'**Date:** {parsed_commit["date"]}',
+                f'**Author:** {author_name}',
+                f'**Date:** {commit_date}',
                 f'**SHA:** `{parsed_commit["sha"]}`\n',
                 f'**Title:** {title}'
             ]
@@ -858,12 +897,13 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             # Add files changed preview (first few files)
             files = commit_data.get('files', [])
             if files:
+                status_icons = {'added': '➕', 'modified': '📝', 'removed': '➖'}
                 response_parts.append('\n**Files changed:**')
-                for i, file_info in enumerate(files[:5]):  # Show first 5 files
-                    filename = file_info.get('filename', 'Unknown')
-                    status = file_info.get('status', 'modified')
-                    status_icon = {'added': '➕', 'modified': '📝', 'removed': '➖'}.get(status, '📝')
-                    response_parts.append(f'{status_icon} `{filename}`')
+                response_parts.extend(
+                    f"{status_icons.get(file_info.get('status', 'modified'), '📝')} "
+                    f"`{file_info.get('filename', 'Unknown')}`"
+                    for file_info in files[:5]  # Show first 5 files
+                )
                 
                 if len(files) > 5:
                     response_parts.append(f'... and {len(files) - 5} more files')
@@ -872,25 +912,24 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             if files and 'patch' in files[0]:
                 first_file_patch = files[0].get('patch', '')
                 if first_file_patch:
-                    # Get first few lines of the diff
-                    patch_lines = first_file_patch.split('\n')[:10]
-                    if patch_lines:
-                        response_parts.append('\n**Diff preview:**')
-                        response_parts.append('```diff')
-                        response_parts.append('\n'.join(patch_lines))
-                        if len(first_file_patch.split('\n')) > 10:
-                            response_parts.append('...')
-                        response_parts.append('```')
+                    # Get first few lines of the diff; an 11th piece means there is more
+                    patch_lines = first_file_patch.split('\n', 10)
+                    response_parts.extend([
+                        '\n**Diff preview:**',
+                        '```diff',
+                        '\n'.join(patch_lines[:10]),
+                        *(['...'] if len(patch_lines) > 10 else []),
+                        '```'
+                    ])
             
             # Add GitHub link
-            commit_url = f"https://github.com/{repo.full_name}/commit/{parsed_commit['sha']}"
-            response_parts.append(f'\n🔗 [View on GitHub]({commit_url})')
+            response_parts.append(f'\n🔗 [View on GitHub]({repo.commit_url(parsed_commit["sha"])})')
             
             response_message = '\n'.join(response_parts)
             
             await status_message.edit_text(
                 response_message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
             
@@ -900,13 +939,13 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                     f'❌ *Commit not found*\n\n'
                     f'Commit `{commit_sha}` was not found in repository `{repo.full_name}`.\n\n'
                     'Please verify the SHA is correct.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             else:
                 await status_message.edit_text(
                     f'❌ *GitHub API Error*\n\n'
                     f'Error fetching commit: {api_error}',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             
     except RateLimitError as e:
@@ -914,7 +953,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             '⏱️ *Rate Limit Exceeded*\n\n'
             f'GitHub API rate limit exceeded: {e}\n\n'
             'Please try again later or add a GitHub API token for higher limits.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except Exception as e:
         logger.error(f"Error in commit command: {e}")
@@ -922,7 +961,7 @@ async def commit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             '❌ *Error fetching commit details*\n\n'
             f'An unexpected error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def changelog_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -939,96 +978,59 @@ async def changelog_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             f'🔍 *Looking for CHANGELOG.md...*\n\n'
             f'Repository: `{repo.full_name}`\n'
             f'Searching for changelog updates.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
         
-        # Try to get CHANGELOG.md content
+        # Try to get CHANGELOG.md content, fetching its last update time alongside
         try:
-            changelog_content = await github_client.get_file_content_async('CHANGELOG.md')
+            changelog_content, last_commit = await asyncio.gather(
+                github_client.get_file_content_async('CHANGELOG.md'),
+                github_client.get_file_last_commit_async('CHANGELOG.md'),
+                return_exceptions=True
+            )
+            if isinstance(changelog_content, Exception):
+                raise changelog_content
+            if isinstance(last_commit, Exception):
+                logger.warning("Could not fetch CHANGELOG.md last commit: %s", last_commit)
+                last_commit = None
             
             if not changelog_content:
                 await status_message.edit_text(
                     '❌ *CHANGELOG.md not found*\n\n'
                     f'No CHANGELOG.md file found in repository `{repo.full_name}`.\n\n'
                     'The repository may not maintain a changelog file.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
-            version_manager.update_changelog(changelog_content)
-            
-            # Parse changelog content to get recent entries
-            changelog_lines = changelog_content.split('\n')
-            
-            # Find recent entries (look for version headers like ## v1.2.3 or # Version 1.2.3)
-            recent_entries = []
-            current_entry = []
-            entry_count = 0
-            max_entries = 3  # Show last 3 changelog entries
-            
-            in_entry = False
-            
-            for line in changelog_lines:
-                line = line.strip()
-                
-                # Check if this is a version header
-                if ((line.startswith('##') and ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line))) or
-                   (line.startswith('#') and line.count('#') <= 2 and 
-                   ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line)))):
-                    
-                    # Save previous entry if we have one
-                    if current_entry and entry_count < max_entries:
-                        recent_entries.append('\n'.join(current_entry))
-                        entry_count += 1
-                    
-                    if entry_count >= max_entries:
-                        break
-                        
-                    # Start new entry
-                    current_entry = [line]
-                    in_entry = True
-                    
-                elif in_entry and line:
-                    # Add content to current entry (limit length)
-                    if len('\n'.join(current_entry)) < 800:  # Limit entry length
-                        current_entry.append(line)
+            await asyncio.to_thread(version_manager.update_changelog, changelog_content)
             
-            # Add the last entry if we haven't reached the limit
-            if current_entry and entry_count < max_entries:
-                recent_entries.append('\n'.join(current_entry))
+            # Show the last 3 changelog entries
+            recent_entries = extract_changelog_entries(
+                changelog_content,
+                max_entries=3,
+                entry_char_limit=CHANGELOG_ENTRY_CHAR_LIMIT,
+                skip_blank_lines=True
+            )
             
             if not recent_entries:
                 await status_message.edit_text(
                     '❌ *No changelog entries found*\n\n'
                     f'CHANGELOG.md exists but no version entries were found.\n\n'
                     'The changelog format may not be recognized.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
-            # Get the actual last update time of CHANGELOG.md from GitHub
-            from datetime import datetime
-            last_commit = await github_client.get_file_last_commit_async('CHANGELOG.md')
-            
             # Build response message
             response_parts = [
                 f'📋 *Recent CHANGELOG Updates - {repo.full_name}*\n'
             ]
             
             # Add timestamp if available
-            if last_commit and 'commit' in last_commit:
-                commit_date = last_commit['commit']['author']['date']
-                # Parse and format the date nicely
-                try:
-                    from datetime import datetime
-                    dt = datetime.strptime(commit_date, "%Y-%m-%dT%H:%M:%SZ")
-                    formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-                    response_parts.append(f'🕒 *Last Updated:* {formatted_date}\n')
-                except Exception as e:
-                    logger.error(f"Error formatting changelog timestamp: {e}")
-                    response_parts.append(f'🕒 *Last Updated:* {commit_date}\n')
+            formatted_date = format_changelog_timestamp(last_commit)
+            if formatted_date:
+                response_parts.append(f'🕒 *Last Updated:* {formatted_date}\n')
             
             for i, entry in enumerate(recent_entries):
                 if i > 0:
@@ -1036,18 +1038,18 @@ async def changelog_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 response_parts.append(entry)
             
             # Add GitHub link to changelog
-            changelog_url = f"https://github.com/{repo.full_name}/blob/main/CHANGELOG.md"
-            response_parts.append(f'\n\n🔗 [View full CHANGELOG.md]({changelog_url})')
+            changelog_link = f'\n\n🔗 [View full CHANGELOG.md]({repo.changelog_url})'
+            response_parts.append(changelog_link)
             
             response_message = '\n'.join(response_parts)
             
             # Truncate if too long for Telegram
             if len(response_message) > 4000:
-                response_message = response_message[:4000] + '...\n\n🔗 [View full CHANGELOG.md]({changelog_url})'
+                response_message = response_message[:4000 - len(changelog_link) - 3] + '...' + changelog_link
             
             await status_message.edit_text(
                 response_message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
             
@@ -1057,13 +1059,13 @@ async def changelog_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     '❌ *CHANGELOG.md not found*\n\n'
                     f'No CHANGELOG.md file found in repository `{repo.full_name}`.\n\n'
                     'The repository may not maintain a changelog file.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             else:
                 await status_message.edit_text(
                     f'❌ *GitHub API Error*\n\n'
                     f'Error fetching changelog: {api_error}',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             
     except RateLimitError as e:
@@ -1071,15 +1073,15 @@ async def changelog_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             '⏱️ *Rate Limit Exceeded*\n\n'
             f'GitHub API rate limit exceeded: {e}\n\n'
             'Please try again later or add a GitHub API token for higher limits.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except Exception as e:
-        logger.error(f"Error in changelog command: {e}")
+        logger.error("Error in changelog command: %s", e)
         await update.message.reply_text(
             '❌ *Error fetching changelog*\n\n'
             f'An unexpected error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1096,7 +1098,7 @@ async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT
             f'🔍 *Looking for latest changelog entry...*\n\n'
             f'Repository: `{repo.full_name}`\n'
             f'Fetching the most recent changelog update.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
         
         # Try to get CHANGELOG.md content
@@ -1108,53 +1110,31 @@ async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT
                     '❌ *CHANGELOG.md not found*\n\n'
                     f'No CHANGELOG.md file found in repository `{repo.full_name}`.\n\n'
                     'The repository may not maintain a changelog file.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
-            version_manager.update_changelog(changelog_content)
+            await asyncio.to_thread(version_manager.update_changelog, changelog_content)
             
-            # Parse changelog content to get the latest entry only
-            changelog_lines = changelog_content.split('\n')
-            
-            # Find the first (latest) entry
-            latest_entry = []
-            in_entry = False
-            
-            for line in changelog_lines:
-                line = line.strip()
-                
-                # Check if this is a version header
-                if ((line.startswith('##') and ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line))) or
-                   (line.startswith('#') and line.count('#') <= 2 and 
-                   ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line)))):
-                    
-                    if in_entry:
-                        # We found the second header, stop here
-                        break
-                    else:
-                        # Start the first (latest) entry
-                        latest_entry = [line]
-                        in_entry = True
-                        
-                elif in_entry and line:
-                    # Add content to the latest entry (limit length)
-                    if len('\n'.join(latest_entry)) < 1200:  # Slightly larger limit for single entry
-                        latest_entry.append(line)
+            # Get the first (latest) entry only
+            entries = extract_changelog_entries(
+                changelog_content,
+                max_entries=1,
+                entry_char_limit=CHANGELOG_LATEST_CHAR_LIMIT,
+                skip_blank_lines=True
+            )
+            latest_entry = entries[0] if entries else None
             
             if not latest_entry:
                 await status_message.edit_text(
                     '❌ *No changelog entries found*\n\n'
                     f'CHANGELOG.md exists but no version entries were found.\n\n'
                     'The changelog format may not be recognized.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 return
             
             # Get the actual last update time of CHANGELOG.md from GitHub
-            from datetime import datetime
             last_commit = await github_client.get_file_last_commit_async('CHANGELOG.md')
             
             # Build response message
@@ -1163,34 +1143,26 @@ async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT
             ]
             
             # Add timestamp if available
-            if last_commit and 'commit' in last_commit:
-                commit_date = last_commit['commit']['author']['date']
-                # Parse and format the date nicely
-                try:
-                    from datetime import datetime
-                    dt = datetime.strptime(commit_date, "%Y-%m-%dT%H:%M:%SZ")
-                    formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-                    response_parts.append(f'🕒 *Last Updated:* {formatted_date}\n')
-                except Exception as e:
-                    logger.error(f"Error formatting changelog timestamp: {e}")
-                    response_parts.append(f'🕒 *Last Updated:* {commit_date}\n')
+            formatted_date = format_changelog_timestamp(last_commit)
+            if formatted_date:
+                response_parts.append(f'🕒 *Last Updated:* {formatted_date}\n')
             
             # Add the latest entry
-            response_parts.append('\n'.join(latest_entry))
+            response_parts.append(latest_entry)
             
             # Add GitHub link to changelog
-            changelog_url = f"https://github.com/{repo.full_name}/blob/main/CHANGELOG.md"
-            response_parts.append(f'\n\n🔗 [View full CHANGELOG.md]({changelog_url})')
+            changelog_link = f'\n\n🔗 [View full CHANGELOG.md]({repo.changelog_url})'
+            response_parts.append(changelog_link)
             
             response_message = '\n'.join(response_parts)
             
             # Truncate if too long for Telegram
             if len(response_message) > 4000:
-                response_message = response_message[:4000] + '...\n\n🔗 [View full CHANGELOG.md]({changelog_url})'
+                response_message = response_message[:4000 - len(changelog_link) - 3] + '...' + changelog_link
             
             await status_message.edit_text(
                 response_message,
-                parse_mode='Markdown',
+                parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
             
@@ -1200,20 +1172,20 @@ async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT
                     '❌ *CHANGELOG.md not found*\n\n'
                     f'No CHANGELOG.md file found in repository `{repo.full_name}`.\n\n'
                     'The repository may not maintain a changelog file.',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             else:
                 await status_message.edit_text(
                     f'❌ *GitHub API Error*\n\n'
                     f'Error fetching changelog: {api_error}',
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
     except RateLimitError as e:
         await update.message.reply_text(
             '⏱️ *Rate Limit Exceeded*\n\n'
             f'GitHub API rate limit exceeded: {e}\n\n'
             'Please try again later or add a GitHub API token for higher limits.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     except Exception as e:
         logger.error(f"Error in changelog_latest command: {e}")
@@ -1221,26 +1193,48 @@ async def changelog_latest_command(update: Update, context: ContextTypes.DEFAULT
             '❌ *Error fetching latest changelog*\n\n'
             f'An unexpected error occurred: {str(e)}\n\n'
             'Please check the logs for more details.',
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
+async def post_shutdown(application: Application) -> None:
+    """Release GitHub client connections when the bot stops."""
+    for client in github_clients.values():
+        client.close()
+
+
 def main() -> None:
     """Start the bot."""
     
-    print("Starting Multi-Repository Release Monitor Bot...")
-    print(f"Bot Token: {BOT_TOKEN[:10]}...{BOT_TOKEN[-10:] if len(BOT_TOKEN) > 20 else 'SHORT_TOKEN'}")
-    print("\nAvailable Repositories:")
-    for key, repo in repository_manager.get_available_repositories().items():
-        print(f"  - {repo.display_name}: {repo.full_name}")
-    print(f"\nGitHub API: {'Authenticated' if config.github_api_token else 'Anonymous (rate limited)'}")
-    print(f"Data Directory: {config.data_directory}")
+    # Build the startup banner and write it in one call
+    banner = [
+        "Starting Multi-Repository Release Monitor Bot...",
+        f"Bot Token: {BOT_TOKEN[:10]}...{BOT_TOKEN[-10:] if len(BOT_TOKEN) > 20 else 'SHORT_TOKEN'}",
+        "\nAvailable Repositories:",
+    ]
+    banner.extend(
+        f"  - {repo.display_name}: {repo.full_name}"
+        for repo in repository_manager.get_available_repositories().values()
+    )
+    banner.append(f"\nGitHub API: {'Authenticated' if config.github_api_token else 'Anonymous (rate limited)'}")
+    banner.append(f"Data Directory: {config.data_directory}")
     if AUTHORIZED_USER_IDS:
-        print("Authorized users: " + ", ".join(str(uid) for uid in AUTHORIZED_USER_IDS))
+        banner.append("Authorized users: " + ", ".join(str(uid) for uid in AUTHORIZED_USER_IDS))
     else:
-        print("Authorized users: open (no allow-list configured)")
+        banner.append("Authorized users: open (no allow-list configured)")
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
     
     # Create the Application
-    application = Application.builder().token(BOT_TOKEN).build()
+    # Handle updates concurrently so a slow GitHub call doesn't queue other commands
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .concurrent_updates(True)
+        .connection_pool_size(TELEGRAM_CONNECTION_POOL_SIZE)
+        .pool_timeout(TELEGRAM_POOL_TIMEOUT)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
     # Add command handlers
     application.add_handler(CommandHandler("start", start, filters=COMMAND_ACCESS_FILTER))
@@ -1261,21 +1255,8 @@ def main() -> None:
         unauthorized_filter = PRIVATE_CHAT_FILTER & (~filters.User(AUTHORIZED_USER_IDS))
         application.add_handler(MessageHandler(unauthorized_filter, handle_unauthorized_message))
 
-    print("\nBot handlers registered successfully:")
-    print("  /start - Select repository to monitor")
-    print("  /switch - Switch to different repository")
-    print("  /help - Show help information")
-    print("  /status - Show bot status and GitHub connection")
-    print("  /check - Check for new releases and commits")
-    print("  /latest - Show latest release or changelog entry")
-    print("  /commits - Show recent commits from repository")
-    print("  /commit <sha> - Show detailed info about a specific commit")
-    print("  /changelog - Show recent CHANGELOG.md updates")
-    print("  /changelog_latest - Show only the latest changelog entry")
-    print("")
-    
-    print("Starting bot polling...")
-    print("Press Ctrl+C to stop the bot")
+    sys.stdout.write(HANDLERS_BANNER_TEXT)
+    sys.stdout.flush()
 
     try:
         # Run the bot until the user presses Ctrl-C
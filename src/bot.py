@@ -2,31 +2,155 @@
 Telegram bot implementation for CC Release Monitor.
 """
 
+import hashlib
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+import functools
+import time
+from typing import Optional, Dict, Any, Set, Tuple
 from datetime import datetime
+from pathlib import Path
 
 from telegram import Update, Bot, BotCommand
+from telegram.constants import ParseMode
 from telegram.ext import (
     Application,
+    ApplicationHandlerStop,
     CommandHandler,
     ContextTypes,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 from telegram.error import TelegramError, NetworkError, TimedOut
 
 from .config import Config
-from .utils import get_utc_now, format_datetime
+from .utils import get_utc_now, format_datetime, load_json_file, save_json_file
 
 
 logger = logging.getLogger(__name__)
 
+# Per-chat update queues: pending updates per chat, seconds an idle chat worker
+# lingers, and the number of chats whose updates are handled at once
+CHAT_QUEUE_SIZE = 32
+CHAT_WORKER_IDLE_SECONDS = 60
+MAX_CHAT_WORKERS = 64
+
+# Bound on updates fetched from Telegram but not yet dispatched. Once the
+# backlog passes STALE_UPDATE_BACKLOG, messages older than STALE_UPDATE_SECONDS
+# are dropped instead of answered late.
+UPDATE_QUEUE_SIZE = 1024
+STALE_UPDATE_BACKLOG = UPDATE_QUEUE_SIZE * 9 // 10
+STALE_UPDATE_SECONDS = 10
+
+# Only command messages are handled; add update types here as handlers need them
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# An identical error reply to the same chat within this many seconds is dropped
+ERROR_REPLY_DEDUPE_SECONDS = 5.0
+
+# Each user gets at most one "unknown command" reply per this many seconds
+UNKNOWN_REPLY_INTERVAL_SECONDS = 10.0
+
+# Log level and message per error type, looked up by exact type first.
+# TimedOut subclasses NetworkError, so it needs its own entry to be reached.
+_ERROR_LOG: Dict[type, Tuple[int, str]] = {
+    NetworkError: (logging.WARNING, "Network error occurred, bot will retry automatically"),
+    TimedOut: (logging.WARNING, "Request timed out, bot will retry automatically"),
+    TelegramError: (logging.ERROR, "Telegram API error: %s"),
+}
+_UNEXPECTED_ERROR_LOG = (logging.ERROR, "Unexpected error: %s")
+
+# Static replies, built once at import instead of on every command
+_START_MESSAGE = (
+    "🤖 *CC Release Monitor Bot*\n\n"
+    "Welcome! I'm your Claude Code Release Monitor bot.\n\n"
+    "🔍 I can help you monitor Claude Code releases and keep you updated "
+    "with the latest changes and announcements.\n\n"
+    "*Available Commands:*\n"
+    "• /help - Show detailed help information\n"
+    "• /status - Show bot status and statistics\n\n"
+    "📝 *Getting Started:*\n"
+    "Use /help to learn more about my features and capabilities.\n\n"
+    "💡 *Tip:* I'll automatically notify you about new releases when they're available!"
+)
+
+_HELP_MESSAGE = (
+    "📚 *CC Release Monitor Bot Help*\n\n"
+    "*Commands:*\n"
+    "• `/start` - Start the bot and see welcome message\n"
+    "• `/help` - Show this help information\n"
+    "• `/status` - Show bot status and statistics\n\n"
+    "*Features:*\n"
+    "🔔 Automatic release notifications\n"
+    "⏰ Configurable check intervals\n"
+    "🔇 Quiet hours support\n"
+    "📊 Release tracking and statistics\n\n"
+    "*About:*\n"
+    "This bot monitors Claude Code releases and provides timely notifications "
+    "about new versions, updates, and important announcements.\n\n"
+    "🛠️ *Status:* Currently in active development\n"
+    "📅 *Version:* 1.0.0\n\n"
+    "If you encounter any issues or have suggestions, please let us know!"
+)
+
+_STATUS_HEADER = "📊 *Bot Status*\n\n"
+_STATUS_FOOTER = "✅ All systems operational"
+
+_UNKNOWN_MESSAGE = (
+    "❓ *Unknown Command*\n\n"
+    "I don't recognize that command. Here are the available commands:\n\n"
+    "• /start - Start the bot\n"
+    "• /help - Show help information\n"
+    "• /status - Show bot status\n\n"
+    "Use /help for more detailed information."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _format_uptime(total_minutes: int) -> str:
+    """
+    Format an uptime as days, hours and minutes.
+    
+    Cached on the minute so repeated /status calls reuse the string.
+    
+    Args:
+        total_minutes: Uptime in whole minutes
+        
+    Returns:
+        Uptime string such as "1d 2h 3m"
+    """
+    hours, minutes = divmod(total_minutes, 60)
+    days, hours = divmod(hours, 24)
+    return f"{days}d {hours}h {minutes}m"
+
 
 class CCReleaseMonitorBot:
     """CC Release Monitor Telegram Bot."""
     
+    # Fixed attribute layout; counters are bumped on every handled update
+    __slots__ = (
+        "config",
+        "application",
+        "is_running",
+        "start_time",
+        "_mono_start",
+        "commands_processed",
+        "errors_handled",
+        "dropped_updates",
+        "_started_str",
+        "_status_config_block",
+        "_stop_event",
+        "_chat_queues",
+        "_chat_workers",
+        "_worker_semaphore",
+        "_replaying",
+        "_error_replies",
+        "_unknown_replies",
+        "_command_callbacks",
+        "_stats_cache",
+    )
+    
     def __init__(self, config: Config):
         """
         Initialize the bot.
@@ -37,14 +161,42 @@ class CCReleaseMonitorBot:
         self.config = config
         self.application: Optional[Application] = None
         self.is_running = False
-        self.start_time = get_utc_now()
+        self.start_time = get_utc_now()  # for display; uptime uses _mono_start
+        self._mono_start = time.monotonic()
         
-        # Bot statistics
-        self.stats = {
-            "commands_processed": 0,
-            "errors_handled": 0,
-            "uptime_start": self.start_time,
+        # Parts of the /status reply that are fixed for the life of the process
+        self._started_str = format_datetime(self.start_time)
+        self._status_config_block = (
+            "*Configuration:*\n"
+            f"⏲️ Check Interval: {config.check_interval_minutes} minutes\n"
+            f"🔄 Max Retries: {config.max_retries}\n"
+            f"🔔 Notifications: {'Enabled' if config.enable_notifications else 'Disabled'}\n"
+            f"🌙 Quiet Hours: {config.quiet_hours_start}:00 - {config.quiet_hours_end}:00\n\n"
+        )
+        
+        # Set by stop() to end run_forever()
+        self._stop_event = asyncio.Event()
+        
+        # Updates are queued per chat so a slow handler only delays its own chat
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_workers: Set[asyncio.Task] = set()
+        self._worker_semaphore = asyncio.Semaphore(MAX_CHAT_WORKERS)
+        self._replaying: Set[int] = set()  # ids of updates being handled by a worker
+        self._error_replies: Dict[Tuple[int, str], float] = {}  # (chat id, text) -> sent at
+        self._unknown_replies: Dict[int, float] = {}  # user id -> last unknown-command reply
+        
+        # Command name -> handler, routed by _dispatch_command
+        self._command_callbacks = {
+            "start": self.start_command,
+            "help": self.help_command,
+            "status": self.status_command,
         }
+        
+        # Bot statistics
+        self.commands_processed = 0
+        self.errors_handled = 0
+        self.dropped_updates = 0
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (second, snapshot)
     
     async def initialize(self) -> None:
         """Initialize the bot application."""
@@ -53,6 +205,7 @@ class CCReleaseMonitorBot:
             self.application = (
                 Application.builder()
                 .token(self.config.telegram_bot_token)
+                .update_queue(asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE))
                 .build()
             )
             
@@ -73,10 +226,13 @@ class CCReleaseMonitorBot:
         if not self.application:
             raise RuntimeError("Application not initialized")
         
-        # Command handlers
-        self.application.add_handler(CommandHandler("start", self.start_command))
-        self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("status", self.status_command))
+        # Runs before every other handler and hands updates to per-chat workers
+        self.application.add_handler(TypeHandler(Update, self._dispatch_update), group=-1)
+        
+        # Command handlers; one handler for all commands is one check per update
+        self.application.add_handler(
+            CommandHandler(list(self._command_callbacks), self._dispatch_command)
+        )
         
         # Error handler
         self.application.add_error_handler(self.error_handler)
@@ -88,6 +244,77 @@ class CCReleaseMonitorBot:
         
         logger.info("Bot handlers set up successfully")
     
+    async def _dispatch_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Route a known command to its handler."""
+        # "/status@SomeBot args" -> "status"
+        command = update.effective_message.text.split(maxsplit=1)[0][1:].partition("@")[0].lower()
+        await self._command_callbacks[command](update, context)
+    
+    async def _dispatch_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """
+        Queue an incoming update for its chat's worker.
+        
+        Updates for one chat are handled in order, while different chats are
+        handled concurrently. Updates replayed by a worker, and updates without
+        a chat, fall through to the regular handlers.
+        """
+        chat = update.effective_chat
+        if chat is None or id(update) in self._replaying:
+            return
+        
+        message = update.effective_message
+        if (
+            message is not None
+            and self.application.update_queue.qsize() > STALE_UPDATE_BACKLOG
+            and (get_utc_now() - message.date).total_seconds() > STALE_UPDATE_SECONDS
+        ):
+            self.dropped_updates += 1
+            logger.warning("Update backlog high, dropping stale update %s", update.update_id)
+            raise ApplicationHandlerStop
+        
+        queue = self._chat_queues.get(chat.id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=CHAT_QUEUE_SIZE)
+            self._chat_queues[chat.id] = queue
+            task = asyncio.create_task(self._chat_worker(chat.id, queue))
+            self._chat_workers.add(task)
+            task.add_done_callback(self._chat_workers.discard)
+        
+        try:
+            queue.put_nowait(update)
+        except asyncio.QueueFull:
+            self.dropped_updates += 1
+            logger.warning(f"Update queue full for chat {chat.id}, dropping update {update.update_id}")
+        
+        raise ApplicationHandlerStop
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue) -> None:
+        """
+        Handle one chat's queued updates in order until the chat goes idle.
+        
+        Args:
+            chat_id: Telegram chat ID
+            queue: The chat's update queue
+        """
+        while True:
+            try:
+                update = await asyncio.wait_for(queue.get(), CHAT_WORKER_IDLE_SECONDS)
+            except asyncio.TimeoutError:
+                if not queue.empty():
+                    continue
+                self._chat_queues.pop(chat_id, None)
+                return
+            
+            # Only handling counts against MAX_CHAT_WORKERS, so idle chats hold no slot
+            self._replaying.add(id(update))
+            try:
+                async with self._worker_semaphore:
+                    await self.application.process_update(update)
+            except Exception as e:
+                logger.error(f"Error processing update for chat {chat_id}: {e}")
+            finally:
+                self._replaying.discard(id(update))
+    
     async def _setup_bot_commands(self) -> None:
         """Set up bot commands menu."""
         commands = [
@@ -96,9 +323,22 @@ class CCReleaseMonitorBot:
             BotCommand("status", "Show bot status and statistics"),
         ]
         
+        # Skip the Telegram round-trip when the menu matches what was last set
+        # for this bot; the token's prefix is the bot ID, so a new bot is set up
+        bot_id = self.config.telegram_bot_token.partition(":")[0]
+        commands_hash = hashlib.blake2b(
+            repr((bot_id, [(c.command, c.description) for c in commands])).encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        state_file = Path(self.config.data_directory) / "bot_commands.json"
+        if load_json_file(state_file, {}).get("commands_hash") == commands_hash:
+            logger.info("Bot commands unchanged, skipping set_my_commands")
+            return
+        
         try:
             if self.application and self.application.bot:
                 await self.application.bot.set_my_commands(commands)
+                save_json_file({"commands_hash": commands_hash}, state_file)
                 logger.info("Bot commands menu set up successfully")
         except Exception as e:
             logger.error(f"Failed to set up bot commands: {e}")
@@ -106,139 +346,112 @@ class CCReleaseMonitorBot:
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
         try:
-            self.stats["commands_processed"] += 1
-            
-            welcome_message = (
-                "🤖 *CC Release Monitor Bot*\n\n"
-                "Welcome! I'm your Claude Code Release Monitor bot.\n\n"
-                "🔍 I can help you monitor Claude Code releases and keep you updated "
-                "with the latest changes and announcements.\n\n"
-                "*Available Commands:*\n"
-                "• /help - Show detailed help information\n"
-                "• /status - Show bot status and statistics\n\n"
-                "📝 *Getting Started:*\n"
-                "Use /help to learn more about my features and capabilities.\n\n"
-                "💡 *Tip:* I'll automatically notify you about new releases when they're available!"
-            )
+            self.commands_processed += 1
             
             await update.message.reply_text(
-                welcome_message,
-                parse_mode="Markdown"
+                _START_MESSAGE,
+                parse_mode=ParseMode.MARKDOWN
             )
             
-            logger.info(f"Start command handled for user {update.effective_user.id}")
+            logger.info("Start command handled for user %s", update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in start command: {e}")
+            logger.error("Error in start command: %s", e)
             await self._send_error_message(update, "Failed to process start command")
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
         try:
-            self.stats["commands_processed"] += 1
-            
-            help_message = (
-                "📚 *CC Release Monitor Bot Help*\n\n"
-                "*Commands:*\n"
-                "• `/start` - Start the bot and see welcome message\n"
-                "• `/help` - Show this help information\n"
-                "• `/status` - Show bot status and statistics\n\n"
-                "*Features:*\n"
-                "🔔 Automatic release notifications\n"
-                "⏰ Configurable check intervals\n"
-                "🔇 Quiet hours support\n"
-                "📊 Release tracking and statistics\n\n"
-                "*About:*\n"
-                "This bot monitors Claude Code releases and provides timely notifications "
-                "about new versions, updates, and important announcements.\n\n"
-                "🛠️ *Status:* Currently in active development\n"
-                "📅 *Version:* 1.0.0\n\n"
-                "If you encounter any issues or have suggestions, please let us know!"
-            )
+            self.commands_processed += 1
             
             await update.message.reply_text(
-                help_message,
-                parse_mode="Markdown"
+                _HELP_MESSAGE,
+                parse_mode=ParseMode.MARKDOWN
             )
             
-            logger.info(f"Help command handled for user {update.effective_user.id}")
+            logger.info("Help command handled for user %s", update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in help command: {e}")
+            logger.error("Error in help command: %s", e)
             await self._send_error_message(update, "Failed to process help command")
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
         try:
-            self.stats["commands_processed"] += 1
+            self.commands_processed += 1
             
-            uptime = get_utc_now() - self.stats["uptime_start"]
-            uptime_str = f"{uptime.days}d {uptime.seconds // 3600}h {(uptime.seconds % 3600) // 60}m"
+            uptime_minutes = int(time.monotonic() - self._mono_start) // 60
             
-            status_message = (
-                "📊 *Bot Status*\n\n"
+            # Only this block changes between calls
+            dynamic_block = (
                 f"🟢 *Status:* {'Running' if self.is_running else 'Stopped'}\n"
-                f"⏱️ *Uptime:* {uptime_str}\n"
-                f"🕐 *Started:* {format_datetime(self.stats['uptime_start'])}\n"
-                f"📈 *Commands Processed:* {self.stats['commands_processed']}\n"
-                f"❌ *Errors Handled:* {self.stats['errors_handled']}\n\n"
-                "*Configuration:*\n"
-                f"⏲️ Check Interval: {self.config.check_interval_minutes} minutes\n"
-                f"🔄 Max Retries: {self.config.max_retries}\n"
-                f"🔔 Notifications: {'Enabled' if self.config.enable_notifications else 'Disabled'}\n"
-                f"🌙 Quiet Hours: {self.config.quiet_hours_start}:00 - {self.config.quiet_hours_end}:00\n\n"
-                "✅ All systems operational"
+                f"⏱️ *Uptime:* {_format_uptime(uptime_minutes)}\n"
+                f"🕐 *Started:* {self._started_str}\n"
+                f"📈 *Commands Processed:* {self.commands_processed}\n"
+                f"❌ *Errors Handled:* {self.errors_handled}\n\n"
+            )
+            status_message = "".join(
+                (_STATUS_HEADER, dynamic_block, self._status_config_block, _STATUS_FOOTER)
             )
             
             await update.message.reply_text(
                 status_message,
-                parse_mode="Markdown"
+                parse_mode=ParseMode.MARKDOWN
             )
             
-            logger.info(f"Status command handled for user {update.effective_user.id}")
+            logger.info("Status command handled for user %s", update.effective_user.id)
             
         except Exception as e:
-            logger.error(f"Error in status command: {e}")
+            logger.error("Error in status command: %s", e)
             await self._send_error_message(update, "Failed to process status command")
     
     async def unknown_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle unknown commands."""
         try:
-            unknown_message = (
-                "❓ *Unknown Command*\n\n"
-                "I don't recognize that command. Here are the available commands:\n\n"
-                "• /start - Start the bot\n"
-                "• /help - Show help information\n"
-                "• /status - Show bot status\n\n"
-                "Use /help for more detailed information."
-            )
+            user = update.effective_user
+            user_id = user.id if user else None
+            
+            # Rate limit per user so command spam can't use up the bot's send limit
+            if user_id is not None:
+                now = time.monotonic()
+                if now - self._unknown_replies.get(user_id, float("-inf")) < UNKNOWN_REPLY_INTERVAL_SECONDS:
+                    logger.debug("Rate limited unknown command reply to user %s", user_id)
+                    return
+                self._unknown_replies = {
+                    uid: sent for uid, sent in self._unknown_replies.items()
+                    if now - sent < UNKNOWN_REPLY_INTERVAL_SECONDS
+                }
+                self._unknown_replies[user_id] = now
             
             await update.message.reply_text(
-                unknown_message,
-                parse_mode="Markdown"
+                _UNKNOWN_MESSAGE,
+                parse_mode=ParseMode.MARKDOWN
             )
             
-            logger.info(f"Unknown command handled for user {update.effective_user.id}: {update.message.text}")
+            logger.info("Unknown command handled for user %s: %s", user_id, update.message.text)
             
         except Exception as e:
-            logger.error(f"Error in unknown command handler: {e}")
+            logger.error("Error in unknown command handler: %s", e)
     
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle errors that occur during bot operation."""
-        self.stats["errors_handled"] += 1
+        self.errors_handled += 1
         
         error = context.error
-        logger.error(f"Bot error occurred: {error}")
+        logger.error("Bot error occurred: %s", error)
         
-        # Handle specific error types
-        if isinstance(error, NetworkError):
-            logger.warning("Network error occurred, bot will retry automatically")
-        elif isinstance(error, TimedOut):
-            logger.warning("Request timed out, bot will retry automatically")
-        elif isinstance(error, TelegramError):
-            logger.error(f"Telegram API error: {error}")
+        # Handle specific error types, walking the MRO only for subclasses
+        route = _ERROR_LOG.get(type(error))
+        if route is None:
+            route = next(
+                (_ERROR_LOG[cls] for cls in type(error).__mro__ if cls in _ERROR_LOG),
+                _UNEXPECTED_ERROR_LOG,
+            )
+        level, message = route
+        if "%s" in message:
+            logger.log(level, message, error)
         else:
-            logger.error(f"Unexpected error: {error}")
+            logger.log(level, message)
         
         # Try to notify user if update is available
         if update and update.effective_message:
@@ -253,10 +466,23 @@ class CCReleaseMonitorBot:
     async def _send_error_message(self, update: Update, message: str) -> None:
         """Send error message to user."""
         try:
+            now = time.monotonic()
+            key = (update.effective_chat.id, message)
+            if now - self._error_replies.get(key, float("-inf")) < ERROR_REPLY_DEDUPE_SECONDS:
+                logger.debug("Suppressed duplicate error reply to chat %s", key[0])
+                return
+            
+            # Drop expired entries so the map only holds recent replies
+            self._error_replies = {
+                k: sent for k, sent in self._error_replies.items()
+                if now - sent < ERROR_REPLY_DEDUPE_SECONDS
+            }
+            self._error_replies[key] = now
+            
             error_message = f"⚠️ *Error*\n\n{message}"
             await update.message.reply_text(
                 error_message,
-                parse_mode="Markdown"
+                parse_mode=ParseMode.MARKDOWN
             )
         except Exception as e:
             logger.error(f"Failed to send error message: {e}")
@@ -288,9 +514,16 @@ class CCReleaseMonitorBot:
         try:
             logger.info("Stopping CC Release Monitor Bot...")
             self.is_running = False
+            self._stop_event.set()
             
-            # Stop and shutdown application
-            await self.application.stop()
+            # Stop receiving updates, then stop and shutdown application
+            if self.application.updater and self.application.updater.running:
+                await self.application.updater.stop()
+            for task in list(self._chat_workers):
+                task.cancel()
+            self._chat_queues.clear()
+            if self.application.running:
+                await self.application.stop()
             await self.application.shutdown()
             
             logger.info("Bot stopped successfully")
@@ -298,16 +531,40 @@ class CCReleaseMonitorBot:
         except Exception as e:
             logger.error(f"Error while stopping bot: {e}")
     
+    def request_stop(self) -> None:
+        """Make run_forever() return; it stops the bot on the way out."""
+        self._stop_event.set()
+    
     async def run_forever(self) -> None:
         """Run the bot until interrupted."""
         try:
             await self.start()
+            await self.application.start()
             
-            # Start polling - this will run indefinitely until stopped
-            await self.application.run_polling(
-                drop_pending_updates=True,
-                allowed_updates=Update.ALL_TYPES
-            )
+            if self.config.use_webhook:
+                # Telegram pushes updates as they happen, so there is no idle
+                # getUpdates traffic. Telegram requires HTTPS, so TLS is expected
+                # to be terminated by a reverse proxy in front of this server.
+                webhook_url = f"{self.config.webhook_url}/{self.config.webhook_path}"
+                await self.application.updater.start_webhook(
+                    listen=self.config.webhook_listen,
+                    port=self.config.webhook_port,
+                    url_path=self.config.webhook_path,
+                    webhook_url=webhook_url,
+                    secret_token=self.config.webhook_secret_token,
+                    drop_pending_updates=True,
+                    allowed_updates=ALLOWED_UPDATES
+                )
+                logger.info(f"Receiving updates by webhook at {webhook_url}")
+            else:
+                await self.application.updater.start_polling(
+                    drop_pending_updates=True,
+                    allowed_updates=ALLOWED_UPDATES
+                )
+                logger.info("Receiving updates by polling")
+            
+            # Run until stop() is called
+            await self._stop_event.wait()
                 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal, stopping bot...")
@@ -317,9 +574,27 @@ class CCReleaseMonitorBot:
             await self.stop()
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get bot statistics."""
-        return {
-            **self.stats,
+        """
+        Get bot statistics.
+        
+        The snapshot is rebuilt at most once per second, so frequent pollers
+        share it and should treat it as read-only.
+        
+        Returns:
+            Dictionary of counters and uptime
+        """
+        now = time.monotonic()
+        bucket = int(now)
+        if self._stats_cache is not None and self._stats_cache[0] == bucket:
+            return self._stats_cache[1]
+        
+        stats = {
+            "commands_processed": self.commands_processed,
+            "errors_handled": self.errors_handled,
+            "dropped_updates": self.dropped_updates,
+            "uptime_start": self.start_time,
             "is_running": self.is_running,
-            "uptime_seconds": (get_utc_now() - self.stats["uptime_start"]).total_seconds(),
-        }
\ No newline at end of file
+            "uptime_seconds": now - self._mono_start,
+        }
+        self._stats_cache = (bucket, stats)
+        return stats
@@ -6,6 +6,7 @@ import requests
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.constants import ParseMode
 from telegram.ext import (
     CallbackQueryHandler, 
     CommandHandler,
@@ -177,7 +178,7 @@ class ApprovalHandler:
                     chat_id=user_id,
                     text=message,
                     reply_markup=reply_markup,
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
                 logger.info(f"Sent approval request {request.request_id[:8]} to user {user_id}")
             except Exception as e:
@@ -317,7 +318,7 @@ class ApprovalHandler:
                 await query.edit_message_text(
                     details,
                     reply_markup=reply_markup,
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             else:
                 await query.answer("Request not found", show_alert=True)
@@ -356,7 +357,7 @@ class ApprovalHandler:
                     f"Request ID: `{request_id[:8]}...`\n"
                     f"Reason: {reason}\n"
                     f"Time: {datetime.now().strftime('%H:%M:%S')}",
-                    parse_mode='Markdown'
+                    parse_mode=ParseMode.MARKDOWN
                 )
             else:
                 await update.message.reply_text(
@@ -401,7 +402,7 @@ class ApprovalHandler:
                 
                 message += f"\n**Recent (1h):** {stats.get('recent_hour', 0)} requests"
                 
-                await update.message.reply_text(message, parse_mode='Markdown')
+                await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
             else:
                 await update.message.reply_text("⚠️ Failed to get statistics from IPC server")
         
@@ -410,7 +411,7 @@ class ApprovalHandler:
                 "❌ **IPC Server Offline**\n\n"
                 "The approval server is not running.\n"
                 "Start it with: `python src/ipc_server.py`",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.MARKDOWN
             )
         except Exception as e:
             await update.message.reply_text(f"❌ Error: {str(e)}")
@@ -427,7 +428,7 @@ class ApprovalHandler:
         await update.message.reply_text(
             "✅ **Approval Monitoring Started**\n\n"
             "I will now notify you of any Claude Code requests that need approval.",
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
     
     async def stop_approval_monitoring_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -442,7 +443,7 @@ class ApprovalHandler:
         await update.message.reply_text(
             "⏹️ **Approval Monitoring Stopped**\n\n"
             "I will no longer notify you of Claude Code requests.",
-            parse_mode='Markdown'
+            parse_mode=ParseMode.MARKDOWN
         )
 
 
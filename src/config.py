@@ -109,6 +109,19 @@ class Config:
             logging.warning("Invalid MAX_RETRIES, using default: 3")
             return 3
     
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Get maximum number of GitHub requests in flight at once."""
+        try:
+            value = int(os.getenv("MAX_CONCURRENT_REQUESTS", "4"))
+            if value >= 1:
+                return value
+            logging.warning("Invalid MAX_CONCURRENT_REQUESTS, using default: 4")
+            return 4
+        except ValueError:
+            logging.warning("Invalid MAX_CONCURRENT_REQUESTS, using default: 4")
+            return 4
+    
     @property
     def retry_delay_seconds(self) -> int:
         """Get retry delay in seconds."""
@@ -184,6 +197,45 @@ class Config:
                 logging.warning("Ignoring invalid Telegram user id in AUTHORIZED_USER_IDS: %s", candidate)
         return ids
 
+    @property
+    def webhook_url(self) -> Optional[str]:
+        """Get public HTTPS base URL for Telegram webhooks (None to use polling)."""
+        url = os.getenv("WEBHOOK_URL", "").strip()
+        return url.rstrip("/") or None
+    
+    @property
+    def use_webhook(self) -> bool:
+        """Get whether updates are received by webhook instead of polling."""
+        return self.webhook_url is not None
+    
+    @property
+    def webhook_listen(self) -> str:
+        """Get local address the webhook server binds to."""
+        return os.getenv("WEBHOOK_LISTEN", "127.0.0.1")
+    
+    @property
+    def webhook_port(self) -> int:
+        """Get local port the webhook server listens on."""
+        try:
+            port = int(os.getenv("WEBHOOK_PORT", "8443"))
+            if 1 <= port <= 65535:
+                return port
+            logging.warning("Invalid WEBHOOK_PORT, using default: 8443")
+            return 8443
+        except ValueError:
+            logging.warning("Invalid WEBHOOK_PORT, using default: 8443")
+            return 8443
+    
+    @property
+    def webhook_path(self) -> str:
+        """Get URL path Telegram posts updates to."""
+        return os.getenv("WEBHOOK_PATH", "telegram").strip("/")
+    
+    @property
+    def webhook_secret_token(self) -> Optional[str]:
+        """Get secret token Telegram sends with each webhook request (optional)."""
+        return os.getenv("WEBHOOK_SECRET_TOKEN", "").strip() or None
+    
     @property
     def log_directory(self) -> str:
         """Get log directory path."""
@@ -2,18 +2,43 @@
 GitHub API client for CC Release Monitor.
 """
 
+import asyncio
+import base64
+import functools
 import logging
 import requests
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timezone
-from urllib.parse import urljoin
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, urljoin
 
 from .config import Config
-from .utils import retry_async
+from .http_cache import SqliteHttpCache
+from .utils import json_loads, retry_async
 
 logger = logging.getLogger(__name__)
 
+# Seconds to reuse results of the async fetch methods between bot commands
+RESPONSE_CACHE_TTL = 90
+
+# Number of full commit payloads kept for repeated /commit lookups
+COMMIT_CACHE_SIZE = 64
+
+# Number of ETags and response bodies kept in memory for conditional requests
+ETAG_CACHE_SIZE = 128
+
+# Request token bucket: burst size and longest time an async call waits for a token
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MAX_WAIT = 30
+
+# Bytes fetched when only the top of a file (e.g. the newest changelog entries) is needed
+FILE_HEAD_BYTES = 16384
+
 
 class GitHubAPIError(Exception):
     """GitHub API error exception."""
@@ -25,6 +50,118 @@ class RateLimitError(GitHubAPIError):
     pass
 
 
+class TTLCache:
+    """Small in-memory cache whose entries expire after a given number of seconds."""
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+    
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        return True, value
+    
+    def set(self, key: Any, value: Any, ttl_seconds: float) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Seconds until the entry expires
+        """
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+def ttl_cached(seconds: float):
+    """
+    Cache the result of an async GitHubClient method for a short time.
+    
+    Results are keyed by repository, method and arguments. Empty results
+    (None or []), which the async methods also return on failure, are not
+    cached. Pass ``force=True`` to skip the cache and refresh the entry.
+    
+    Args:
+        seconds: Time to keep a result
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, force: bool = False, **kwargs):
+            key = (self.repo, func.__name__, args, frozenset(kwargs.items()))
+            
+            if not force:
+                hit, value = self._response_cache.get(key)
+                if hit:
+                    logger.debug(f"Using cached {func.__name__} result for {self.repo}")
+                    return value
+            
+            value = await func(self, *args, **kwargs)
+            if value:
+                self._response_cache.set(key, value, seconds)
+            return value
+        
+        return wrapper
+    
+    return decorator
+
+
+def single_flight(func):
+    """
+    Coalesce concurrent identical calls of an async GitHubClient method.
+    
+    While a call is in flight, callers with the same arguments await its
+    result instead of issuing their own request.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, frozenset(kwargs.items()))
+        
+        future = self._inflight.get(key)
+        if future is not None:
+            logger.debug(f"Joining in-flight {func.__name__} call for {self.repo}")
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func(self, *args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a call nobody joined doesn't log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+    
+    return wrapper
+
+
 class GitHubClient:
     """GitHub API client for fetching release information."""
     
@@ -37,9 +174,17 @@ class GitHubClient:
         """
         self.config = config
         self.base_url = "https://api.github.com"
+        self.raw_base_url = "https://raw.githubusercontent.com"
         self.repo = config.github_repo
         self.session = requests.Session()
         
+        # Keep one connection pool per host (the API and raw content hosts are
+        # used in the same monitoring cycle, and urllib3 closes the pool of a
+        # host it evicts), each with a keep-alive connection per concurrent
+        # request, so parallel async calls reuse TLS connections
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=config.max_concurrent_requests)
+        self.session.mount("https://", adapter)
+        
         # Set up headers
         self.session.headers.update({
             "Accept": "application/vnd.github.v3+json",
@@ -58,6 +203,142 @@ class GitHubClient:
         self.min_request_interval = 1.0  # Minimum seconds between requests
         self.rate_limit_remaining = None
         self.rate_limit_reset_time = None
+        
+        # Conditional request cache: (url, params) -> (ETag, parsed body).
+        # 304 Not Modified replies don't count against the rate limit.
+        # Requests run in worker threads, so the cache is only used under its lock.
+        self._etag_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # Persistent copy of the ETag cache, so requests after a restart are conditional too
+        try:
+            self._http_cache: Optional[SqliteHttpCache] = SqliteHttpCache(
+                Path(config.data_directory) / "http_cache.sqlite"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent HTTP cache unavailable: {e}")
+            self._http_cache = None
+        
+        # Short-lived cache of async call results shared by bot commands
+        self._response_cache = TTLCache()
+        
+        # Async calls currently in flight, for coalescing duplicates
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        
+        # Commits are immutable, so fetched ones are kept by full SHA without expiry
+        self._commit_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Caps the number of GitHub requests running at once from async callers
+        self._request_semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        
+        # Token bucket spreading the remaining rate limit budget until its reset.
+        # The refill rate is unknown (no smoothing) until GitHub reports limits.
+        # Worker threads update it from response headers, so it is used under a lock.
+        self._bucket_lock = threading.Lock()
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._refill_rate: Optional[float] = None
+        self._tokens_updated = time.monotonic()
+    
+    def _get_etag(self, cache_key: Tuple[str, Tuple]) -> Optional[Tuple[str, Any]]:
+        """Return the cached (ETag, body) for a request, if any."""
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                self._etag_cache.move_to_end(cache_key)
+            return cached
+    
+    def _set_etag(self, cache_key: Tuple[str, Tuple], etag: str, body: Any) -> None:
+        """Store a response's ETag and body, evicting the least recently used when full."""
+        with self._etag_lock:
+            self._etag_cache[cache_key] = (etag, body)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+    
+    def _refill_tokens(self) -> None:
+        """Add the tokens earned since the last update to the bucket (lock held)."""
+        now = time.monotonic()
+        if self._refill_rate is None:
+            self._tokens = float(RATE_LIMIT_BURST)
+        else:
+            elapsed = now - self._tokens_updated
+            self._tokens = min(float(RATE_LIMIT_BURST), self._tokens + elapsed * self._refill_rate)
+        self._tokens_updated = now
+    
+    def _update_token_bucket(self) -> None:
+        """Recompute the refill rate from the latest rate limit headers."""
+        remaining = self.rate_limit_remaining
+        reset_time = self.rate_limit_reset_time
+        
+        with self._bucket_lock:
+            self._refill_tokens()
+            
+            if remaining is None or reset_time is None:
+                self._refill_rate = None
+                return
+            
+            reset_in = (reset_time - datetime.now(timezone.utc)).total_seconds()
+            # Always allow at least one request per window so an empty budget recovers
+            self._refill_rate = max(remaining, 1) / max(reset_in, 1.0)
+            self._tokens = min(self._tokens, float(remaining))
+    
+    def has_request_budget(self) -> bool:
+        """
+        Check whether a request can be made now without waiting for a token.
+        
+        Returns:
+            True if the token bucket has a token available
+        """
+        with self._bucket_lock:
+            self._refill_tokens()
+            return self._tokens >= 1
+    
+    async def _acquire_token(self, nowait: bool = False) -> None:
+        """
+        Take a token from the request bucket, waiting for one if needed.
+        
+        Args:
+            nowait: Raise instead of waiting when no token is available
+            
+        Raises:
+            RateLimitError: If no token is available and nowait is set, or
+                the wait would exceed RATE_LIMIT_MAX_WAIT
+        """
+        while True:
+            with self._bucket_lock:
+                self._refill_tokens()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._refill_rate
+            
+            if nowait or wait > RATE_LIMIT_MAX_WAIT:
+                raise RateLimitError(f"Request budget exhausted, next request in {wait:.0f} seconds")
+            
+            logger.debug(f"Rate limiting: waiting {wait:.2f} seconds for a request token")
+            await asyncio.sleep(wait)
+    
+    async def _run_request(self, func, *args) -> Any:
+        """
+        Run a blocking request method in a worker thread.
+        
+        Args:
+            func: Synchronous client method to call
+            *args: Arguments for func
+            
+        Returns:
+            Result of func
+        """
+        await self._acquire_token()
+        async with self._request_semaphore:
+            return await asyncio.to_thread(func, *args)
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections and the persistent response cache."""
+        self.session.close()
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
     
     def _wait_for_rate_limit(self) -> None:
         """Wait to respect rate limits."""
@@ -92,6 +373,7 @@ class GitHubClient:
                 self.rate_limit_reset_time = None
 
         logger.debug(f"Rate limit remaining: {self.rate_limit_remaining}")
+        self._update_token_bucket()
 
         if self.rate_limit_remaining == 0:
             if self.rate_limit_reset_time:
@@ -116,14 +398,26 @@ class GitHubClient:
         """
         self._wait_for_rate_limit()
         
+        cache_key = (url, tuple(sorted((params or {}).items())))
+        persistent_key = f"{url}?{urlencode(cache_key[1])}" if cache_key[1] else url
+        cached = self._get_etag(cache_key)
+        if cached is None and self._http_cache is not None:
+            cached = self._http_cache.get(persistent_key)
+            if cached is not None:
+                self._set_etag(cache_key, *cached)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
         try:
             self.last_request_time = time.time()
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
             
             # Check rate limit
             self._check_rate_limit(response)
             
-            if response.status_code == 404:
+            if response.status_code == 304 and cached:
+                logger.debug(f"Not modified, using cached response for {url}")
+                return cached[1]
+            elif response.status_code == 404:
                 raise GitHubAPIError(f"Repository not found: {self.repo}")
             elif response.status_code == 403:
                 if "rate limit" in response.text.lower():
@@ -133,7 +427,13 @@ class GitHubClient:
             elif response.status_code != 200:
                 raise GitHubAPIError(f"GitHub API error {response.status_code}: {response.text}")
             
-            return response.json()
+            data = json_loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._set_etag(cache_key, etag, data)
+                if self._http_cache is not None:
+                    self._http_cache.set(persistent_key, etag, data)
+            return data
             
         except requests.exceptions.Timeout:
             raise GitHubAPIError("Request timeout")
@@ -262,6 +562,8 @@ class GitHubClient:
         logger.info(f"Successfully fetched repository info")
         return data
     
+    @ttl_cached(seconds=RESPONSE_CACHE_TTL)
+    @single_flight
     async def get_latest_release_async(self) -> Optional[Dict[str, Any]]:
         """
         Async version of get_latest_release with retry logic.
@@ -270,7 +572,7 @@ class GitHubClient:
             Latest release data or None if no releases found
         """
         async def fetch_release():
-            return self.get_latest_release()
+            return await self._run_request(self.get_latest_release)
         
         try:
             return await retry_async(
@@ -357,6 +659,8 @@ class GitHubClient:
                 return None
             raise
     
+    @ttl_cached(seconds=RESPONSE_CACHE_TTL)
+    @single_flight
     async def get_commits_async(self, per_page: int = 10, page: int = 1, branch: str = None) -> List[Dict[str, Any]]:
         """
         Async version of get_commits with retry logic.
@@ -370,7 +674,7 @@ class GitHubClient:
             List of commit data
         """
         async def fetch_commits():
-            return self.get_commits(per_page, page, branch)
+            return await self._run_request(self.get_commits, per_page, page, branch)
         
         try:
             return await retry_async(
@@ -402,6 +706,7 @@ class GitHubClient:
         except Exception as e:
             return False, f"Unexpected error: {e}"
     
+    @single_flight
     async def get_commit_async(self, commit_sha: str) -> Optional[Dict[str, Any]]:
         """
         Async version of get_commit with retry logic.
@@ -412,11 +717,16 @@ class GitHubClient:
         Returns:
             Commit data or None if not found
         """
+        cached = self._find_cached_commit(commit_sha)
+        if cached is not None:
+            logger.debug(f"Using cached commit {cached['sha'][:8]} for {commit_sha}")
+            return cached
+        
         async def fetch_commit():
-            return self.get_commit(commit_sha)
+            return await self._run_request(self.get_commit, commit_sha)
         
         try:
-            return await retry_async(
+            data = await retry_async(
                 fetch_commit,
                 max_retries=self.config.max_retries,
                 delay=self.config.retry_delay_seconds,
@@ -425,6 +735,30 @@ class GitHubClient:
         except Exception as e:
             logger.error(f"Failed to fetch commit {commit_sha} after retries: {e}")
             return None
+        
+        if data and data.get('sha'):
+            self._commit_cache[data['sha']] = data
+            if len(self._commit_cache) > COMMIT_CACHE_SIZE:
+                self._commit_cache.popitem(last=False)
+        return data
+    
+    def _find_cached_commit(self, commit_sha: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a full or abbreviated SHA against previously fetched commits.
+        
+        Args:
+            commit_sha: Full or abbreviated commit SHA
+            
+        Returns:
+            Cached commit data, or None if not cached or the prefix is ambiguous
+        """
+        prefix = commit_sha.lower()
+        matches = [sha for sha in self._commit_cache if sha.startswith(prefix)]
+        if len(matches) != 1:
+            return None
+        
+        self._commit_cache.move_to_end(matches[0])
+        return self._commit_cache[matches[0]]
     
     def get_file_last_commit(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -477,7 +811,6 @@ class GitHubClient:
             data = self._make_request(url, params)
             
             # GitHub API returns file content in base64
-            import base64
             content = data.get('content', '')
             if content:
                 # Decode base64 content
@@ -495,6 +828,90 @@ class GitHubClient:
                 return None
             raise
     
+    def get_file_head(self, file_path: str, max_bytes: int = FILE_HEAD_BYTES) -> Optional[str]:
+        """
+        Get the first bytes of a file from the raw content host.
+        
+        Uses a Range request, so large files such as changelogs aren't
+        downloaded and base64-decoded in full. Raw content requests don't
+        count against the API rate limit.
+        
+        Args:
+            file_path: Path to the file in the repository
+            max_bytes: Maximum number of bytes to fetch
+            
+        Returns:
+            Start of the file content as string or None if not found
+            
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        url = f"{self.raw_base_url}/{self.repo}/HEAD/{file_path}"
+        cache_key = (url, (("bytes", max_bytes),))
+        cached = self._get_etag(cache_key)
+        
+        headers = {"Range": f"bytes=0-{max_bytes - 1}"}
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        
+        try:
+            logger.debug(f"Fetching first {max_bytes} bytes of {file_path}")
+            response = self.session.get(url, headers=headers, timeout=30)
+            
+            if response.status_code == 304 and cached:
+                logger.debug(f"Not modified, using cached head of {file_path}")
+                return cached[1]
+            elif response.status_code == 404:
+                logger.warning(f"File not found: {file_path}")
+                return None
+            elif response.status_code not in (200, 206):
+                raise GitHubAPIError(f"GitHub raw content error {response.status_code}: {response.text}")
+            
+            # A 200 means the Range header was ignored; a cut multi-byte character is dropped
+            content = response.content[:max_bytes].decode('utf-8', errors='ignore')
+            etag = response.headers.get("ETag")
+            if etag:
+                self._set_etag(cache_key, etag, content)
+            return content
+            
+        except requests.exceptions.Timeout:
+            raise GitHubAPIError("Request timeout")
+        except requests.exceptions.ConnectionError:
+            raise GitHubAPIError("Connection error")
+        except requests.exceptions.RequestException as e:
+            raise GitHubAPIError(f"Request failed: {e}")
+    
+    @ttl_cached(seconds=RESPONSE_CACHE_TTL)
+    @single_flight
+    async def get_file_head_async(self, file_path: str, max_bytes: int = FILE_HEAD_BYTES) -> Optional[str]:
+        """
+        Async version of get_file_head with retry logic.
+        
+        Args:
+            file_path: Path to the file in the repository
+            max_bytes: Maximum number of bytes to fetch
+            
+        Returns:
+            Start of the file content as string or None if not found
+        """
+        async def fetch_file_head():
+            # Raw content isn't metered by the API rate limit, so skip the token bucket
+            async with self._request_semaphore:
+                return await asyncio.to_thread(self.get_file_head, file_path, max_bytes)
+        
+        try:
+            return await retry_async(
+                fetch_file_head,
+                max_retries=self.config.max_retries,
+                delay=self.config.retry_delay_seconds,
+                exceptions=(GitHubAPIError,)
+            )
+        except Exception as e:
+            logger.error(f"Failed to fetch head of {file_path} after retries: {e}")
+            return None
+    
+    @ttl_cached(seconds=RESPONSE_CACHE_TTL)
+    @single_flight
     async def get_file_last_commit_async(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Async version to get the last commit that modified a specific file.
@@ -506,7 +923,7 @@ class GitHubClient:
             Commit data with timestamp, or None if not found
         """
         async def fetch_last_commit():
-            return self.get_file_last_commit(file_path)
+            return await self._run_request(self.get_file_last_commit, file_path)
         
         try:
             return await retry_async(
@@ -519,6 +936,8 @@ class GitHubClient:
             logger.error(f"Failed to fetch last commit for {file_path} after retries: {e}")
             return None
     
+    @ttl_cached(seconds=RESPONSE_CACHE_TTL)
+    @single_flight
     async def get_file_content_async(self, file_path: str, branch: str = None) -> Optional[str]:
         """
         Async version of get_file_content with retry logic.
@@ -531,7 +950,7 @@ class GitHubClient:
             File content as string or None if not found
         """
         async def fetch_file_content():
-            return self.get_file_content(file_path, branch)
+            return await self._run_request(self.get_file_content, file_path, branch)
         
         try:
             return await retry_async(
@@ -0,0 +1,124 @@
+"""
+Persistent HTTP response cache for CC Release Monitor.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from .utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+# Most responses kept; the least recently fetched are removed beyond this
+HTTP_CACHE_MAX_ENTRIES = 500
+
+# Responses not refetched for this long are removed when the cache is opened
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+
+class SqliteHttpCache:
+    """Stores ETags and response bodies in SQLite so they survive restarts."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_entries: int = HTTP_CACHE_MAX_ENTRIES,
+        max_age: int = HTTP_CACHE_MAX_AGE,
+    ):
+        """
+        Initialize the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_entries: Maximum number of responses kept
+            max_age: Seconds after which an unrefreshed response is removed
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Requests run in worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    fetched_at INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS http_cache_fetched_at ON http_cache (fetched_at)"
+            )
+            self._conn.execute(
+                "DELETE FROM http_cache WHERE fetched_at < ?",
+                (int(time.time()) - self.max_age,)
+            )
+            self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        """Delete the least recently fetched rows beyond max_entries (lock held)."""
+        self._conn.execute(
+            "DELETE FROM http_cache WHERE url NOT IN "
+            "(SELECT url FROM http_cache ORDER BY fetched_at DESC, rowid DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+
+    def get(self, url: str) -> Optional[Tuple[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            url: Request URL including its query string
+
+        Returns:
+            Tuple of (ETag, parsed body) or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT etag, body FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+            if row is None:
+                return None
+            return row[0], json_loads(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Failed to read HTTP cache entry for {url}: {e}")
+            return None
+
+    def set(self, url: str, etag: str, body: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            url: Request URL including its query string
+            etag: ETag header of the response
+            body: Parsed JSON body of the response
+        """
+        try:
+            payload = json_dumps(body)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, body, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, etag, payload, int(time.time()))
+                )
+                self._prune()
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write HTTP cache entry for {url}: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
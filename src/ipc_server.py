@@ -2,11 +2,18 @@
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import uvicorn
 import logging
 import asyncio
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -36,13 +43,73 @@ approval_queue = ApprovalQueue()
 # Store for notification callbacks
 notification_callbacks = []
 
+# Longest time a status request may be held open waiting for a decision
+MAX_STATUS_WAIT = 30  # seconds
+
+# Longest time a decision stream is held open
+MAX_STREAM_WAIT = 60  # seconds
+
+# Events set when a pending request receives a decision (long-polling),
+# with the number of requests waiting on each so the last one can drop it
+decision_events: Dict[str, asyncio.Event] = {}
+decision_waiters: Dict[str, int] = {}
+
+
+
+def _socket_dir() -> Optional[str]:
+    """
+    Return a directory only this user can access, for the Unix socket.
+    
+    Must match the hook's choice: $XDG_RUNTIME_DIR, or a per-user directory
+    with mode 0700 in the temp dir. A directory there that another user
+    created or opened up is refused, and None is returned.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return runtime_dir
+    if not hasattr(os, "getuid"):
+        return None
+    
+    path = os.path.join(tempfile.gettempdir(), f"cc-approval-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.warning(f"Cannot create socket directory {path}: {e}")
+        return None
+    
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        logger.warning(f"Not using socket directory {path}: not private to this user")
+        return None
+    return path
+
+
+def _socket_path(env_var: str, name: str) -> Optional[str]:
+    """Return the socket path set in env_var, or name in the private socket directory."""
+    path = os.environ.get(env_var)
+    if path:
+        return path
+    socket_dir = _socket_dir()
+    return os.path.join(socket_dir, name) if socket_dir else None
+
+
+# Unix-domain socket used by the hook instead of HTTP over loopback (POSIX
+# only); None when no private directory is available for it
+IPC_SOCKET = _socket_path("APPROVAL_IPC_SOCKET", "cc-approval.sock")
+_unix_server: Optional[asyncio.AbstractServer] = None
+_unix_tasks = set()
+
 
 class ApprovalRequestModel(BaseModel):
     """Model for incoming approval requests."""
     session_id: str
     tool_name: str
-    tool_input: Dict[str, Any]
+    tool_input: Dict[str, Any]  # may be a truncated preview, see tool_input_hash
     project_dir: Optional[str] = None
+    tool_input_hash: Optional[str] = None
+    tool_input_length: Optional[int] = None
 
 
 class ApprovalResponseModel(BaseModel):
@@ -75,7 +142,7 @@ async def root():
 async def create_approval_request(
     request: ApprovalRequestModel,
     background_tasks: BackgroundTasks
-) -> Dict[str, str]:
+) -> Dict[str, Any]:
     """
     Create a new approval request.
     Called by the Claude Code hook when a tool needs approval.
@@ -86,7 +153,9 @@ async def create_approval_request(
             session_id=request.session_id,
             tool_name=request.tool_name,
             tool_input=request.tool_input,
-            project_dir=request.project_dir
+            project_dir=request.project_dir,
+            tool_input_hash=request.tool_input_hash,
+            tool_input_length=request.tool_input_length
         )
         
         # Trigger notification callbacks in background
@@ -94,37 +163,86 @@ async def create_approval_request(
         
         logger.info(f"Created approval request {request_id} for {request.tool_name}")
         
-        return {
-            "request_id": request_id,
-            "status": "pending"
-        }
+        # Include the current status so the hook can skip its first status call
+        return _created_response(request_id)
     except Exception as e:
         logger.error(f"Error creating approval request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _wait_for_decision(
+    request_id: str,
+    wait: float,
+    max_wait: float = MAX_STATUS_WAIT
+) -> Optional[ApprovalRequest]:
+    """Fetch a request, waiting up to ``wait`` seconds for a pending one to be decided."""
+    request = approval_queue.get_request(request_id)
+    
+    if request and request.status == "pending" and wait > 0:
+        event = decision_events.setdefault(request_id, asyncio.Event())
+        decision_waiters[request_id] = decision_waiters.get(request_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout=min(wait, max_wait))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # The last waiter drops the event so undecided requests don't leak it
+            waiters = decision_waiters.pop(request_id) - 1
+            if waiters:
+                decision_waiters[request_id] = waiters
+            elif decision_events.get(request_id) is event:
+                del decision_events[request_id]
+        request = approval_queue.get_request(request_id) or request
+    
+    return request
+
+
+def _wake_waiters(request_id: str):
+    """Wake any hook long-polling for a request that is no longer pending."""
+    event = decision_events.pop(request_id, None)
+    if event:
+        event.set()
+
+
+def _status_response(request: ApprovalRequest) -> ApprovalStatusResponse:
+    """Build the status response for a request."""
+    response = ApprovalStatusResponse(
+        request_id=request.request_id,
+        status=request.status
+    )
+    
+    if request.status in ["approved", "denied"]:
+        response.decision = request.status
+        response.reason = request.decision_reason
+    
+    return response
+
+
+def _created_response(request_id: str) -> Dict[str, Any]:
+    """Response for a newly created request, including its current status."""
+    request = approval_queue.get_request(request_id)
+    if not request:
+        return {"request_id": request_id, "status": "pending"}
+    return _status_response(request).model_dump()
+
+
 @app.get("/approval/status/{request_id}")
-async def get_approval_status(request_id: str) -> ApprovalStatusResponse:
+async def get_approval_status(request_id: str, wait: float = 0) -> ApprovalStatusResponse:
     """
     Get the status of an approval request.
     Called by the Claude Code hook to poll for a decision.
+    
+    If ``wait`` is given and the request is still pending, the response is
+    held open for up to ``wait`` seconds (capped at MAX_STATUS_WAIT) and
+    returned as soon as a decision arrives.
     """
     try:
-        request = approval_queue.get_request(request_id)
+        request = await _wait_for_decision(request_id, wait)
         
         if not request:
             raise HTTPException(status_code=404, detail="Request not found")
         
-        response = ApprovalStatusResponse(
-            request_id=request_id,
-            status=request.status
-        )
-        
-        if request.status in ["approved", "denied"]:
-            response.decision = request.status
-            response.reason = request.decision_reason
-        
-        return response
+        return _status_response(request)
         
     except HTTPException:
         raise
@@ -133,6 +251,30 @@ async def get_approval_status(request_id: str) -> ApprovalStatusResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/approval/stream/{request_id}")
+async def stream_approval_decision(request_id: str, timeout: float = MAX_STREAM_WAIT):
+    """
+    Stream the decision for an approval request as server-sent events.
+    Called by the Claude Code hook instead of polling.
+    
+    The response stays open until a decision arrives or ``timeout`` seconds
+    (capped at MAX_STREAM_WAIT) pass, then sends a single ``data:`` frame
+    with the request status and closes.
+    """
+    if not approval_queue.get_request(request_id):
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    async def events():
+        request = await _wait_for_decision(request_id, timeout, max_wait=MAX_STREAM_WAIT)
+        yield f"data: {_status_response(request).model_dump_json()}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @app.post("/approval/respond")
 async def submit_approval_response(response: ApprovalResponseModel) -> Dict[str, str]:
     """
@@ -157,6 +299,9 @@ async def submit_approval_response(response: ApprovalResponseModel) -> Dict[str,
                 detail="Request already processed or not found"
             )
         
+        # Wake any hook long-polling for this decision
+        _wake_waiters(response.request_id)
+        
         logger.info(f"Updated request {response.request_id} to {status}")
         
         return {
@@ -210,6 +355,13 @@ async def timeout_old_requests(seconds: int = 60) -> Dict[str, int]:
     try:
         count = approval_queue.timeout_pending_requests(seconds=seconds)
         
+        # Wake hooks long-polling for requests that just timed out
+        if count:
+            for request_id in list(decision_events):
+                request = approval_queue.get_request(request_id)
+                if not request or request.status != "pending":
+                    _wake_waiters(request_id)
+        
         return {
             "timed_out": count,
             "message": f"Timed out {count} requests older than {seconds} seconds"
@@ -310,6 +462,107 @@ def register_notification_callback(callback):
     notification_callbacks.append(callback)
 
 
+async def _handle_unix_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch one message received on the Unix socket."""
+    op = message.get("op")
+    
+    if op == "request":
+        request = ApprovalRequestModel(**message.get("data", {}))
+        request_id = approval_queue.add_request(
+            session_id=request.session_id,
+            tool_name=request.tool_name,
+            tool_input=request.tool_input,
+            project_dir=request.project_dir,
+            tool_input_hash=request.tool_input_hash,
+            tool_input_length=request.tool_input_length
+        )
+        task = asyncio.create_task(notify_new_request(request_id))
+        _unix_tasks.add(task)
+        task.add_done_callback(_unix_tasks.discard)
+        
+        logger.info(f"Created approval request {request_id} for {request.tool_name}")
+        return _created_response(request_id)
+    
+    if op == "status":
+        request = await _wait_for_decision(message["request_id"], float(message.get("wait", 0)))
+        if not request:
+            return {"error": "Request not found"}
+        return _status_response(request).model_dump()
+    
+    return {"error": f"Unknown operation: {op}"}
+
+
+async def _handle_unix_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Serve a hook connected over the Unix socket.
+    
+    Messages in both directions are JSON objects prefixed with their length
+    as a 4-byte big-endian integer; a hook keeps its connection open for the
+    request and all of its status calls.
+    """
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(4)
+            except asyncio.IncompleteReadError:
+                break
+            (length,) = struct.unpack("!I", header)
+            message = json.loads(await reader.readexactly(length))
+            
+            try:
+                reply = await _handle_unix_message(message)
+            except Exception as e:
+                logger.error(f"Error handling IPC message: {e}")
+                reply = {"error": str(e)}
+            
+            data = json.dumps(reply).encode("utf-8")
+            writer.write(struct.pack("!I", len(data)) + data)
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        logger.error(f"Unix socket client error: {e}")
+    finally:
+        writer.close()
+
+
+@app.on_event("startup")
+async def start_unix_server():
+    """Start listening on the Unix socket alongside HTTP."""
+    global _unix_server
+    if not IPC_SOCKET or not hasattr(socket, "AF_UNIX"):
+        return
+    
+    try:
+        if os.path.exists(IPC_SOCKET):
+            os.unlink(IPC_SOCKET)
+        # Create the socket owner-only rather than fixing its mode after the bind
+        old_umask = os.umask(0o177)
+        try:
+            _unix_server = await asyncio.start_unix_server(_handle_unix_client, path=IPC_SOCKET)
+        finally:
+            os.umask(old_umask)
+        logger.info(f"Listening for hooks on {IPC_SOCKET}")
+    except OSError as e:
+        logger.warning(f"Unix socket unavailable, serving HTTP only: {e}")
+
+
+@app.on_event("shutdown")
+async def stop_unix_server():
+    """Close the Unix socket listener."""
+    global _unix_server
+    if _unix_server is None:
+        return
+    
+    _unix_server.close()
+    await _unix_server.wait_closed()
+    _unix_server = None
+    try:
+        os.unlink(IPC_SOCKET)
+    except OSError:
+        pass
+
+
 def run_server(host: str = "127.0.0.1", port: int = 8765):
     """Run the IPC server."""
     logging.basicConfig(
@@ -26,6 +26,8 @@ class ApprovalRequest:
     user_id: Optional[int] = None
     decision_reason: Optional[str] = None
     project_dir: Optional[str] = None
+    tool_input_hash: Optional[str] = None  # digest of the full input when tool_input is a preview
+    tool_input_length: Optional[int] = None  # characters in the full input when tool_input is a preview
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -48,7 +50,9 @@ class ApprovalRequest:
             response_time=datetime.fromisoformat(row[6]) if row[6] else None,
             user_id=row[7],
             decision_reason=row[8],
-            project_dir=row[9] if len(row) > 9 else None
+            project_dir=row[9] if len(row) > 9 else None,
+            tool_input_hash=row[10] if len(row) > 10 else None,
+            tool_input_length=row[11] if len(row) > 11 else None
         )
     
     def format_for_telegram(self) -> str:
@@ -75,6 +79,11 @@ class ApprovalRequest:
             message += f"**Tool:** {self.tool_name}\n"
             message += f"**Details:** `{str(self.tool_input)[:100]}...`\n"
         
+        # The hook only sent a preview of a long input; say so explicitly
+        if self.tool_input_hash:
+            length = f"{self.tool_input_length} chars, " if self.tool_input_length else ""
+            message += f"…(truncated, {length}hash {self.tool_input_hash[:8]})\n"
+        
         # Add project directory if available
         if self.project_dir:
             # Extract just the project name from the full path
@@ -112,6 +121,8 @@ class ApprovalQueue:
                     user_id INTEGER,
                     decision_reason TEXT,
                     project_dir TEXT,
+                    tool_input_hash TEXT,
+                    tool_input_length INTEGER,
                     CHECK (status IN ('pending', 'approved', 'denied', 'timeout'))
                 )
             """)
@@ -123,6 +134,12 @@ class ApprovalQueue:
             if 'project_dir' not in columns:
                 conn.execute("ALTER TABLE approval_requests ADD COLUMN project_dir TEXT")
                 logger.info("Added project_dir column to approval_requests table")
+            if 'tool_input_hash' not in columns:
+                conn.execute("ALTER TABLE approval_requests ADD COLUMN tool_input_hash TEXT")
+                logger.info("Added tool_input_hash column to approval_requests table")
+            if 'tool_input_length' not in columns:
+                conn.execute("ALTER TABLE approval_requests ADD COLUMN tool_input_length INTEGER")
+                logger.info("Added tool_input_length column to approval_requests table")
             
             # Create indices for efficient queries
             conn.execute("""
@@ -142,7 +159,9 @@ class ApprovalQueue:
             logger.info(f"Initialized approval database at {self.db_path}")
     
     def add_request(self, session_id: str, tool_name: str, 
-                   tool_input: Dict[str, Any], project_dir: Optional[str] = None) -> str:
+                   tool_input: Dict[str, Any], project_dir: Optional[str] = None,
+                   tool_input_hash: Optional[str] = None,
+                   tool_input_length: Optional[int] = None) -> str:
         """Add a new approval request and return its ID."""
         request_id = str(uuid.uuid4())
         timestamp = datetime.now()
@@ -153,14 +172,17 @@ class ApprovalQueue:
             timestamp=timestamp,
             tool_name=tool_name,
             tool_input=tool_input,
-            project_dir=project_dir
+            project_dir=project_dir,
+            tool_input_hash=tool_input_hash,
+            tool_input_length=tool_input_length
         )
         
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("""
                 INSERT INTO approval_requests 
-                (request_id, session_id, timestamp, tool_name, tool_input, status, project_dir)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (request_id, session_id, timestamp, tool_name, tool_input, status,
+                 project_dir, tool_input_hash, tool_input_length)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 request.request_id,
                 request.session_id,
@@ -168,7 +190,9 @@ class ApprovalQueue:
                 request.tool_name,
                 json.dumps(request.tool_input),
                 request.status,
-                request.project_dir
+                request.project_dir,
+                request.tool_input_hash,
+                request.tool_input_length
             ))
             conn.commit()
         
@@ -2,16 +2,96 @@
 Release data parser for CC Release Monitor.
 """
 
+import io
 import logging
 import re
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 from .utils import format_datetime, parse_datetime
 
+if TYPE_CHECKING:
+    # version_manager uses CHANGELOG_HEADER_RE, so only import it for annotations
+    from .version_manager import VersionManager
+
 logger = logging.getLogger(__name__)
 
+# Number of parsed releases/commits kept in memory
+PARSE_CACHE_SIZE = 256
+
+# Number of formatted notification messages kept in memory
+FORMAT_CACHE_SIZE = 128
+
+
+# Changelog version header line: one to three '#' followed by a title that
+# starts with "v" or contains a digit or the word "version", e.g. "## v1.2.3",
+# "# Version 2", "### 1.0.0". Shared by every changelog parser in the bots.
+CHANGELOG_HEADER_RE = re.compile(
+    r'^[^\S\n]*#{1,3}(?!#)[^\S\n]*(?:v|.*?(?:\d|version)).*', re.IGNORECASE | re.MULTILINE
+)
+
+
+def _is_version_header(line: str) -> bool:
+    """Return True if the provided (stripped) line looks like a changelog version header."""
+    return CHANGELOG_HEADER_RE.match(line) is not None
+
+
+def extract_changelog_entries(
+    content: str,
+    max_entries: int = 1,
+    entry_char_limit: int = 1200,
+    skip_blank_lines: bool = False,
+) -> List[str]:
+    """
+    Extract up to max_entries changelog sections from raw content.
+    
+    Args:
+        content: Raw CHANGELOG.md text
+        max_entries: Maximum number of version sections to return
+        entry_char_limit: Maximum length of each section (None for no limit)
+        skip_blank_lines: Drop blank lines inside sections
+        
+    Returns:
+        List of changelog sections, newest first
+    """
+    entries: List[str] = []
+    current: List[str] = []
+    current_length = 0
+    in_entry = False
+
+    # Read lines lazily so a large CHANGELOG is not split in full when only
+    # the first few entries at the top are needed
+    for raw_line in io.StringIO(content, newline=None):
+        stripped = raw_line.strip()
+
+        if _is_version_header(stripped):
+            if current:
+                entries.append("\n".join(current).strip())
+                if len(entries) >= max_entries:
+                    return entries
+
+            current = [stripped]
+            current_length = len(stripped)
+            in_entry = True
+            continue
+
+        if not in_entry or (skip_blank_lines and not stripped):
+            continue
+
+        line_to_add = stripped if stripped else ""
+        prospective_length = current_length + len(line_to_add) + 1
+        if entry_char_limit is None or prospective_length <= entry_char_limit:
+            current.append(line_to_add)
+            current_length = prospective_length
+
+    if current and len(entries) < max_entries:
+        entries.append("\n".join(current).strip())
+
+    return entries
+
 
 class ReleaseParser:
     """Parser for GitHub release data."""
@@ -27,6 +107,35 @@ class ReleaseParser:
             'list_items': re.compile(r'^[-*+]\s+(.+)$', re.MULTILINE),
             'numbered_items': re.compile(r'^\d+\.\s+(.+)$', re.MULTILINE)
         }
+        self._parse_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._format_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        # Parsers are shared with worker threads (asyncio.to_thread)
+        self._cache_lock = threading.Lock()
+    
+    def _get_cached(self, key: Optional[Tuple[Any, ...]], cache: Optional[OrderedDict] = None) -> Any:
+        """Return a previously computed result for key (parse cache by default), if any."""
+        if key is None:
+            return None
+        if cache is None:
+            cache = self._parse_cache
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+        return value
+    
+    def _set_cached(self, key: Optional[Tuple[Any, ...]], value: Any,
+                    cache: Optional[OrderedDict] = None, max_size: int = PARSE_CACHE_SIZE) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if key is None:
+            return
+        if cache is None:
+            cache = self._parse_cache
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
     
     def _escape_markdown(self, text: str) -> str:
         """
@@ -60,6 +169,13 @@ class ReleaseParser:
         Returns:
             Parsed release information
         """
+        # Releases can be edited in place, so the body is part of the key
+        release_id = release_data.get('node_id')
+        cache_key = ('release', release_id, release_data.get('body')) if release_id else None
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             parsed = {
                 'version': self._extract_version(release_data),
@@ -83,6 +199,7 @@ class ReleaseParser:
             }
             
             logger.debug(f"Parsed release: {parsed['version']} ({parsed['name']})")
+            self._set_cached(cache_key, parsed)
             return parsed
             
         except Exception as e:
@@ -318,6 +435,20 @@ class ReleaseParser:
         Returns:
             Formatted message text
         """
+        release_id = parsed_release.get('metadata', {}).get('node_id')
+        cache_key = (
+            ('release', release_id, parsed_release.get('body'), include_body)
+            if release_id else None
+        )
+        message = self._get_cached(cache_key, self._format_cache)
+        if message is None:
+            message = self._render_release_notification(parsed_release, include_body)
+            self._set_cached(cache_key, message, self._format_cache, FORMAT_CACHE_SIZE)
+        return message
+    
+    def _render_release_notification(self, parsed_release: Dict[str, Any],
+                                     include_body: bool) -> str:
+        """Build the notification text for format_release_for_notification."""
         try:
             # Emoji indicators
             if parsed_release['prerelease']:
@@ -480,6 +611,13 @@ class ReleaseParser:
         Returns:
             Parsed commit information
         """
+        # Commits are immutable, but list payloads omit the files/stats of the detail endpoint
+        sha = commit_data.get('sha')
+        cache_key = ('commit', sha, 'files' in commit_data) if sha else None
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             commit_info = commit_data.get('commit', {})
             author_info = commit_info.get('author', {})
@@ -516,12 +654,30 @@ class ReleaseParser:
             }
             
             logger.debug(f"Parsed commit: {parsed['short_sha']} - {parsed['subject']}")
+            self._set_cached(cache_key, parsed)
             return parsed
             
         except Exception as e:
             logger.error(f"Error parsing commit data: {e}")
             return self._create_fallback_commit_data(commit_data)
 
+    def parse_commits(self, commits: List[Dict[str, Any]],
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse a list of GitHub commits, stopping once limit commits are parsed.
+        
+        Args:
+            commits: Raw commit data from GitHub API
+            limit: Maximum number of commits to parse (all if None)
+            
+        Returns:
+            List of parsed commit information
+        """
+        if limit is not None:
+            commits = commits[:limit]
+        parse_commit = self.parse_commit
+        return [parse_commit(commit) for commit in commits]
+
     def _extract_commit_subject(self, message: str) -> str:
         """Extract commit subject (first line) from commit message."""
         if not message:
@@ -613,13 +769,15 @@ class ReleaseParser:
         }
 
     def format_commits_for_notification(self, commits: List[Dict[str, Any]], 
-                                      limit: int = 5) -> str:
+                                      limit: int = 5,
+                                      total: Optional[int] = None) -> str:
         """
         Format list of parsed commits for Telegram notification.
         
         Args:
             commits: List of parsed commit data
             limit: Maximum number of commits to include
+            total: Total number of commits available, if more than were parsed
             
         Returns:
             Formatted message text
@@ -627,6 +785,29 @@ class ReleaseParser:
         if not commits:
             return "No commits found."
         
+        if total is None:
+            total = len(commits)
+        
+        # Commits are immutable, so their SHAs (plus whether stats were fetched)
+        # identify the rendered text
+        cache_key = (
+            'commits',
+            tuple(
+                (commit['sha'], commit.get('metadata', {}).get('total_changes'))
+                for commit in commits[:limit]
+            ),
+            limit,
+            total
+        )
+        message = self._get_cached(cache_key, self._format_cache)
+        if message is None:
+            message = self._render_commits_notification(commits, limit, total)
+            self._set_cached(cache_key, message, self._format_cache, FORMAT_CACHE_SIZE)
+        return message
+    
+    def _render_commits_notification(self, commits: List[Dict[str, Any]],
+                                     limit: int, total: int) -> str:
+        """Build the notification text for format_commits_for_notification."""
         message_parts = []
         message_parts.append("📝 *Recent Commits:*\n")
         
@@ -670,8 +851,8 @@ class ReleaseParser:
             message_parts.append("")  # Empty line between commits
         
         # Add summary if there are more commits
-        if len(commits) > limit:
-            remaining = len(commits) - limit
+        if total > limit:
+            remaining = total - limit
             message_parts.append(f"... and {remaining} more commit{'s' if remaining != 1 else ''}")
         
         return "\n".join(message_parts).strip()
@@ -694,4 +875,46 @@ class ReleaseParser:
         if len(subject) > 50:
             subject = subject[:47] + "..."
         
-        return f"📝 `{short_sha}` {subject} - {author}"
\ No newline at end of file
+        return f"📝 `{short_sha}` {subject} - {author}"
+
+    def handle_release_for_monitor(self, release_data: Dict[str, Any],
+                                   version_manager: "VersionManager") -> Optional[Tuple[str, str]]:
+        """
+        Record a fetched release and build its notification if it is new.
+        
+        Tracking, parsing and formatting run as one call, so monitoring can
+        do all of it in a single worker thread.
+        
+        Args:
+            release_data: Release data from GitHub API
+            version_manager: Version manager tracking the repository
+            
+        Returns:
+            Tuple of (version, notification text) for a new release, else None
+        """
+        if not version_manager.update_version(release_data):
+            return None
+        
+        parsed = self.parse_release(release_data)
+        message = self.format_release_for_notification(parsed, include_body=True)
+        return parsed.get("version", "Unknown"), message
+
+    def handle_commits_for_monitor(self, commits: List[Dict[str, Any]],
+                                   version_manager: "VersionManager",
+                                   limit: int = 3) -> Optional[str]:
+        """
+        Record the newest fetched commit and build a notification if it is new.
+        
+        Args:
+            commits: Commit data from GitHub API, newest first
+            version_manager: Version manager tracking the repository
+            limit: Maximum number of commits to include
+            
+        Returns:
+            Notification text for new commits, else None
+        """
+        if not commits or not version_manager.update_commit(commits[0]):
+            return None
+        
+        parsed_commits = self.parse_commits(commits, limit=limit)
+        return self.format_commits_for_notification(parsed_commits, limit=limit)
@@ -3,7 +3,7 @@ Repository manager for handling multiple GitHub repositories.
 """
 
 from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,21 @@ class Repository:
     latest_content_source: str = "release"
     changelog_path: str = "CHANGELOG.md"
     
+    # GitHub web URLs, rendered once instead of on every bot command
+    html_url: str = field(init=False, repr=False)
+    commits_url: str = field(init=False, repr=False)
+    changelog_url: str = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Pre-render the repository's GitHub URLs."""
+        self.html_url = f"https://github.com/{self.owner}/{self.name}"
+        self.commits_url = f"{self.html_url}/commits"
+        self.changelog_url = f"{self.html_url}/blob/main/{self.changelog_path}"
+    
+    def commit_url(self, sha: str) -> str:
+        """Get the GitHub URL of a commit."""
+        return f"{self.html_url}/commit/{sha}"
+    
     @property
     def full_name(self) -> str:
         """Get the full repository name (owner/name)."""
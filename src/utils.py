@@ -6,11 +6,17 @@ import os
 import json
 import logging
 import hashlib
+import tempfile
 from typing import Any, Dict, Optional, Union, List
 from pathlib import Path
 from datetime import datetime, timezone
 import asyncio
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +66,47 @@ def setup_logging(log_level: str = "INFO", log_directory: str = "./logs") -> Non
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as text or bytes
+        
+    Returns:
+        Parsed data
+        
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when it is installed.
+    
+    Values that are not JSON serializable are converted with str().
+    
+    Args:
+        data: Data to serialize
+        indent: Whether to pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, default=str
+    ).encode('utf-8')
+
+
 def load_json_file(file_path: Union[str, Path], default: Any = None) -> Any:
     """
     Load JSON data from file.
@@ -72,8 +119,8 @@ def load_json_file(file_path: Union[str, Path], default: Any = None) -> Any:
         Loaded JSON data or default value
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         logger.debug(f"JSON file not found: {file_path}")
         return default
@@ -87,7 +134,10 @@ def load_json_file(file_path: Union[str, Path], default: Any = None) -> Any:
 
 def save_json_file(data: Any, file_path: Union[str, Path], indent: int = 2) -> bool:
     """
-    Save data to JSON file.
+    Save data to JSON file atomically.
+    
+    The data is written to a temporary file in the same directory and then
+    moved over the target, so readers never see a partially written file.
     
     Args:
         data: Data to save
@@ -97,15 +147,27 @@ def save_json_file(data: Any, file_path: Union[str, Path], indent: int = 2) -> b
     Returns:
         True if successful, False otherwise
     """
+    path = Path(file_path)
+    tmp_path = None
     try:
         # Ensure directory exists
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=path.parent,
+            prefix=f".{path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            f.write(json_dumps(data, indent=bool(indent)))
+        os.replace(tmp_path, path)
         return True
     except Exception as e:
         logger.error(f"Error saving JSON file {file_path}: {e}")
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
         return False
 
 
@@ -2,26 +2,124 @@
 Version management for CC Release Monitor.
 """
 
+import functools
+import hashlib
 import logging
 import re
-from typing import Optional, Dict, Any, List, Tuple
+import sys
+import threading
+from collections import Counter, deque
+from typing import Optional, Dict, Any, Deque, List, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
 
 from .config import Config
+from .release_parser import CHANGELOG_HEADER_RE
 from .utils import load_json_file, save_json_file, get_utc_now
 
 logger = logging.getLogger(__name__)
 
+# Number of history entries kept, oldest dropped first
+HISTORY_LIMIT = 100
+
+# Lines and version headers taken into a changelog history preview
+CHANGELOG_PREVIEW_LINES = 50
+CHANGELOG_PREVIEW_ENTRIES = 3
+
+# Full semantic version, and a looser prefix match for non-standard versions
+_SEMVER_RE = re.compile(
+    r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$'
+)
+_SIMPLE_VERSION_RE = re.compile(r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
+
+def _history_key(entry: Dict[str, Any]) -> Tuple[Optional[str], bool]:
+    """Return the (entry type, is_new) key a history entry is counted under."""
+    return entry.get('type'), bool(entry.get('is_new', False))
+
+
+def _prerelease_key(prerelease: Optional[str]) -> Tuple[Tuple[int, Any], ...]:
+    """
+    Build the sort key for a prerelease per SemVer precedence rules.
+    
+    Numeric identifiers compare numerically and sort before alphanumeric
+    ones, and a longer identifier list wins when the shared part is equal.
+    
+    Args:
+        prerelease: Prerelease part of a version (e.g., "beta.11"), or None
+        
+    Returns:
+        Tuple of (0, number) or (1, text) per dot-separated identifier
+    """
+    if not prerelease:
+        return ()
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in prerelease.split('.')
+    )
+
+
+def _changelog_preview(changelog_content: str) -> Tuple[str, int]:
+    """
+    Build the history preview of a changelog.
+    
+    The preview holds the non-blank lines, stripped, from the start of the
+    changelog up to its third version header, or its first 50 lines.
+    
+    Args:
+        changelog_content: Full CHANGELOG.md content
+        
+    Returns:
+        Tuple of (preview text, number of version headers found)
+    """
+    # Find the end of the first lines without splitting the whole changelog
+    end = -1
+    for _ in range(CHANGELOG_PREVIEW_LINES):
+        end = changelog_content.find('\n', end + 1)
+        if end == -1:
+            end = len(changelog_content)
+            break
+    window = changelog_content[:end]
+    
+    entry_count = 0
+    for match in CHANGELOG_HEADER_RE.finditer(window):
+        entry_count += 1
+        if entry_count >= CHANGELOG_PREVIEW_ENTRIES:
+            window = window[:match.end()]
+            break
+    
+    return '\n'.join(filter(None, map(str.strip, window.split('\n')))), entry_count
+
+
+def _changelog_hash(changelog_content: str) -> str:
+    """Return the content hash used to detect changelog changes."""
+    # Change detection only, so the fastest hashlib digest is fine; 16 bytes
+    # keeps the stored hex the same length as the MD5 used before
+    return hashlib.blake2b(changelog_content.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class VersionError(Exception):
     """Version management error exception."""
     pass
 
 
+def _synchronized(method):
+    """Serialize calls to a VersionManager method that mutates and saves state."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    
+    return wrapper
+
+
+@functools.total_ordering
 class SemanticVersion:
     """Semantic version parser and comparator."""
     
+    # Many instances are kept by the parse cache, so skip the per-instance __dict__
+    __slots__ = ('original', 'clean', 'major', 'minor', 'patch', 'prerelease', 'build', '_key')
+    
     def __init__(self, version_string: str):
         """
         Initialize semantic version.
@@ -32,6 +130,32 @@ class SemanticVersion:
         self.original = version_string
         self.clean = self._clean_version(version_string)
         self.major, self.minor, self.patch, self.prerelease, self.build = self._parse_version(self.clean)
+        
+        # Ordering key: a release sorts after its prereleases; build metadata
+        # is ignored
+        self._key = (
+            self.major, self.minor, self.patch,
+            1 if self.prerelease is None else 0, _prerelease_key(self.prerelease),
+        )
+    
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def parse(cls, version_string: str) -> "SemanticVersion":
+        """
+        Parse a version string, reusing the result for repeated strings.
+        
+        The returned instance is shared between callers and must not be modified.
+        
+        Args:
+            version_string: Version string (e.g., "1.2.3", "v1.2.3-beta.1")
+            
+        Returns:
+            Parsed SemanticVersion
+            
+        Raises:
+            VersionError: If the version string is invalid
+        """
+        return cls(version_string)
     
     def _clean_version(self, version: str) -> str:
         """Clean version string by removing common prefixes."""
@@ -47,14 +171,11 @@ class SemanticVersion:
         Returns:
             Tuple of (major, minor, patch, prerelease, build)
         """
-        # Regex for semantic versioning
-        pattern = r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$'
-        match = re.match(pattern, version)
+        match = _SEMVER_RE.match(version)
         
         if not match:
             # Try simpler pattern for non-standard versions
-            simple_pattern = r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?'
-            simple_match = re.match(simple_pattern, version)
+            simple_match = _SIMPLE_VERSION_RE.match(version)
             
             if simple_match:
                 major = int(simple_match.group(1))
@@ -67,8 +188,13 @@ class SemanticVersion:
         major = int(match.group(1))
         minor = int(match.group(2))
         patch = int(match.group(3))
+        # Tags repeat across parses, so share one string object per label
         prerelease = match.group(4)
+        if prerelease:
+            prerelease = sys.intern(prerelease)
         build = match.group(5)
+        if build:
+            build = sys.intern(build)
         
         return major, minor, patch, prerelease, build
     
@@ -89,40 +215,13 @@ class SemanticVersion:
         """Equality comparison."""
         if not isinstance(other, SemanticVersion):
             return False
-        return (self.major, self.minor, self.patch, self.prerelease) == \
-               (other.major, other.minor, other.patch, other.prerelease)
+        return self._key == other._key
     
     def __lt__(self, other) -> bool:
-        """Less than comparison."""
+        """Less than comparison; the other operators come from total_ordering."""
         if not isinstance(other, SemanticVersion):
-            raise TypeError("Cannot compare SemanticVersion with other types")
-        
-        # Compare major.minor.patch
-        if (self.major, self.minor, self.patch) != (other.major, other.minor, other.patch):
-            return (self.major, self.minor, self.patch) < (other.major, other.minor, other.patch)
-        
-        # Handle prerelease versions
-        if self.prerelease is None and other.prerelease is None:
-            return False  # Equal
-        if self.prerelease is None and other.prerelease is not None:
-            return False  # Release > prerelease
-        if self.prerelease is not None and other.prerelease is None:
-            return True   # prerelease < release
-        
-        # Both have prerelease, compare lexically
-        return self.prerelease < other.prerelease
-    
-    def __le__(self, other) -> bool:
-        """Less than or equal comparison."""
-        return self < other or self == other
-    
-    def __gt__(self, other) -> bool:
-        """Greater than comparison."""
-        return not self <= other
-    
-    def __ge__(self, other) -> bool:
-        """Greater than or equal comparison."""
-        return not self < other
+            return NotImplemented
+        return self._key < other._key
     
     def is_prerelease(self) -> bool:
         """Check if this is a prerelease version."""
@@ -150,9 +249,19 @@ class VersionManager:
         # Ensure data directory exists
         Path(config.data_directory).mkdir(parents=True, exist_ok=True)
         
+        # Updates may run in worker threads, so mutations and saves are serialized
+        self._lock = threading.RLock()
+        
         self._version_data = self._load_version_data()
         self._history = self._load_history()
         
+        # (entry type, is_new) -> number of entries in the history window,
+        # kept in step with appends so statistics don't rescan the history
+        self._history_counts = Counter(_history_key(entry) for entry in self._history)
+        
+        # Parsed form of last_known_version; set whenever that value is written
+        self._last_known_parsed: Optional[SemanticVersion] = None
+        
         # Monitoring state
         self.monitoring_active = False
     
@@ -183,20 +292,47 @@ class VersionManager:
             logger.debug(f"Saved version data: {self._version_data.get('last_known_version', 'None')}")
         return success
     
-    def _load_history(self) -> List[Dict[str, Any]]:
+    def _load_history(self) -> Deque[Dict[str, Any]]:
         """Load version history from file."""
         history = load_json_file(self.history_file, [])
         if not isinstance(history, list):
             logger.warning("Invalid history data, starting fresh")
-            return []
-        return history
+            history = []
+        # Appending past the limit drops the oldest entry
+        return deque(history, maxlen=HISTORY_LIMIT)
     
     def _save_history(self) -> bool:
         """Save version history to file."""
-        return save_json_file(self._history, self.history_file)
+        return save_json_file(list(self._history), self.history_file)
+    
+    def _flush(self) -> bool:
+        """Save version data and history after one logical update."""
+        data_saved = self._save_version_data()
+        history_saved = self._save_history()
+        return data_saved and history_saved
+    
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """Append a history entry and update the entry counters."""
+        if len(self._history) == self._history.maxlen:
+            self._history_counts[_history_key(self._history[0])] -= 1
+        self._history.append(entry)
+        self._history_counts[_history_key(entry)] += 1
+    
+    def _count_history(self, entry_type: Optional[str]) -> Tuple[int, int]:
+        """
+        Count history entries of one type.
+        
+        Args:
+            entry_type: Entry type ("commit", "changelog", or None for releases)
+            
+        Returns:
+            Tuple of (total entries, new entries)
+        """
+        new = self._history_counts[(entry_type, True)]
+        return new + self._history_counts[(entry_type, False)], new
     
     def _add_to_history(self, version: str, release_data: Dict[str, Any], 
-                       check_time: datetime, is_new: bool = False) -> None:
+                       check_time: datetime, is_new: bool = False, save: bool = True) -> None:
         """
         Add entry to version history.
         
@@ -205,6 +341,7 @@ class VersionManager:
             release_data: Release data from GitHub
             check_time: Time of check
             is_new: Whether this is a new version
+            save: Whether to write the history file now
         """
         entry = {
             "version": version,
@@ -217,15 +354,13 @@ class VersionManager:
             "name": release_data.get("name")
         }
         
-        self._history.append(entry)
-        
-        # Keep only last 100 entries
-        if len(self._history) > 100:
-            self._history = self._history[-100:]
+        self._append_history(entry)
         
-        self._save_history()
+        if save:
+            self._save_history()
         logger.debug(f"Added to history: {version} (new: {is_new})")
     
+    @_synchronized
     def update_version(self, release_data: Dict[str, Any]) -> bool:
         """
         Update version information with new release data.
@@ -244,7 +379,7 @@ class VersionManager:
             return False
         
         try:
-            new_version = SemanticVersion(tag_name)
+            new_version = SemanticVersion.parse(tag_name)
         except VersionError as e:
             logger.error(f"Failed to parse version {tag_name}: {e}")
             return False
@@ -261,7 +396,8 @@ class VersionManager:
             is_new_version = True
         else:
             try:
-                last_version = SemanticVersion(last_known)
+                last_version = self._last_known_parsed or SemanticVersion.parse(last_known)
+                self._last_known_parsed = last_version
                 if new_version > last_version:
                     logger.info(f"New version detected: {last_version} -> {new_version}")
                     is_new_version = True
@@ -276,16 +412,15 @@ class VersionManager:
         # Update stored data
         if is_new_version or last_known is None:
             self._version_data["last_known_version"] = str(new_version)
+            self._last_known_parsed = new_version
             self._version_data["last_release_data"] = release_data
         
         # Always update latest release data for reference
         self._version_data["latest_release_data"] = release_data
         
-        # Save data
-        self._save_version_data()
-        
-        # Add to history
-        self._add_to_history(str(new_version), release_data, current_time, is_new_version)
+        # Add to history, then write both files together
+        self._add_to_history(str(new_version), release_data, current_time, is_new_version, save=False)
+        self._flush()
         
         return is_new_version
     
@@ -315,8 +450,8 @@ class VersionManager:
         Raises:
             VersionError: If version strings are invalid
         """
-        v1 = SemanticVersion(version1)
-        v2 = SemanticVersion(version2)
+        v1 = SemanticVersion.parse(version1)
+        v2 = SemanticVersion.parse(version2)
         
         if v1 < v2:
             return -1
@@ -377,7 +512,7 @@ class VersionManager:
             except ValueError:
                 pass
         
-        new_versions = sum(1 for entry in self._history if entry.get("is_new", False))
+        new_versions = sum(n for (_, is_new), n in self._history_counts.items() if is_new)
         
         return {
             "last_known_version": self.get_last_known_version(),
@@ -393,6 +528,7 @@ class VersionManager:
             )
         }
     
+    @_synchronized
     def mark_notification_sent(self, version: str) -> None:
         """
         Mark that notification was sent for a version.
@@ -423,6 +559,7 @@ class VersionManager:
         
         return last_notification.get("version") == version
     
+    @_synchronized
     def update_commit(self, commit_data: Dict[str, Any]) -> bool:
         """
         Update commit information with new commit data.
@@ -465,16 +602,14 @@ class VersionManager:
         # Always update latest commit data for reference
         self._version_data["latest_commit_data"] = commit_data
         
-        # Save data
-        self._save_version_data()
-        
-        # Add to history
-        self._add_commit_to_history(commit_sha, commit_data, current_time, is_new_commit)
+        # Add to history, then write both files together
+        self._add_commit_to_history(commit_sha, commit_data, current_time, is_new_commit, save=False)
+        self._flush()
         
         return is_new_commit
 
     def _add_commit_to_history(self, commit_sha: str, commit_data: Dict[str, Any], 
-                              check_time: datetime, is_new: bool = False) -> None:
+                              check_time: datetime, is_new: bool = False, save: bool = True) -> None:
         """
         Add commit entry to version history.
         
@@ -483,6 +618,7 @@ class VersionManager:
             commit_data: Commit data from GitHub
             check_time: Time of check
             is_new: Whether this is a new commit
+            save: Whether to write the history file now
         """
         commit_info = commit_data.get('commit', {})
         author_info = commit_info.get('author', {})
@@ -500,13 +636,10 @@ class VersionManager:
             "github_author": commit_data.get('author', {}).get('login', '') if commit_data.get('author') else ''
         }
         
-        self._history.append(entry)
-        
-        # Keep only last 100 entries
-        if len(self._history) > 100:
-            self._history = self._history[-100:]
+        self._append_history(entry)
         
-        self._save_history()
+        if save:
+            self._save_history()
         logger.debug(f"Added commit to history: {commit_sha[:8]} (new: {is_new})")
 
     def get_last_known_commit_sha(self) -> Optional[str]:
@@ -536,14 +669,13 @@ class VersionManager:
             except ValueError:
                 pass
         
-        commit_entries = [entry for entry in self._history if entry.get('type') == 'commit']
-        new_commits = sum(1 for entry in commit_entries if entry.get("is_new", False))
+        commit_entries, new_commits = self._count_history('commit')
         
         return {
             "last_known_commit_sha": self.get_last_known_commit_sha(),
             "last_commit_check_time": last_check,
             "commit_check_count": self._version_data.get("commit_check_count", 0),
-            "total_commit_entries": len(commit_entries),
+            "total_commit_entries": commit_entries,
             "new_commits_detected": new_commits,
             "time_since_last_commit_check": (
                 (get_utc_now() - last_check_dt).total_seconds() 
@@ -551,6 +683,7 @@ class VersionManager:
             )
         }
 
+    @_synchronized
     def reset_data(self, keep_history: bool = True) -> bool:
         """
         Reset version data.
@@ -563,6 +696,7 @@ class VersionManager:
         """
         try:
             # Reset main data
+            self._last_known_parsed = None
             self._version_data = {
                 "last_known_version": None,
                 "last_check_time": None,
@@ -579,7 +713,8 @@ class VersionManager:
             }
             
             if not keep_history:
-                self._history = []
+                self._history = deque(maxlen=HISTORY_LIMIT)
+                self._history_counts.clear()
                 self._save_history()
             
             success = self._save_version_data()
@@ -593,6 +728,7 @@ class VersionManager:
             logger.error(f"Failed to reset version data: {e}")
             return False
 
+    @_synchronized
     def update_changelog(self, changelog_content: str) -> bool:
         """
         Update changelog tracking with new content.
@@ -603,45 +739,47 @@ class VersionManager:
         Returns:
             True if this is new changelog content, False if same as before
         """
-        import hashlib
-        
         current_time = get_utc_now()
         
-        # Calculate content hash for change detection
-        content_hash = hashlib.md5(changelog_content.encode('utf-8')).hexdigest()
-        
         self._version_data["last_check_time"] = current_time.isoformat()
         self._version_data["changelog_check_count"] = self._version_data.get("changelog_check_count", 0) + 1
         
         last_known_hash = self._version_data.get("last_known_changelog_hash")
         is_new_changelog = False
         
-        if last_known_hash is None:
-            # First time checking changelog
-            logger.info("First changelog content detected")
-            is_new_changelog = True
-        elif last_known_hash != content_hash:
-            # Changelog content changed
-            logger.info("New changelog content detected")
-            is_new_changelog = True
-        else:
+        if last_known_hash is not None and self._version_data.get("last_changelog_content") == changelog_content:
+            # Most polls return the stored content unchanged. Comparing strings
+            # (lengths first, then a memcmp) is much cheaper than hashing them.
+            # A legacy MD5 hash is kept until the content actually changes.
+            content_hash = last_known_hash
             logger.debug("No changelog changes detected")
+        else:
+            # Calculate content hash for change detection
+            content_hash = _changelog_hash(changelog_content)
+            if last_known_hash is None:
+                # First time checking changelog
+                logger.info("First changelog content detected")
+                is_new_changelog = True
+            elif last_known_hash != content_hash:
+                # Changelog content changed
+                logger.info("New changelog content detected")
+                is_new_changelog = True
+            else:
+                logger.debug("No changelog changes detected")
         
         # Update stored data
-        if is_new_changelog or last_known_hash is None:
+        if is_new_changelog:
             self._version_data["last_known_changelog_hash"] = content_hash
             self._version_data["last_changelog_content"] = changelog_content
         
-        # Save data
-        self._save_version_data()
-        
-        # Add to history
-        self._add_changelog_to_history(content_hash, changelog_content, current_time, is_new_changelog)
+        # Add to history, then write both files together
+        self._add_changelog_to_history(content_hash, changelog_content, current_time, is_new_changelog, save=False)
+        self._flush()
         
         return is_new_changelog
 
     def _add_changelog_to_history(self, content_hash: str, changelog_content: str, 
-                                 check_time: datetime, is_new: bool = False) -> None:
+                                 check_time: datetime, is_new: bool = False, save: bool = True) -> None:
         """
         Add changelog entry to history.
         
@@ -650,27 +788,9 @@ class VersionManager:
             changelog_content: Changelog content
             check_time: Time of check
             is_new: Whether this is new changelog content
+            save: Whether to write the history file now
         """
-        # Extract first few entries for preview
-        changelog_lines = changelog_content.split('\n')
-        preview_lines = []
-        entry_count = 0
-        
-        for line in changelog_lines[:50]:  # First 50 lines
-            line = line.strip()
-            if line:
-                preview_lines.append(line)
-                # Count version entries
-                if ((line.startswith('##') and ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line))) or
-                   (line.startswith('#') and line.count('#') <= 2 and 
-                   ('v' in line.lower() or 'version' in line.lower() or 
-                   any(char.isdigit() for char in line)))):
-                    entry_count += 1
-                    if entry_count >= 3:  # Stop after finding 3 version entries
-                        break
-        
-        preview = '\n'.join(preview_lines)
+        preview, entry_count = _changelog_preview(changelog_content)
         
         entry = {
             "type": "changelog",
@@ -683,15 +803,35 @@ class VersionManager:
             "version_entries_found": entry_count
         }
         
-        self._history.append(entry)
-        
-        # Keep only last 100 entries
-        if len(self._history) > 100:
-            self._history = self._history[-100:]
+        self._append_history(entry)
         
-        self._save_history()
+        if save:
+            self._save_history()
         logger.debug(f"Added changelog to history: {content_hash[:8]} (new: {is_new})")
 
+    def is_changelog_unchanged(self, changelog_content: str) -> bool:
+        """
+        Check whether content matches the last known changelog without recording a check.
+        
+        Content that is only the start of the last known changelog, such as a
+        head-only fetch compared against a previously stored full file, also
+        counts as unchanged.
+        
+        Args:
+            changelog_content: Full CHANGELOG.md content or its first bytes
+            
+        Returns:
+            True if the content hash equals the stored hash or the content is
+            a prefix of the stored changelog
+        """
+        last_known_hash = self._version_data.get("last_known_changelog_hash")
+        if last_known_hash is None:
+            return False
+        if last_known_hash == _changelog_hash(changelog_content):
+            return True
+        last_content = self._version_data.get("last_changelog_content")
+        return bool(last_content) and last_content.startswith(changelog_content)
+
     def get_last_known_changelog_hash(self) -> Optional[str]:
         """Get the last known changelog content hash."""
         return self._version_data.get("last_known_changelog_hash")
@@ -715,14 +855,13 @@ class VersionManager:
             except ValueError:
                 pass
         
-        changelog_entries = [entry for entry in self._history if entry.get('type') == 'changelog']
-        new_changelog_updates = sum(1 for entry in changelog_entries if entry.get("is_new", False))
+        changelog_entries, new_changelog_updates = self._count_history('changelog')
         
         return {
             "last_known_changelog_hash": self.get_last_known_changelog_hash(),
             "last_changelog_check_time": last_check,
             "changelog_check_count": self._version_data.get("changelog_check_count", 0),
-            "total_changelog_entries": len(changelog_entries),
+            "total_changelog_entries": changelog_entries,
             "new_changelog_updates_detected": new_changelog_updates,
             "last_changelog_content_length": len(self.get_last_changelog_content() or ''),
             "time_since_last_changelog_check": (
@@ -731,6 +870,62 @@ class VersionManager:
             )
         }
 
+    def get_all_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get version, commit, changelog and monitoring statistics in one pass.
+        
+        Returns:
+            Dictionary with "version", "commit", "changelog" and "monitoring"
+            statistics, shaped like the individual get_*_statistics methods
+        """
+        last_check = self._version_data.get("last_check_time")
+        last_check_dt = None
+        if last_check:
+            try:
+                last_check_dt = datetime.fromisoformat(last_check.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+        time_since_last_check = (
+            (get_utc_now() - last_check_dt).total_seconds() 
+            if last_check_dt else None
+        )
+        
+        new_versions = sum(n for (_, is_new), n in self._history_counts.items() if is_new)
+        commit_entries, new_commits = self._count_history('commit')
+        changelog_entries, new_changelog_updates = self._count_history('changelog')
+        
+        return {
+            "version": {
+                "last_known_version": self.get_last_known_version(),
+                "last_check_time": last_check,
+                "check_count": self._version_data.get("check_count", 0),
+                "total_history_entries": len(self._history),
+                "new_versions_detected": new_versions,
+                "data_file_exists": self.data_file.exists(),
+                "history_file_exists": self.history_file.exists(),
+                "time_since_last_check": time_since_last_check
+            },
+            "commit": {
+                "last_known_commit_sha": self.get_last_known_commit_sha(),
+                "last_commit_check_time": last_check,
+                "commit_check_count": self._version_data.get("commit_check_count", 0),
+                "total_commit_entries": commit_entries,
+                "new_commits_detected": new_commits,
+                "time_since_last_commit_check": time_since_last_check
+            },
+            "changelog": {
+                "last_known_changelog_hash": self.get_last_known_changelog_hash(),
+                "last_changelog_check_time": last_check,
+                "changelog_check_count": self._version_data.get("changelog_check_count", 0),
+                "total_changelog_entries": changelog_entries,
+                "new_changelog_updates_detected": new_changelog_updates,
+                "last_changelog_content_length": len(self.get_last_changelog_content() or ''),
+                "time_since_last_changelog_check": time_since_last_check
+            },
+            "monitoring": self.get_monitoring_statistics()
+        }
+
+    @_synchronized
     def set_monitoring_active(self, active: bool) -> None:
         """
         Set monitoring active state.
@@ -0,0 +1,49 @@
+"""
+Tests for approval request models.
+"""
+
+from datetime import datetime
+from src.models.approval import ApprovalQueue, ApprovalRequest
+
+
+def _request(**kwargs):
+    """Build a Write approval request."""
+    return ApprovalRequest(
+        request_id="0123456789abcdef",
+        session_id="session-id",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+        tool_name="Write",
+        tool_input={"file_path": "/tmp/a.txt", "content": "x" * 512 + "…"},
+        **kwargs
+    )
+
+
+class TestFormatForTelegram:
+    """Test cases for ApprovalRequest.format_for_telegram."""
+
+    def test_truncated_input_is_marked(self):
+        """Test that a preview sent with its full-input hash is flagged as truncated."""
+        message = _request(tool_input_hash="a1b2c3d4e5f6a7b8", tool_input_length=20480).format_for_telegram()
+        assert "…(truncated, 20480 chars, hash a1b2c3d4)" in message
+
+    def test_full_input_is_not_marked(self):
+        """Test that an input sent in full carries no truncation marker."""
+        assert "truncated" not in _request().format_for_telegram()
+
+
+class TestApprovalQueue:
+    """Test cases for ApprovalQueue class."""
+
+    def test_preview_details_round_trip(self, tmp_path):
+        """Test that the full-input hash and length are stored with the request."""
+        queue = ApprovalQueue(str(tmp_path / "approvals.db"))
+        request_id = queue.add_request(
+            session_id="session-id",
+            tool_name="Write",
+            tool_input={"content": "x"},
+            tool_input_hash="a1b2c3d4e5f6a7b8",
+            tool_input_length=20480
+        )
+
+        request = queue.get_request(request_id)
+        assert (request.tool_input_hash, request.tool_input_length) == ("a1b2c3d4e5f6a7b8", 20480)
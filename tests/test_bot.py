@@ -0,0 +1,121 @@
+"""
+Tests for the Telegram bot's per-chat update queues.
+"""
+
+import asyncio
+import pytest
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+from telegram.ext import ApplicationHandlerStop
+from src import bot as bot_module
+from src.bot import CCReleaseMonitorBot
+from src.config import Config
+
+
+class FakeApplication:
+    """Records the updates a chat worker hands back for processing."""
+
+    def __init__(self, delays):
+        """
+        Initialize the fake application.
+
+        Args:
+            delays: Seconds each update's handling takes, by update ID
+        """
+        self.update_queue = asyncio.Queue()
+        self.delays = delays
+        self.events = []
+
+    async def process_update(self, update):
+        """Handle an update, logging when it starts and finishes."""
+        self.events.append(("start", update.update_id))
+        await asyncio.sleep(self.delays.get(update.update_id, 0))
+        self.events.append(("end", update.update_id))
+
+
+def _update(update_id, chat_id):
+    """Build a minimal update for a chat."""
+    return SimpleNamespace(
+        update_id=update_id,
+        effective_chat=SimpleNamespace(id=chat_id),
+        effective_message=None,
+    )
+
+
+class TestChatWorkers:
+    """Test cases for per-chat update dispatch."""
+
+    @pytest.fixture
+    def make_bot(self, monkeypatch):
+        """Return a factory for a bot whose idle workers exit quickly."""
+        monkeypatch.setattr(bot_module, "CHAT_WORKER_IDLE_SECONDS", 0.05)
+
+        def make(delays=None):
+            with patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': 'test_token'}):
+                bot = CCReleaseMonitorBot(Config())
+            bot.application = FakeApplication(delays or {})
+            return bot
+        return make
+
+    async def _dispatch(self, bot, update):
+        """Hand an update to the bot's dispatcher."""
+        with pytest.raises(ApplicationHandlerStop):
+            await bot._dispatch_update(update, None)
+
+    def test_updates_for_one_chat_run_in_order(self, make_bot):
+        """Test that a chat's updates are handled one at a time, in arrival order."""
+        async def scenario():
+            bot = make_bot({1: 0.05})
+            for update_id in (1, 2, 3):
+                await self._dispatch(bot, _update(update_id, chat_id=10))
+            await asyncio.sleep(0.2)
+            return bot.application.events
+
+        assert asyncio.run(scenario()) == [
+            ("start", 1), ("end", 1), ("start", 2), ("end", 2), ("start", 3), ("end", 3)
+        ]
+
+    def test_chats_run_concurrently(self, make_bot):
+        """Test that a slow update in one chat doesn't hold up another chat."""
+        async def scenario():
+            bot = make_bot({1: 0.1})
+            await self._dispatch(bot, _update(1, chat_id=10))
+            await self._dispatch(bot, _update(2, chat_id=20))
+            await asyncio.sleep(0.2)
+            return bot.application.events
+
+        events = asyncio.run(scenario())
+        assert events.index(("end", 2)) < events.index(("end", 1))
+
+    def test_idle_worker_exits(self, make_bot):
+        """Test that an idle chat's worker exits and a later update starts a new one."""
+        async def scenario():
+            bot = make_bot()
+            await self._dispatch(bot, _update(1, chat_id=10))
+            await asyncio.sleep(0.15)
+            assert not bot._chat_queues
+            assert not bot._chat_workers
+
+            await self._dispatch(bot, _update(2, chat_id=10))
+            await asyncio.sleep(0.01)
+            assert ("end", 2) in bot.application.events
+            await asyncio.sleep(0.15)
+            assert not bot._chat_workers
+
+        asyncio.run(scenario())
+
+    def test_idle_worker_does_not_hold_a_slot(self, make_bot, monkeypatch):
+        """Test that a chat waiting for updates doesn't delay another chat."""
+        monkeypatch.setattr(bot_module, "CHAT_WORKER_IDLE_SECONDS", 1.0)
+        monkeypatch.setattr(bot_module, "MAX_CHAT_WORKERS", 1)
+
+        async def scenario():
+            bot = make_bot()
+            await self._dispatch(bot, _update(1, chat_id=10))
+            await asyncio.sleep(0.05)
+            await self._dispatch(bot, _update(2, chat_id=20))
+            await asyncio.sleep(0.05)
+            return bot.application.events
+
+        assert ("end", 2) in asyncio.run(scenario())
@@ -30,6 +30,7 @@ class TestConfig:
             assert config.log_level == 'INFO'
             assert config.check_interval_minutes == 30
             assert config.max_retries == 3
+            assert config.max_concurrent_requests == 4
             assert config.retry_delay_seconds == 60
             assert config.enable_notifications is True
             assert config.quiet_hours_start == 22
@@ -44,6 +45,7 @@ class TestConfig:
             'LOG_LEVEL': 'DEBUG',
             'CHECK_INTERVAL_MINUTES': '15',
             'MAX_RETRIES': '5',
+            'MAX_CONCURRENT_REQUESTS': '2',
             'ENABLE_NOTIFICATIONS': 'false',
         }
         
@@ -52,6 +54,7 @@ class TestConfig:
             assert config.log_level == 'DEBUG'
             assert config.check_interval_minutes == 15
             assert config.max_retries == 5
+            assert config.max_concurrent_requests == 2
             assert config.enable_notifications is False
     
     def test_invalid_numeric_values(self):
@@ -60,6 +63,7 @@ class TestConfig:
             'TELEGRAM_BOT_TOKEN': 'test_token',
             'CHECK_INTERVAL_MINUTES': 'invalid',
             'MAX_RETRIES': 'not_a_number',
+            'MAX_CONCURRENT_REQUESTS': '0',
         }
         
         with patch.dict(os.environ, env_vars):
@@ -67,6 +71,7 @@ class TestConfig:
             # Should fall back to defaults
             assert config.check_interval_minutes == 30
             assert config.max_retries == 3
+            assert config.max_concurrent_requests == 4
     
     def test_quiet_hours_validation(self):
         """Test quiet hours validation."""
@@ -80,4 +85,32 @@ class TestConfig:
             config = Config()
             # Should fall back to defaults
             assert config.quiet_hours_start == 22
-            assert config.quiet_hours_end == 8
\ No newline at end of file
+            assert config.quiet_hours_end == 8
+    
+    def test_webhook_disabled_by_default(self):
+        """Test that polling is used when no webhook URL is set."""
+        with patch.dict(os.environ, {'TELEGRAM_BOT_TOKEN': 'test_token'}):
+            os.environ.pop('WEBHOOK_URL', None)
+            config = Config()
+            assert config.webhook_url is None
+            assert config.use_webhook is False
+            assert config.webhook_port == 8443
+            assert config.webhook_path == 'telegram'
+    
+    def test_webhook_values(self):
+        """Test webhook configuration values."""
+        env_vars = {
+            'TELEGRAM_BOT_TOKEN': 'test_token',
+            'WEBHOOK_URL': 'https://bot.example.com/',
+            'WEBHOOK_PORT': '70000',  # Invalid port
+            'WEBHOOK_PATH': '/hook/',
+            'WEBHOOK_SECRET_TOKEN': 'secret',
+        }
+        
+        with patch.dict(os.environ, env_vars):
+            config = Config()
+            assert config.use_webhook is True
+            assert config.webhook_url == 'https://bot.example.com'
+            assert config.webhook_port == 8443
+            assert config.webhook_path == 'hook'
+            assert config.webhook_secret_token == 'secret'
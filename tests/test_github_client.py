@@ -0,0 +1,107 @@
+"""
+Tests for GitHub API client module.
+"""
+
+import pytest
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from src.config import Config
+from src.github_client import ETAG_CACHE_SIZE, RATE_LIMIT_BURST, GitHubClient
+
+
+def _response(status_code, body=b"", headers=None):
+    """Build a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = body
+    response.text = body.decode("utf-8")
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Create a GitHubClient that stores its files under tmp_path."""
+    env = {'TELEGRAM_BOT_TOKEN': 'test_token', 'DATA_DIRECTORY': str(tmp_path)}
+    with patch.dict(os.environ, env):
+        client = GitHubClient(Config())
+    client.min_request_interval = 0
+    yield client
+    client.close()
+
+
+class TestConnectionPooling:
+    """Test cases for the session's connection pools."""
+
+    def test_api_and_raw_hosts_keep_their_pools(self, client):
+        """Test that using the raw content host doesn't evict the API host's pool."""
+        pools = client.session.get_adapter(client.base_url).poolmanager
+        api_pool = pools.connection_from_url(client.base_url)
+        pools.connection_from_url(client.raw_base_url)
+
+        assert pools.connection_from_url(client.base_url) is api_pool
+
+
+class TestConditionalRequests:
+    """Test cases for the in-memory ETag cache."""
+
+    def test_not_modified_returns_cached_body(self, client):
+        """Test that the ETag is sent back and a 304 reuses the cached body."""
+        url = "https://api.github.com/repos/o/r/releases/latest"
+        client.session.get = MagicMock(side_effect=[
+            _response(200, b'{"tag_name": "v1.0.0"}', {"ETag": '"abc"'}),
+            _response(304),
+        ])
+
+        assert client._make_request(url) == {"tag_name": "v1.0.0"}
+        assert client._make_request(url) == {"tag_name": "v1.0.0"}
+
+        first, second = client.session.get.call_args_list
+        assert first.kwargs["headers"] is None
+        assert second.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_cache_evicts_least_recently_used(self, client):
+        """Test that the cache holds at most ETAG_CACHE_SIZE entries, dropping the oldest."""
+        for i in range(ETAG_CACHE_SIZE + 1):
+            client._set_etag((f"url-{i}", ()), f'"{i}"', i)
+            if i == 0:
+                continue
+            # Keep the first entry in use so the second one is evicted instead
+            client._get_etag(("url-0", ()))
+
+        assert len(client._etag_cache) == ETAG_CACHE_SIZE
+        assert client._get_etag(("url-0", ())) == ('"0"', 0)
+        assert client._get_etag(("url-1", ())) is None
+
+
+class TestTokenBucket:
+    """Test cases for the request token bucket."""
+
+    def _set_limits(self, client, remaining, reset_in):
+        """Apply rate limit headers reporting remaining requests until reset_in seconds."""
+        client.rate_limit_remaining = remaining
+        client.rate_limit_reset_time = datetime.now(timezone.utc) + timedelta(seconds=reset_in)
+        client._update_token_bucket()
+
+    def test_tokens_clamped_to_remaining_budget(self, client):
+        """Test that the bucket never holds more tokens than GitHub has left."""
+        self._set_limits(client, remaining=2, reset_in=3600)
+
+        assert client._tokens == 2
+        client._tokens -= 2
+        assert not client.has_request_budget()
+
+    def test_refill_follows_reported_rate(self, client):
+        """Test that tokens are earned at remaining/reset_in per second, up to the burst."""
+        self._set_limits(client, remaining=100, reset_in=100)
+        assert client._refill_rate == pytest.approx(1.0, rel=0.05)
+
+        client._tokens = 0
+        client._tokens_updated -= 3
+        assert client.has_request_budget()
+        assert client._tokens == pytest.approx(3, abs=0.2)
+
+        client._tokens_updated -= 1000
+        client.has_request_budget()
+        assert client._tokens == RATE_LIMIT_BURST
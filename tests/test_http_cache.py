@@ -0,0 +1,68 @@
+"""
+Tests for the persistent HTTP response cache.
+"""
+
+import sqlite3
+import time
+from src.http_cache import SqliteHttpCache
+
+
+class TestSqliteHttpCache:
+    """Test cases for SqliteHttpCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored response is returned with its ETag."""
+        cache = SqliteHttpCache(tmp_path / "cache.sqlite")
+        cache.set("https://api.github.com/a", '"etag-1"', {"tag_name": "v1.0.0", "assets": []})
+
+        assert cache.get("https://api.github.com/a") == ('"etag-1"', {"tag_name": "v1.0.0", "assets": []})
+        assert cache.get("https://api.github.com/missing") is None
+        cache.close()
+
+    def test_set_replaces_entry(self, tmp_path):
+        """Test that storing a URL again replaces its ETag and body."""
+        cache = SqliteHttpCache(tmp_path / "cache.sqlite")
+        cache.set("https://api.github.com/a", '"etag-1"', [1])
+        cache.set("https://api.github.com/a", '"etag-2"', [2])
+
+        assert cache.get("https://api.github.com/a") == ('"etag-2"', [2])
+        cache.close()
+
+    def test_entries_survive_reopen(self, tmp_path):
+        """Test that responses persist across cache instances."""
+        cache = SqliteHttpCache(tmp_path / "cache.sqlite")
+        cache.set("https://api.github.com/a", '"etag-1"', {"sha": "abc"})
+        cache.close()
+
+        reopened = SqliteHttpCache(tmp_path / "cache.sqlite")
+        assert reopened.get("https://api.github.com/a") == ('"etag-1"', {"sha": "abc"})
+        reopened.close()
+
+    def test_oldest_entries_evicted_over_cap(self, tmp_path):
+        """Test that only the most recently stored max_entries responses are kept."""
+        cache = SqliteHttpCache(tmp_path / "cache.sqlite", max_entries=3)
+        for i in range(5):
+            cache.set(f"https://api.github.com/{i}", f'"etag-{i}"', i)
+
+        assert cache.get("https://api.github.com/0") is None
+        assert cache.get("https://api.github.com/1") is None
+        assert [cache.get(f"https://api.github.com/{i}")[1] for i in range(2, 5)] == [2, 3, 4]
+        cache.close()
+
+    def test_stale_entries_removed_on_open(self, tmp_path):
+        """Test that responses older than max_age are dropped when the cache is opened."""
+        path = tmp_path / "cache.sqlite"
+        cache = SqliteHttpCache(path)
+        cache.set("https://api.github.com/old", '"old"', 1)
+        cache.set("https://api.github.com/new", '"new"', 2)
+        cache.close()
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "UPDATE http_cache SET fetched_at = ? WHERE url = ?",
+                (int(time.time()) - 3600, "https://api.github.com/old")
+            )
+
+        reopened = SqliteHttpCache(path, max_age=60)
+        assert reopened.get("https://api.github.com/old") is None
+        assert reopened.get("https://api.github.com/new") == ('"new"', 2)
+        reopened.close()
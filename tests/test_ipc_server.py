@@ -0,0 +1,106 @@
+"""
+Tests for the IPC server module.
+"""
+
+import asyncio
+import os
+import sqlite3
+import stat
+import pytest
+from src import ipc_server
+from src.models.approval import ApprovalQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    """Serve requests from an approval queue stored under tmp_path."""
+    queue = ApprovalQueue(str(tmp_path / "approvals.db"))
+    monkeypatch.setattr(ipc_server, "approval_queue", queue)
+    return queue
+
+
+def _add_request(queue):
+    """Add a pending request and return its ID."""
+    return queue.add_request(session_id="session", tool_name="Bash", tool_input={"command": "rm x"})
+
+
+class TestLongPoll:
+    """Test cases for waiting on a pending request's decision."""
+
+    def test_decision_wakes_waiter(self, queue):
+        """Test that a submitted decision ends the wait early and drops the event."""
+        request_id = _add_request(queue)
+
+        async def scenario():
+            waiter = asyncio.create_task(ipc_server._wait_for_decision(request_id, wait=10))
+            await asyncio.sleep(0.05)
+            assert request_id in ipc_server.decision_events
+            await ipc_server.submit_approval_response(
+                ipc_server.ApprovalResponseModel(request_id=request_id, decision="approve")
+            )
+            return await asyncio.wait_for(waiter, 1)
+
+        request = asyncio.run(scenario())
+        assert request.status == "approved"
+        assert request_id not in ipc_server.decision_events
+        assert request_id not in ipc_server.decision_waiters
+
+    def test_timeout_endpoint_wakes_waiter(self, queue):
+        """Test that timing out a request wakes hooks waiting on it."""
+        request_id = _add_request(queue)
+        with sqlite3.connect(queue.db_path) as conn:
+            conn.execute(
+                "UPDATE approval_requests SET timestamp = '2000-01-01T00:00:00' WHERE request_id = ?",
+                (request_id,)
+            )
+
+        async def scenario():
+            waiter = asyncio.create_task(ipc_server._wait_for_decision(request_id, wait=10))
+            await asyncio.sleep(0.05)
+            result = await ipc_server.timeout_old_requests(seconds=60)
+            assert result["timed_out"] == 1
+            return await asyncio.wait_for(waiter, 1)
+
+        request = asyncio.run(scenario())
+        assert request.status == "timeout"
+        assert request_id not in ipc_server.decision_events
+
+    def test_expired_waits_drop_event(self, queue):
+        """Test that the event is kept while any waiter remains and dropped after the last."""
+        request_id = _add_request(queue)
+
+        async def scenario():
+            long_wait = asyncio.create_task(ipc_server._wait_for_decision(request_id, wait=0.3))
+            short = await ipc_server._wait_for_decision(request_id, wait=0.05)
+            assert short.status == "pending"
+            assert ipc_server.decision_waiters[request_id] == 1
+            assert request_id in ipc_server.decision_events
+            await long_wait
+
+        asyncio.run(scenario())
+        assert request_id not in ipc_server.decision_events
+        assert request_id not in ipc_server.decision_waiters
+
+
+class TestSocketDirectory:
+    """Test cases for the private Unix socket directory."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path, monkeypatch):
+        """Use tmp_path as the temp dir, without a runtime dir set."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setattr(ipc_server.tempfile, "gettempdir", lambda: str(tmp_path))
+        return tmp_path
+
+    def test_creates_owner_only_directory(self, temp_dir):
+        """Test that the per-user directory is created with mode 0700."""
+        path = ipc_server._socket_dir()
+        assert path == str(temp_dir / f"cc-approval-{os.getuid()}")
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+
+    def test_refuses_shared_directory(self, temp_dir):
+        """Test that a directory other users can write to is not used."""
+        path = temp_dir / f"cc-approval-{os.getuid()}"
+        path.mkdir()
+        path.chmod(0o777)
+        assert ipc_server._socket_dir() is None
@@ -0,0 +1,72 @@
+"""
+Tests for release parser module.
+"""
+
+import pytest
+from src.release_parser import CHANGELOG_HEADER_RE, extract_changelog_entries
+
+
+CHANGELOG = """# Changelog
+
+## v2
+
+- Renamed the CLI
+
+### 1.2.3
+- Fixed crash on start
+
+- Faster startup
+
+# Version 1.2.2
+- Initial release
+"""
+
+
+class TestChangelogHeaders:
+    """Test cases for the shared changelog version header pattern."""
+
+    @pytest.mark.parametrize("line", [
+        "# 1.0.0", "## v2", "### 1.2.3", "## [1.2.3] - 2024-01-01", "# Version 2", "  ## V3.0",
+    ])
+    def test_version_headers_match(self, line):
+        """Test that '#', '##' and '###' headers with vX or X.Y.Z titles are found."""
+        assert CHANGELOG_HEADER_RE.match(line)
+
+    @pytest.mark.parametrize("line", [
+        "# Changelog", "### Fixed", "#### 1.2.3", "- v1.2.3", "Released 1.2.3",
+    ])
+    def test_other_lines_do_not_match(self, line):
+        """Test that titles without a version and deeper headers are not headers."""
+        assert CHANGELOG_HEADER_RE.match(line) is None
+
+    def test_finds_headers_in_full_text(self):
+        """Test that a multi-line scan finds each header line in order."""
+        headers = [match.group().strip() for match in CHANGELOG_HEADER_RE.finditer(CHANGELOG)]
+        assert headers == ["## v2", "### 1.2.3", "# Version 1.2.2"]
+
+
+class TestExtractChangelogEntries:
+    """Test cases for extract_changelog_entries."""
+
+    def test_extracts_sections_newest_first(self):
+        """Test that each section runs from its header to the next one."""
+        entries = extract_changelog_entries(CHANGELOG, max_entries=3)
+        assert entries == [
+            "## v2\n\n- Renamed the CLI",
+            "### 1.2.3\n- Fixed crash on start\n\n- Faster startup",
+            "# Version 1.2.2\n- Initial release",
+        ]
+
+    def test_skip_blank_lines(self):
+        """Test that blank lines inside sections can be dropped."""
+        entries = extract_changelog_entries(CHANGELOG, max_entries=2, skip_blank_lines=True)
+        assert entries == [
+            "## v2\n- Renamed the CLI",
+            "### 1.2.3\n- Fixed crash on start\n- Faster startup",
+        ]
+
+    def test_char_limit_keeps_whole_lines(self):
+        """Test that the length limit drops whole lines instead of cutting one."""
+        content = "## 1.0.0\n- " + "a" * 20 + "\n- " + "b" * 20 + "\n"
+        entries = extract_changelog_entries(content, entry_char_limit=35)
+        assert entries == ["## 1.0.0\n- " + "a" * 20]
@@ -0,0 +1,106 @@
+"""
+Tests for version management module.
+"""
+
+import pytest
+import os
+from unittest.mock import patch
+from src.config import Config
+from src.version_manager import (
+    HISTORY_LIMIT, SemanticVersion, VersionError, VersionManager, _changelog_preview
+)
+
+
+class TestSemanticVersion:
+    """Test cases for SemanticVersion class."""
+
+    def test_parse_full_version(self):
+        """Test parsing a version with prerelease and build metadata."""
+        version = SemanticVersion("v1.2.3-beta.1+build.5")
+        assert (version.major, version.minor, version.patch) == (1, 2, 3)
+        assert version.prerelease == "beta.1"
+        assert version.build == "build.5"
+
+    def test_parse_short_version(self):
+        """Test parsing a non-standard version with missing components."""
+        version = SemanticVersion("2.1")
+        assert (version.major, version.minor, version.patch) == (2, 1, 0)
+        assert version.is_stable()
+
+    def test_invalid_version(self):
+        """Test that invalid versions raise VersionError."""
+        with pytest.raises(VersionError):
+            SemanticVersion("latest")
+
+    def test_ordering(self):
+        """Test version comparison including prereleases."""
+        assert SemanticVersion("1.0.44") > SemanticVersion("1.0.43")
+        assert SemanticVersion("1.0.0-rc.1") < SemanticVersion("1.0.0")
+        assert SemanticVersion("v1.0.0") == SemanticVersion("1.0.0")
+
+    def test_prerelease_precedence(self):
+        """Test prerelease ordering by identifier, numbers compared numerically."""
+        ordered = [
+            "1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-alpha.9", "1.0.0-alpha.10",
+            "1.0.0-alpha.beta", "1.0.0-beta", "1.0.0-beta.2", "1.0.0-beta.11",
+            "1.0.0-rc.1", "1.0.0",
+        ]
+        versions = [SemanticVersion(v) for v in ordered]
+        assert sorted(reversed(versions)) == versions
+
+    def test_parse_reuses_instances(self):
+        """Test that parse returns the cached instance for a repeated string."""
+        assert SemanticVersion.parse("1.2.3") is SemanticVersion.parse("1.2.3")
+        with pytest.raises(VersionError):
+            SemanticVersion.parse("latest")
+
+
+class TestChangelogPreview:
+    """Test cases for the changelog history preview."""
+
+    def test_preview_stops_at_third_version_header(self):
+        """Test that the preview ends at the third version header."""
+        content = (
+            "# Changelog\n\n## 1.0.3\n\n- Fix crash  \n\n"
+            "## 1.0.2\n- Faster startup\n## 1.0.1\n- Initial\n## 1.0.0\n"
+        )
+        preview, entries = _changelog_preview(content)
+        assert entries == 3
+        assert preview == "# Changelog\n## 1.0.3\n- Fix crash\n## 1.0.2\n- Faster startup\n## 1.0.1"
+
+    def test_preview_limited_to_first_lines(self):
+        """Test that only the first 50 lines are scanned."""
+        content = "\n".join(f"- item {i}" for i in range(80)) + "\n## 2.0.0"
+        preview, entries = _changelog_preview(content)
+        assert entries == 0
+        assert preview.splitlines()[-1] == "- item 49"
+
+
+class TestVersionManager:
+    """Test cases for VersionManager class."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create a VersionManager that stores its files under tmp_path."""
+        env = {'TELEGRAM_BOT_TOKEN': 'test_token', 'DATA_DIRECTORY': str(tmp_path)}
+        with patch.dict(os.environ, env):
+            return VersionManager(Config())
+
+    def test_statistics_follow_history_window(self, manager):
+        """Test that entry counters stay in step as old entries are evicted."""
+        for i in range(HISTORY_LIMIT + 20):
+            manager.update_commit({"sha": f"{i:040x}"})
+            manager.update_changelog("# Changelog\n" + "x" * (i // 10))
+
+        stats = manager.get_all_statistics()
+        history = manager.get_version_history()
+        commits = [entry for entry in history if entry.get("type") == "commit"]
+        changelogs = [entry for entry in history if entry.get("type") == "changelog"]
+
+        assert len(history) == HISTORY_LIMIT
+        assert stats["commit"]["total_commit_entries"] == len(commits)
+        assert stats["commit"]["new_commits_detected"] == sum(e["is_new"] for e in commits)
+        assert stats["changelog"]["total_changelog_entries"] == len(changelogs)
+        assert stats["changelog"]["new_changelog_updates_detected"] == sum(e["is_new"] for e in changelogs)
+        assert stats["version"]["new_versions_detected"] == sum(e["is_new"] for e in history)
+        assert manager.get_commit_statistics()["total_commit_entries"] == len(commits)